@@ -5,3 +5,6 @@ class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.accounts"
     verbose_name = "Accounts"
+
+    def ready(self):
+        from apps.accounts import signals  # noqa: F401
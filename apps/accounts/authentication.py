@@ -0,0 +1,47 @@
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.accounts.authz import CLAIM_ROLE, CLAIM_VERSION, get_authz_version
+
+User = get_user_model()
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    액세스 토큰의 권한 클레임으로 사용자를 구성하는 JWT 인증.
+
+    - 사용자 행을 읽지 않고 id / role만 채운 CustomUser 인스턴스를 반환
+      (나머지 필드는 deferred — 접근 시 지연 로드)
+    - 토큰의 authz_ver가 현재 권한 버전과 다르면 InvalidToken (401)
+      → 프론트엔드는 토큰 갱신 후 재시도
+    - 권한 클레임이 없는 이전 토큰은 기존 JWTAuthentication 동작으로 처리
+
+    apps.core.permissions의 헬퍼는 provides_authz_claims가 True인 인증에서만
+    토큰 클레임을 신뢰한다.
+    """
+
+    provides_authz_claims = True
+
+    def get_user(self, validated_token):
+        if CLAIM_VERSION not in validated_token:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("토큰에 사용자 식별 정보가 없습니다.")
+
+        version = get_authz_version(user_id)
+        if version is None:
+            raise AuthenticationFailed("사용자를 찾을 수 없습니다.", code="user_not_found")
+        if version != validated_token[CLAIM_VERSION]:
+            raise InvalidToken("권한 정보가 변경되었습니다. 토큰을 갱신해 주세요.")
+
+        return User.from_db(
+            DEFAULT_DB_ALIAS,
+            ["id", "role"],
+            [user_id, validated_token[CLAIM_ROLE]],
+        )
@@ -0,0 +1,140 @@
+"""
+사용자 권한 정보(전역 역할 + 동아리별 멤버 역할)와 권한 버전 관리.
+
+권한 버전(CustomUser.authz_version)은 멤버십 또는 역할이 바뀔 때마다 1씩 증가한다.
+액세스 토큰 클레임에 담긴 버전이 현재 버전과 다르면 오래된 권한으로 보고 거부한다.
+
+현재 버전은 캐시에 보관하므로 대부분의 요청은 DB를 조회하지 않는다.
+
+토큰 클레임을 쓰지 않는 경우를 위해 사용자별 (역할, {동아리 ID: 멤버 역할})도
+"authz:{user_id}:{version}" 키로 캐시한다. 버전이 오르면 키 자체가 바뀌므로
+이전 항목은 읽히지 않고 TTL로 만료된다.
+"""
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from apps.clubs.models import ClubMember
+from apps.core.metrics import get_counter
+
+User = get_user_model()
+
+# 액세스 토큰 클레임 키
+CLAIM_ROLE = "role"
+CLAIM_CLUBS = "clubs"
+CLAIM_VERSION = "authz_ver"
+
+VERSION_CACHE_KEY = "authz:ver:{user_id}"
+AUTHZ_CACHE_KEY = "authz:{user_id}:{version}"
+
+authz_cache_counter = get_counter("authz")
+
+# batch_authz_bumps() 블록 안에서 모아 둔 사용자 ID (스레드별)
+_pending_bumps = threading.local()
+
+
+def load_club_roles(user_id):
+    """{동아리 ID(str): 멤버 역할} — JSON 클레임 호환을 위해 키는 문자열."""
+    rows = ClubMember.objects.filter(user_id=user_id).values_list("club_id", "role")
+    return {str(club_id): role for club_id, role in rows}
+
+
+def build_authz_claims(user):
+    """토큰에 실을 권한 클레임 생성 (멤버십 조회 1회)."""
+    return {
+        CLAIM_ROLE: user.role,
+        CLAIM_CLUBS: load_club_roles(user.pk),
+        CLAIM_VERSION: user.authz_version,
+    }
+
+
+def add_authz_claims(token, user):
+    for claim, value in build_authz_claims(user).items():
+        token[claim] = value
+    return token
+
+
+def get_authz_version(user_id):
+    """현재 권한 버전 (캐시 우선). 사용자가 없으면 None."""
+    key = VERSION_CACHE_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            User.objects.filter(pk=user_id, is_active=True)
+            .values_list("authz_version", flat=True)
+            .first()
+        )
+        if version is not None:
+            cache.set(key, version, settings.AUTHZ_VERSION_CACHE_TTL)
+    return version
+
+
+def get_cached_authz(user_id):
+    """
+    (전역 역할, {동아리 ID(str): 멤버 역할}) — 현재 권한 버전 키로 캐시.
+
+    사용자가 없거나 비활성이면 None.
+    """
+    version = get_authz_version(user_id)
+    if version is None:
+        return None
+
+    key = AUTHZ_CACHE_KEY.format(user_id=user_id, version=version)
+    entry = cache.get(key)
+    if entry is not None:
+        authz_cache_counter.hit()
+        return entry
+
+    authz_cache_counter.miss()
+    role = User.objects.filter(pk=user_id).values_list("role", flat=True).first()
+    if role is None:
+        return None
+    entry = (role, load_club_roles(user_id))
+    cache.set(key, entry, settings.AUTHZ_CACHE_TTL)
+    return entry
+
+
+def bump_authz_version(*user_ids):
+    """
+    권한 버전 증가 — 발급된 토큰 클레임과 캐시된 권한 정보를 무효화.
+
+    커밋 전에 다른 요청이 이전 버전을 다시 캐시할 수 있으므로
+    커밋 직후에도 한 번 더 캐시를 지운다.
+    """
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if not user_ids:
+        return
+    pending = getattr(_pending_bumps, "user_ids", None)
+    if pending is not None:
+        pending.update(user_ids)
+        return
+
+    User.objects.filter(pk__in=user_ids).update(authz_version=F("authz_version") + 1)
+
+    keys = [VERSION_CACHE_KEY.format(user_id=user_id) for user_id in user_ids]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+@contextmanager
+def batch_authz_bumps():
+    """
+    블록 안의 bump_authz_version 호출(멤버십 시그널 포함)을 모아 끝날 때 UPDATE 한 번으로 실행.
+
+    일괄 멤버 추가/삭제처럼 여러 사용자의 권한이 한꺼번에 바뀔 때 사용.
+    """
+    if getattr(_pending_bumps, "user_ids", None) is not None:
+        yield  # 이미 바깥 블록에서 모으는 중
+        return
+    _pending_bumps.user_ids = set()
+    try:
+        yield
+        user_ids = _pending_bumps.user_ids
+    finally:
+        _pending_bumps.user_ids = None
+    bump_authz_version(*sorted(user_ids))
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="authz_version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="권한 버전"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:12
+
+from django.db import migrations, models
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 인덱스 생성은 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0002_add_authz_version"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        apps.core.operations.AddIndexConcurrently(
+            model_name="customuser",
+            index=models.Index(
+                fields=["name"],
+                name="user_name_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
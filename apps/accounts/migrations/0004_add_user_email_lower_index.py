@@ -0,0 +1,31 @@
+from django.db import migrations
+
+INDEX_NAME = "user_email_lower_prefix_idx"
+
+
+def forwards(apps, schema_editor):
+    # PostgreSQL 전용 — 함수 인덱스 + 패턴 opclass로 LOWER(email) LIKE 'kim%'를 처리
+    # (SQLite의 LIKE는 ASCII 대소문자를 구분하지 않고 함수 인덱스로 접두사 검색을 하지 않음)
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME}"
+            " ON accounts_customuser (LOWER(email) varchar_pattern_ops)"
+        )
+
+
+def backwards(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 인덱스 생성은 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0003_add_user_name_prefix_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
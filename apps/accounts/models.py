@@ -24,6 +24,8 @@ class CustomUser(AbstractUser):
         choices=Role.choices,
         default=Role.STUDENT,
     )
+    # 역할/멤버십 변경 시 증가 — 토큰 클레임·권한 캐시 무효화 기준 (apps.accounts.authz)
+    authz_version = models.PositiveIntegerField("권한 버전", default=0, editable=False)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["name", "student_id"]
@@ -34,6 +36,16 @@ class CustomUser(AbstractUser):
         verbose_name = "사용자"
         verbose_name_plural = "사용자"
         ordering = ["-date_joined"]
+        # 사용자 검색(apps.accounts.search) 이름 접두사 조회 — PostgreSQL에서 LIKE '김%'용
+        # (student_id는 unique 컬럼이라 *_like 인덱스가 이미 있고, 이메일용 LOWER(email)
+        #  함수 인덱스는 PostgreSQL 전용이라 마이그레이션 0004에서 직접 생성)
+        indexes = [
+            models.Index(
+                fields=["name"],
+                name="user_name_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.email})"
@@ -0,0 +1,72 @@
+"""
+멤버 추가용 사용자 검색 (자동완성).
+
+검색어 형태로 조회할 컬럼을 하나로 정해 접두사(LIKE '검색어%') 검색만 한다.
+- 숫자만: 학번 (student_id)
+- '@' 포함: 이메일 (대소문자 무시 — LOWER(email)과 비교)
+- 그 외: 이름 또는 이메일
+
+PostgreSQL에서 각 컬럼은 varchar_pattern_ops 인덱스로 접두사 검색을 처리한다.
+(student_id는 unique 컬럼이라 Django가 만드는 *_like 인덱스, name은 user_name_prefix_idx,
+ email은 normalize_email이 도메인만 소문자로 바꾸므로 LOWER(email) 함수 인덱스인
+ user_email_lower_prefix_idx)
+
+같은 검색어는 USER_SEARCH_CACHE_TTL 동안 캐시된 결과를 돌려준다
+(입력 중 같은 접두사를 반복 조회하는 경우가 많음). 캐시 만료 전까지는
+새 가입자/정보 변경이 반영되지 않을 수 있다.
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.db.models.lookups import StartsWith
+
+from apps.core.metrics import get_counter
+
+User = get_user_model()
+
+SEARCH_CACHE_KEY = "user-search:{limit}:{digest}"
+
+user_search_counter = get_counter("userSearch")
+
+
+def search_filter(q):
+    """검색어 → (조건, 정렬 기준 컬럼)."""
+    if q.isdigit():
+        return Q(student_id__startswith=q), "student_id"
+    email = Q(StartsWith(Lower("email"), q.lower()))
+    if "@" in q:
+        return email, "email"
+    return Q(name__startswith=q) | email, "name"
+
+
+def search_users(q, limit):
+    """
+    접두사 검색 결과 (최대 limit명, 응답용 dict 목록).
+
+    Returns:
+        [{"id", "name", "studentId", "email"}, ...]
+    """
+    digest = hashlib.sha1(q.encode()).hexdigest()
+    key = SEARCH_CACHE_KEY.format(limit=limit, digest=digest)
+    results = cache.get(key)
+    if results is not None:
+        user_search_counter.hit()
+        return results
+    user_search_counter.miss()
+
+    condition, order_field = search_filter(q)
+    rows = (
+        User.objects.filter(condition, is_active=True)
+        .order_by(order_field, "id")
+        .values_list("id", "name", "student_id", "email")[:limit]
+    )
+    results = [
+        {"id": pk, "name": name, "studentId": student_id, "email": email}
+        for pk, name, student_id, email in rows
+    ]
+    cache.set(key, results, settings.USER_SEARCH_CACHE_TTL)
+    return results
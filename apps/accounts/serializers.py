@@ -1,8 +1,12 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken, TokenError
 
+from apps.accounts.authz import add_authz_claims
+
 User = get_user_model()
 
 
@@ -79,8 +83,13 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     - USERNAME_FIELD가 email이므로 { email, password } 입력
     - 응답을 프론트엔드 LoginResponse에 맞춤:
       { accessToken, refreshToken, user }
+    - 토큰에 권한 클레임(role, clubs, authz_ver) 포함 — apps.accounts.authz 참고
     """
 
+    @classmethod
+    def get_token(cls, user):
+        return add_authz_claims(super().get_token(user), user)
+
     def validate(self, attrs):
         # 부모 클래스가 인증 + 토큰 생성 처리
         data = super().validate(attrs)
@@ -99,6 +108,9 @@ class CustomTokenRefreshSerializer(serializers.Serializer):
     """
     프론트엔드가 { refreshToken } 으로 요청하고
     { accessToken } 을 응답받는 구조.
+
+    새 액세스 토큰의 권한 클레임은 리프레시 토큰에서 복사하지 않고
+    현재 역할/멤버십으로 다시 생성한다.
     """
 
     refreshToken = serializers.CharField()
@@ -109,8 +121,15 @@ class CustomTokenRefreshSerializer(serializers.Serializer):
         except TokenError:
             raise serializers.ValidationError("유효하지 않거나 만료된 리프레시 토큰입니다.")
 
+        user = User.objects.filter(
+            pk=refresh.get(api_settings.USER_ID_CLAIM), is_active=True
+        ).first()
+        if user is None:
+            raise serializers.ValidationError("유효하지 않거나 만료된 리프레시 토큰입니다.")
+
+        access = add_authz_claims(refresh.access_token, user)
         result = {
-            "accessToken": str(refresh.access_token),
+            "accessToken": str(access),
         }
 
         # ROTATE_REFRESH_TOKENS가 True이면 새 리프레시 토큰도 반환
@@ -122,3 +141,28 @@ class CustomTokenRefreshSerializer(serializers.Serializer):
             result["refreshToken"] = str(refresh)
 
         return result
+
+
+# ──────────────────────────────────────────────
+# 사용자 검색 (멤버 추가용 자동완성)
+# ──────────────────────────────────────────────
+class UserSearchQuerySerializer(serializers.Serializer):
+    """
+    - q: 학번 / 이름 / 이메일 접두사 (필수)
+    - limit: 최대 결과 수 (기본 10, 최대 USER_SEARCH_MAX_LIMIT)
+    """
+
+    q = serializers.CharField(max_length=50)
+    limit = serializers.IntegerField(required=False, min_value=1, default=10)
+
+    def validate_limit(self, value):
+        return min(value, settings.USER_SEARCH_MAX_LIMIT)
+
+
+class UserSearchResultSerializer(serializers.Serializer):
+    """{ id, name, studentId, email } — AddMemberSerializer.userId에 id를 사용."""
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    studentId = serializers.CharField()
+    email = serializers.EmailField()
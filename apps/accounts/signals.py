@@ -0,0 +1,23 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.accounts.authz import bump_authz_version
+
+User = get_user_model()
+
+# 권한 버전에 영향을 주는 필드 (update_fields 지정 저장 시 판단 기준)
+AUTHZ_FIELDS = {"role", "is_active"}
+
+
+@receiver(post_save, sender=User, dispatch_uid="accounts_user_authz_changed")
+def user_authz_changed(sender, instance, created, update_fields=None, **kwargs):
+    """역할/활성 상태가 바뀔 수 있는 저장이면 권한 버전 증가."""
+    if created:
+        return
+    if update_fields is not None and not AUTHZ_FIELDS & set(update_fields):
+        return
+
+    bump_authz_version(instance.pk)
+    # 메모리의 인스턴스가 이전 버전으로 다시 저장되지 않도록 갱신
+    instance.refresh_from_db(fields=["authz_version"])
@@ -1,10 +1,17 @@
 from django.urls import path
 
-from apps.accounts.views import LoginView, MeView, RegisterView, TokenRefreshView
+from apps.accounts.views import (
+    LoginView,
+    MeView,
+    RegisterView,
+    TokenRefreshView,
+    UserSearchView,
+)
 
 urlpatterns = [
     path("register/", RegisterView.as_view(), name="register"),
     path("login/", LoginView.as_view(), name="login"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token-refresh"),
     path("me/", MeView.as_view(), name="me"),
+    path("users/search/", UserSearchView.as_view(), name="user-search"),
 ]
@@ -1,4 +1,5 @@
-from drf_spectacular.utils import extend_schema, inline_serializer
+from django.contrib.auth import get_user_model
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
 from rest_framework import serializers as s
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -7,12 +8,18 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from apps.accounts.search import search_users
 from apps.accounts.serializers import (
     CustomTokenObtainPairSerializer,
     CustomTokenRefreshSerializer,
     RegisterSerializer,
+    UserSearchQuerySerializer,
+    UserSearchResultSerializer,
     UserSerializer,
 )
+from apps.core.permissions import IsLeaderOrAdmin
+
+User = get_user_model()
 
 
 # ──────────────────────────────────────────────
@@ -103,4 +110,32 @@ class MeView(APIView):
         summary="내 정보 조회",
     )
     def get(self, request):
-        return Response(UserSerializer(request.user).data)
+        # 인증 사용자는 토큰 클레임(id, role)만 채워져 있으므로 전체 행을 한 번에 로드
+        user = User.objects.get(pk=request.user.pk)
+        return Response(UserSerializer(user).data)
+
+
+# ──────────────────────────────────────────────
+# 사용자 검색 (멤버 추가용 자동완성)
+# ──────────────────────────────────────────────
+class UserSearchView(APIView):
+    """GET /api/accounts/users/search/?q= — 학번/이름/이메일 접두사 검색 (Leader or Admin)."""
+
+    permission_classes = [IsLeaderOrAdmin]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "q", str, required=True, description="학번 / 이름 / 이메일 접두사"
+            ),
+            OpenApiParameter("limit", int, description="최대 결과 수 (기본 10)"),
+        ],
+        responses={200: UserSearchResultSerializer(many=True)},
+        summary="사용자 검색 (멤버 추가용)",
+    )
+    def get(self, request):
+        params = UserSearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        return Response(
+            search_users(params.validated_data["q"], params.validated_data["limit"])
+        )
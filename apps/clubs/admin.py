@@ -1,6 +1,26 @@
 from django.contrib import admin
+from django.db import transaction
+from django.utils import timezone
 
-from apps.clubs.models import Club, ClubMember
+from apps.clubs.models import Club, ClubMember, member_count_subquery
+
+
+def reuse_inactive_membership(obj):
+    """
+    새 멤버십이 소프트 삭제된 기존 행과 (club, user)가 같으면 그 행을 재활성화하도록 바꾼다.
+
+    기본 매니저는 삭제된 행을 숨겨 폼의 유니크 검사를 통과하지만 DB 유니크 제약에는 걸린다.
+    """
+    existing = ClubMember.all_objects.filter(
+        club_id=obj.club_id, user_id=obj.user_id, is_active=False
+    ).first()
+    if existing is None:
+        return
+    obj.pk = existing.pk
+    obj.created_at = existing.created_at
+    obj.joined_at = timezone.now()
+    # INSERT 대신 기존 행 UPDATE (auto_now_add 필드도 덮어쓰지 않음)
+    obj._state.adding = False
 
 
 class ClubMemberInline(admin.TabularInline):
@@ -12,19 +32,57 @@ class ClubMemberInline(admin.TabularInline):
 
 @admin.register(Club)
 class ClubAdmin(admin.ModelAdmin):
-    list_display = ("name", "phase", "get_member_count", "is_active", "created_at")
+    list_display = ("name", "phase", "member_count", "is_active", "created_at")
     list_filter = ("phase", "is_active")
     search_fields = ("name",)
+    readonly_fields = ("member_count",)
     inlines = [ClubMemberInline]
 
-    @admin.display(description="멤버 수")
-    def get_member_count(self, obj):
-        return obj.memberships.count()
+    def save_formset(self, request, form, formset, change):
+        if formset.model is ClubMember:
+            for inline_form in formset.extra_forms:
+                if inline_form.has_changed():
+                    reuse_inactive_membership(inline_form.instance)
+        super().save_formset(request, form, formset, change)
+
+    def save_related(self, request, form, formsets, change):
+        """인라인 멤버 추가/삭제 후 member_count 재계산."""
+        super().save_related(request, form, formsets, change)
+        form.instance.refresh_member_count()
 
 
 @admin.register(ClubMember)
 class ClubMemberAdmin(admin.ModelAdmin):
-    list_display = ("user", "club", "role", "joined_at")
-    list_filter = ("role", "club")
+    list_display = ("user", "club", "role", "joined_at", "is_active")
+    list_filter = ("role", "is_active", "club")
     search_fields = ("user__name", "user__email", "club__name")
     raw_id_fields = ("user", "club")
+
+    def get_queryset(self, request):
+        # 소프트 삭제된 멤버십도 표시 (is_active로 재활성화 가능)
+        return ClubMember.all_objects.select_related("user", "club")
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            reuse_inactive_membership(obj)
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            # 추가 / 동아리 변경 / is_active 변경 모두 실제 멤버 수로 재계산
+            obj.club.refresh_member_count()
+            if change and "club" in form.changed_data:
+                Club.all_objects.get(pk=form.initial["club"]).refresh_member_count()
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            # 소프트 삭제된 멤버십도 목록에 보이므로 감소 대신 실제 멤버 수로 재계산
+            obj.club.refresh_member_count()
+
+    def delete_queryset(self, request, queryset):
+        # 활성 / 소프트 삭제된 행이 섞여 있으므로 삭제 후 동아리별로 재계산
+        club_ids = set(queryset.values_list("club_id", flat=True))
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+            Club.all_objects.filter(pk__in=club_ids).update(
+                member_count=member_count_subquery(), updated_at=timezone.now()
+            )
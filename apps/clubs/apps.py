@@ -5,3 +5,6 @@ class ClubsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.clubs"
     verbose_name = "Clubs"
+
+    def ready(self):
+        from apps.clubs import signals  # noqa: F401
@@ -0,0 +1,140 @@
+"""
+동아리 목록/상세 응답 캐시 (버전 키).
+
+응답 본문을 "clubs:{list|detail:ID}:{버전}:{범위}:{조건}" 키로 CLUB_CACHE_TTL 동안 캐시한다.
+
+- 버전: 목록은 전역 버전, 상세는 동아리별 버전. 바뀔 때마다 bump_club_versions()로
+  올리며 키 자체가 바뀌므로 이전 항목은 읽히지 않고 TTL로 만료된다.
+  (동아리 생성/수정/삭제, 멤버십 변경, 멤버 정보 변경, 예산 배정/지출 집계 변경)
+- 범위: ADMIN / LEADER는 모든 동아리를 보므로 공용, STUDENT는 사용자별
+- 조건: 쿼리 파라미터 + 요청 호스트 (logoUrl이 절대 URL)
+
+버전 값은 만료 없이 보관한다. 캐시에서 사라지면 현재 시각(ns)으로 다시 시작하므로
+이전 버전과 겹치지 않는다.
+
+무효화 직후 같은 키로 몰린 요청은 cache.add 잠금을 잡은 한 요청만 다시 만들고
+나머지는 그 결과가 캐시될 때까지 CLUB_CACHE_WAIT_TIMEOUT(수백 ms)만 기다린다
+(잠금이 풀리거나 시간이 지나면 직접 생성). gunicorn sync 워커는 기다리는 동안
+다른 요청을 받지 못하므로 잠금 만료(CLUB_CACHE_LOCK_TIMEOUT)만큼 기다리지 않는다.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.core.metrics import get_counter
+from apps.core.permissions import get_user_role
+
+GLOBAL_VERSION_KEY = "clubs:ver"
+CLUB_VERSION_KEY = "clubs:ver:{club_id}"
+RESPONSE_CACHE_KEY = "clubs:{name}:{version}:{scope}:{digest}"
+LOCK_SUFFIX = ":lock"
+
+# 잠금을 기다리는 요청의 캐시 재확인 간격 (초)
+WAIT_INTERVAL = 0.05
+
+club_cache_counter = get_counter("clubResponse")
+
+
+def _get_version(key):
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def _bump(keys):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+def bump_club_versions(*club_ids):
+    """
+    전역 버전과 해당 동아리들의 버전 증가 — 캐시된 목록/상세 응답 무효화.
+
+    커밋 전에 다른 요청이 이전 데이터를 새 버전으로 캐시할 수 있으므로
+    커밋 직후에도 한 번 더 올린다.
+    """
+    keys = [GLOBAL_VERSION_KEY] + [
+        CLUB_VERSION_KEY.format(club_id=club_id)
+        for club_id in sorted(set(club_ids))
+        if club_id is not None
+    ]
+    _bump(keys)
+    transaction.on_commit(lambda: _bump(keys))
+
+
+def _scope(request):
+    if get_user_role(request) == "STUDENT":
+        return f"user{request.user.pk}"
+    return "all"
+
+
+def response_cache_key(request, club_id=None):
+    """요청에 대한 캐시 키 — club_id가 있으면 상세, 없으면 목록."""
+    if club_id is None:
+        name, version = "list", _get_version(GLOBAL_VERSION_KEY)
+    else:
+        name = f"detail:{club_id}"
+        version = _get_version(CLUB_VERSION_KEY.format(club_id=club_id))
+    params = sorted(
+        (key, value) for key, values in request.query_params.lists() for value in values
+    )
+    raw = f"{request.build_absolute_uri('/')}|{params!r}"
+    return RESPONSE_CACHE_KEY.format(
+        name=name,
+        version=version,
+        scope=_scope(request),
+        digest=hashlib.sha1(raw.encode()).hexdigest(),
+    )
+
+
+def cached_response(key, build):
+    """
+    캐시된 응답 본문이 있으면 그대로, 없으면 build()로 만든 200 응답을 캐시.
+
+    build: 인자 없는 함수 → Response
+    """
+    data = cache.get(key)
+    if data is not None:
+        club_cache_counter.hit()
+        return Response(data)
+    club_cache_counter.miss()
+
+    lock_key = key + LOCK_SUFFIX
+    locked = cache.add(lock_key, 1, settings.CLUB_CACHE_LOCK_TIMEOUT)
+    if not locked:
+        data = _wait_for(key, lock_key)
+        if data is not None:
+            return Response(data)
+
+    try:
+        response = build()
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.CLUB_CACHE_TTL)
+    finally:
+        if locked:
+            cache.delete(lock_key)
+    return response
+
+
+def _wait_for(key, lock_key):
+    """다른 요청이 만드는 응답을 기다림 — 잠금이 풀리거나 대기 상한이 지나면 None."""
+    deadline = time.monotonic() + settings.CLUB_CACHE_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        data = cache.get(key)
+        if data is not None:
+            return data
+        if cache.get(lock_key) is None:
+            return None
+    return None
@@ -1,6 +1,7 @@
 from django_filters import rest_framework as filters
 
 from apps.clubs.models import Club
+from apps.clubs.search import search_clubs
 
 
 class ClubFilterSet(filters.FilterSet):
@@ -8,13 +9,16 @@ class ClubFilterSet(filters.FilterSet):
     동아리 목록 필터.
 
     Query params:
-      - keyword: 동아리명 검색 (icontains)  — 프론트엔드 clubApi.ts 대응
+      - keyword: 동아리명/설명 검색 (n-gram 색인, 관련도순) — 프론트엔드 clubApi.ts 대응
       - phase: 동아리 단계 필터 (exact match)
     """
 
-    keyword = filters.CharFilter(field_name="name", lookup_expr="icontains")
+    keyword = filters.CharFilter(method="filter_keyword")
     phase = filters.ChoiceFilter(choices=Club.Phase.choices)
 
     class Meta:
         model = Club
         fields = ["keyword", "phase"]
+
+    def filter_keyword(self, queryset, name, value):
+        return search_clubs(queryset, value.split())
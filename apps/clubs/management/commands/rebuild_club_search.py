@@ -0,0 +1,37 @@
+"""
+동아리 검색 색인(ClubSearchGram) 재구축 커맨드.
+
+색인 도입 전 동아리, 직접 SQL 수정이나 bulk_update처럼 저장 시그널을 거치지 않은
+변경, 바이그램 규칙 변경 후에 동아리명/설명으로 색인을 다시 만든다.
+
+사용법:
+    python manage.py rebuild_club_search            # 전체 재구축
+    python manage.py rebuild_club_search --dry-run  # 대상 동아리 수만 출력
+"""
+from django.core.management.base import BaseCommand
+
+from apps.clubs.models import Club
+from apps.clubs.search import index_club
+
+
+class Command(BaseCommand):
+    help = "동아리명/설명으로 동아리 검색 색인을 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="재구축하지 않고 대상 동아리 수만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        clubs = Club.all_objects.only("pk", "name", "description")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{clubs.count()}개 동아리 대상 (dry-run)"))
+            return
+
+        count = 0
+        for club in clubs.iterator():
+            index_club(club)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"{count}개 동아리 색인 재구축 완료"))
@@ -0,0 +1,50 @@
+"""
+Club.member_count 비정규화 컬럼 보정 커맨드.
+
+사용자 삭제(CASCADE)나 직접 SQL 수정 등 F() 증감을 거치지 않은 변경으로
+생긴 불일치를 실제 멤버십 수로 바로잡는다.
+
+사용법:
+    python manage.py recount_members            # 불일치 동아리 보정
+    python manage.py recount_members --dry-run  # 불일치만 출력
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import F
+from django.utils import timezone
+
+from apps.clubs.models import Club, member_count_subquery
+
+
+class Command(BaseCommand):
+    help = "동아리별 member_count를 실제 멤버 수로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="수정하지 않고 불일치 목록만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = (
+            Club.all_objects.annotate(actual=member_count_subquery())
+            .exclude(member_count=F("actual"))
+            .values_list("pk", "name", "member_count", "actual")
+        )
+        drifted = list(drifted)
+
+        for pk, name, stored, actual in drifted:
+            self.stdout.write(f"  [불일치] {name} (id={pk}): {stored} → {actual}")
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("불일치 없음"))
+            return
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{len(drifted)}개 동아리 불일치 (dry-run)"))
+            return
+
+        Club.all_objects.filter(pk__in=[row[0] for row in drifted]).update(
+            member_count=member_count_subquery(), updated_at=timezone.now()
+        )
+        self.stdout.write(self.style.SUCCESS(f"{len(drifted)}개 동아리 보정 완료"))
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:41
+
+from django.db import migrations, models
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 인덱스 생성은 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("clubs", "0002_change_logo_url_to_imagefield"),
+    ]
+
+    operations = [
+        apps.core.operations.AddIndexConcurrently(
+            model_name="club",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-created_at", "-id"],
+                name="club_created_idx",
+            ),
+        ),
+        apps.core.operations.AddIndexConcurrently(
+            model_name="club",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["phase", "-created_at", "-id"],
+                name="club_phase_created_idx",
+            ),
+        ),
+        apps.core.operations.AddIndexConcurrently(
+            model_name="clubmember",
+            index=models.Index(
+                fields=["user", "club"], name="clubmember_user_club_idx"
+            ),
+        ),
+    ]
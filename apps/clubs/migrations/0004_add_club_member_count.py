@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:41
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_member_count(apps, schema_editor):
+    Club = apps.get_model("clubs", "Club")
+    ClubMember = apps.get_model("clubs", "ClubMember")
+    counts = (
+        ClubMember.objects.filter(club=OuterRef("pk"))
+        .order_by()
+        .values("club")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Club.objects.update(member_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clubs", "0003_add_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="club",
+            name="member_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="멤버 수"),
+        ),
+        migrations.RunPython(populate_member_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:10
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 적용 시점의 색인 규칙 (apps.clubs.search와 같음). 규칙을 바꾸면 이 파일을 고치지 말고
+# rebuild_club_search 명령이나 새 마이그레이션으로 색인을 다시 만든다.
+NAME_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def bigrams(text):
+    grams = set()
+    for token in TOKEN_RE.findall(unicodedata.normalize("NFKC", text or "").casefold()):
+        grams.update(a + b for a, b in zip(token, token[1:]))
+    return grams
+
+
+def populate_search_grams(apps, schema_editor):
+    Club = apps.get_model("clubs", "Club")
+    ClubSearchGram = apps.get_model("clubs", "ClubSearchGram")
+    rows = []
+    for club in Club.objects.only("pk", "name", "description").iterator():
+        weights = dict.fromkeys(bigrams(club.name), NAME_WEIGHT)
+        for gram in bigrams(club.description):
+            weights[gram] = weights.get(gram, 0) + DESCRIPTION_WEIGHT
+        rows.extend(
+            ClubSearchGram(club_id=club.pk, gram=gram, weight=weight)
+            for gram, weight in weights.items()
+        )
+    ClubSearchGram.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clubs", "0004_add_club_member_count"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClubSearchGram",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("gram", models.CharField(max_length=2, verbose_name="n-gram")),
+                ("weight", models.PositiveSmallIntegerField(verbose_name="가중치")),
+                (
+                    "club",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_grams",
+                        to="clubs.club",
+                        verbose_name="동아리",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "동아리 검색 색인",
+                "verbose_name_plural": "동아리 검색 색인",
+                "unique_together": {("gram", "club")},
+            },
+        ),
+        migrations.RunPython(populate_search_grams, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 인덱스 생성은 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("clubs", "0005_add_club_search_gram"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        apps.core.operations.AddIndexConcurrently(
+            model_name="clubmember",
+            index=models.Index(
+                fields=["club", "-joined_at", "-id"], name="clubmember_club_joined_idx"
+            ),
+        ),
+        apps.core.operations.AddIndexConcurrently(
+            model_name="clubmember",
+            index=models.Index(
+                fields=["club", "role", "-joined_at", "-id"],
+                name="clubmember_role_joined_idx",
+            ),
+        ),
+    ]
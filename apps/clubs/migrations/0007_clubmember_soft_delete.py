@@ -0,0 +1,43 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:40
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def populate_timestamps(apps, schema_editor):
+    ClubMember = apps.get_model("clubs", "ClubMember")
+    ClubMember.objects.update(created_at=F("joined_at"), updated_at=F("joined_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clubs", "0006_add_member_joined_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clubmember",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                default=django.utils.timezone.now,
+                verbose_name="생성일시",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="clubmember",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+        ),
+        migrations.AddField(
+            model_name="clubmember",
+            name="is_active",
+            field=models.BooleanField(
+                db_index=True, default=True, verbose_name="활성 여부"
+            ),
+        ),
+        # 기존 멤버십은 가입 시각을 생성/수정 시각으로 사용
+        migrations.RunPython(populate_timestamps, migrations.RunPython.noop),
+    ]
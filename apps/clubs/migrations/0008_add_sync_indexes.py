@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:41
+
+from django.db import migrations, models
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 인덱스 생성은 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("clubs", "0007_clubmember_soft_delete"),
+    ]
+
+    operations = [
+        apps.core.operations.AddIndexConcurrently(
+            model_name="club",
+            index=models.Index(fields=["updated_at", "id"], name="club_updated_idx"),
+        ),
+        apps.core.operations.AddIndexConcurrently(
+            model_name="clubmember",
+            index=models.Index(
+                fields=["updated_at", "id"], name="clubmember_updated_idx"
+            ),
+        ),
+    ]
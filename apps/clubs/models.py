@@ -1,5 +1,8 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from apps.core.models import BaseModel
 
@@ -27,18 +30,64 @@ class Club(BaseModel):
         choices=Phase.choices,
         default=Phase.OPERATING,
     )
+    # 비정규화 컬럼 — 멤버 추가/제거 시 F() UPDATE로 증감 (recount_members로 보정)
+    member_count = models.PositiveIntegerField("멤버 수", default=0)
 
     class Meta:
         verbose_name = "동아리"
         verbose_name_plural = "동아리"
         ordering = ["-created_at"]
+        # ClubViewSet 접근 경로: is_active + (phase) 필터 + created_at 역순 정렬
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="club_created_idx",
+            ),
+            models.Index(
+                fields=["phase", "-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="club_phase_created_idx",
+            ),
+            # 변경분 동기화 (apps.core.sync): 삭제 표시 포함 updated_at 순 범위 스캔
+            models.Index(fields=["updated_at", "id"], name="club_updated_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
+    def adjust_member_count(self, delta):
+        """멤버 수를 DB에서 원자적으로 증감 (동시 요청 간 경합 없음)."""
+        Club.all_objects.filter(pk=self.pk).update(
+            member_count=F("member_count") + delta, updated_at=timezone.now()
+        )
 
-class ClubMember(models.Model):
-    """동아리 멤버 — 프론트엔드 ClubMember 타입 대응."""
+    def refresh_member_count(self):
+        """실제 멤버십 행 수로 member_count를 다시 계산."""
+        Club.all_objects.filter(pk=self.pk).update(
+            member_count=member_count_subquery(), updated_at=timezone.now()
+        )
+
+
+def member_count_subquery():
+    """Club 행별 실제 (활성) 멤버십 수 — UPDATE/annotate에서 사용하는 상관 서브쿼리."""
+    counts = (
+        ClubMember.objects.filter(club=OuterRef("pk"))
+        .order_by()
+        .values("club")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class ClubMember(BaseModel):
+    """
+    동아리 멤버 — 프론트엔드 ClubMember 타입 대응.
+
+    제거는 소프트 삭제 (변경분 동기화에서 삭제 표시로 내려줌). (club, user)는 유일하므로
+    다시 추가하면 기존 행을 재활성화하고 joined_at을 새로 기록한다.
+    """
 
     class MemberRole(models.TextChoices):
         LEADER = "LEADER", "리더"
@@ -69,6 +118,49 @@ class ClubMember(models.Model):
         verbose_name_plural = "동아리 멤버"
         unique_together = ("club", "user")
         ordering = ["-joined_at"]
+        indexes = [
+            # (club, user) 유니크 인덱스와 반대 방향 — STUDENT 목록의 memberships__user 조인용
+            models.Index(fields=["user", "club"], name="clubmember_user_club_idx"),
+            # 멤버 목록 / 상세 미리보기: 동아리별 (role) + 가입일 순 키셋 페이지네이션
+            models.Index(
+                fields=["club", "-joined_at", "-id"],
+                name="clubmember_club_joined_idx",
+            ),
+            models.Index(
+                fields=["club", "role", "-joined_at", "-id"],
+                name="clubmember_role_joined_idx",
+            ),
+            # 변경분 동기화 (apps.core.sync)
+            models.Index(fields=["updated_at", "id"], name="clubmember_updated_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user.name} @ {self.club.name} ({self.role})"
+
+
+class ClubSearchGram(models.Model):
+    """
+    동아리 검색용 n-gram 색인 — 동아리명/설명의 바이그램(2글자 조각) 한 행씩.
+
+    한국어 부분 일치("스타트" → "AI 스타트업")를 인덱스로 찾기 위해
+    apps.clubs.search가 동아리 저장 시 다시 만든다 (rebuild_club_search로 재구축).
+    weight: 동아리명에 있으면 2, 설명에 있으면 1 (둘 다면 3) — 검색 순위에 사용
+    """
+
+    club = models.ForeignKey(
+        Club,
+        on_delete=models.CASCADE,
+        related_name="search_grams",
+        verbose_name="동아리",
+    )
+    gram = models.CharField("n-gram", max_length=2)
+    weight = models.PositiveSmallIntegerField("가중치")
+
+    class Meta:
+        verbose_name = "동아리 검색 색인"
+        verbose_name_plural = "동아리 검색 색인"
+        # 검색: gram IN (...) → 동아리별 집계 (gram 선두 인덱스)
+        unique_together = ("gram", "club")
+
+    def __str__(self):
+        return f"{self.gram} → {self.club_id}"
@@ -0,0 +1,15 @@
+from apps.core.pagination import KeysetPagination
+
+
+class ClubMemberPagination(KeysetPagination):
+    """
+    멤버 목록 커서 페이지네이션 — (joined_at, id) 키셋.
+
+    기본은 최근 가입순. ascending=True면 가입 오래된 순으로 같은 인덱스를 역방향으로 탄다.
+    """
+
+    ordering = ("-joined_at", "-id")
+
+    def __init__(self, ascending=False):
+        if ascending:
+            self.ordering = ("joined_at", "id")
@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission
 
+from apps.core.permissions import is_admin_or_club_leader
+
 
 class IsAdminOrClubLeader(BasePermission):
     """
@@ -16,9 +18,4 @@ class IsAdminOrClubLeader(BasePermission):
         return request.user and request.user.is_authenticated
 
     def has_object_permission(self, request, view, obj):
-        if request.user.role == "ADMIN":
-            return True
-        return obj.memberships.filter(
-            user=request.user,
-            role="LEADER",
-        ).exists()
+        return is_admin_or_club_leader(request, obj.pk)
@@ -0,0 +1,91 @@
+"""
+동아리 검색 (동아리명 + 설명, n-gram 색인).
+
+icontains('%검색어%')는 인덱스를 쓸 수 없으므로 ClubSearchGram에 바이그램 색인을
+유지하고, 검색어의 바이그램을 모두 가진 동아리만 후보로 찾는다.
+DB 기능(pg_trgm, FTS5)에 의존하지 않아 PostgreSQL / SQLite에서 같게 동작한다.
+
+- 색인: 동아리 저장 시 signals에서 index_club() 호출 (rebuild_club_search로 재구축)
+- 검색: search_clubs() — ?keyword= (ClubFilterSet), ?search= (SearchFilter) 공용
+- 순위: 일치한 바이그램 가중치 합 (동아리명 2, 설명 1)
+"""
+import re
+import unicodedata
+
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+
+from apps.clubs.models import ClubSearchGram
+
+NAME_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """정규화(NFKC, 대소문자 무시) 후 단어 목록."""
+    return TOKEN_RE.findall(unicodedata.normalize("NFKC", text or "").casefold())
+
+
+def bigrams(text):
+    """텍스트의 바이그램 집합 (2글자 미만 단어는 제외)."""
+    grams = set()
+    for token in tokenize(text):
+        grams.update(a + b for a, b in zip(token, token[1:]))
+    return grams
+
+
+def index_club(club):
+    """동아리 한 개의 색인을 다시 만든다."""
+    weights = dict.fromkeys(bigrams(club.name), NAME_WEIGHT)
+    for gram in bigrams(club.description):
+        weights[gram] = weights.get(gram, 0) + DESCRIPTION_WEIGHT
+
+    with transaction.atomic():
+        ClubSearchGram.objects.filter(club=club).delete()
+        ClubSearchGram.objects.bulk_create(
+            ClubSearchGram(club=club, gram=gram, weight=weight)
+            for gram, weight in weights.items()
+        )
+
+
+def search_clubs(queryset, terms):
+    """
+    검색어(공백 구분, 모두 포함해야 일치)로 동아리를 거르고 순위순으로 정렬.
+
+    바이그램 색인으로 후보를 좁힌 뒤 후보에 한해 실제 부분 문자열을 확인한다
+    (바이그램은 모두 있어도 붙어 있지 않을 수 있음). 1글자 검색어는 색인으로
+    찾을 수 없으므로 해당 단어만 icontains로 거른다.
+    """
+    words = [word for term in terms for word in tokenize(term)]
+    grams = set()
+    for word in words:
+        grams.update(bigrams(word))
+
+    for word in words:
+        queryset = queryset.filter(
+            Q(name__icontains=word) | Q(description__icontains=word)
+        )
+    if not grams:
+        return queryset.order_by("-created_at", "-id")
+
+    matched = (
+        ClubSearchGram.objects.filter(gram__in=grams)
+        .values("club")
+        .annotate(hits=Count("pk"))
+        .filter(hits=len(grams))
+        .values("club")
+    )
+    scores = (
+        ClubSearchGram.objects.filter(club=OuterRef("pk"), gram__in=grams)
+        .order_by()
+        .values("club")
+        .annotate(score=Sum("weight"))
+        .values("score")
+    )
+    return (
+        queryset.filter(pk__in=matched)
+        .annotate(search_rank=Subquery(scores))
+        .order_by("-search_rank", "-created_at", "-id")
+    )
@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from apps.clubs.models import Club, ClubMember
@@ -23,6 +24,31 @@ class ClubMemberSerializer(serializers.ModelSerializer):
         fields = ["userId", "name", "studentId", "email", "phone", "role", "joinedAt"]
 
 
+class ClubMemberSyncSerializer(ClubMemberSerializer):
+    """변경분 동기화용 — 여러 동아리의 멤버가 섞이므로 clubId 포함."""
+
+    clubId = serializers.IntegerField(source="club_id", read_only=True)
+
+    class Meta(ClubMemberSerializer.Meta):
+        fields = ["clubId"] + ClubMemberSerializer.Meta.fields
+
+
+class ClubMemberQuerySerializer(serializers.Serializer):
+    """
+    멤버 목록 조회 조건.
+
+    - role: 멤버 역할 (선택)
+    - ordering: joinedAt(가입 오래된 순) / -joinedAt(최근 가입순, 기본)
+    """
+
+    role = serializers.ChoiceField(
+        choices=ClubMember.MemberRole.choices, required=False
+    )
+    ordering = serializers.ChoiceField(
+        choices=["joinedAt", "-joinedAt"], default="-joinedAt"
+    )
+
+
 # ──────────────────────────────────────────────
 # Club 목록용 — memberCount만 포함 (N+1 방지)
 # ──────────────────────────────────────────────
@@ -31,7 +57,7 @@ class ClubListSerializer(serializers.ModelSerializer):
     GET /api/clubs/ 목록 응답.
 
     members 배열 대신 memberCount(정수)를 반환하여 페이로드 최소화.
-    ViewSet에서 annotate(member_count=Count("memberships"))로 주입.
+    memberCount는 Club.member_count 비정규화 컬럼 (조인/집계 없음).
     """
 
     logoUrl = serializers.SerializerMethodField()
@@ -60,13 +86,27 @@ class ClubListSerializer(serializers.ModelSerializer):
 
 
 # ──────────────────────────────────────────────
-# Club 상세용 — members 배열 포함
+# Club 상세용 — memberCount + 최근 멤버 일부 포함
 # 프론트엔드 Club 타입 1:1 대응
-# { id, name, description, logoUrl?, phase, members, budget?, createdAt }
+# { id, name, description, logoUrl?, phase, memberCount, members, budget?, spentAmount,
+#   remainingBudget?, createdAt }
 # ──────────────────────────────────────────────
 class ClubDetailSerializer(serializers.ModelSerializer):
+    """
+    budget / spentAmount / remainingBudget는 apps.settlements.rollups.with_budget
+    주석값을 사용 (배정 합계와 월별 지출 집계 합계, 추가 쿼리 없음).
+    주석이 없는 인스턴스(생성 직후)는 배정/지출이 없는 것으로 본다.
+
+    members는 전체 목록이 아니라 최근 가입한 멤버 일부(member_preview prefetch)만
+    담는다. 전체 목록은 GET /api/clubs/{pk}/members/ (커서 페이지네이션).
+    """
+
     logoUrl = serializers.SerializerMethodField()
-    members = ClubMemberSerializer(source="memberships", many=True, read_only=True)
+    memberCount = serializers.IntegerField(source="member_count", read_only=True)
+    members = serializers.SerializerMethodField()
+    budget = serializers.SerializerMethodField()
+    spentAmount = serializers.SerializerMethodField()
+    remainingBudget = serializers.SerializerMethodField()
     createdAt = serializers.DateTimeField(source="created_at", read_only=True)
 
     class Meta:
@@ -77,7 +117,11 @@ class ClubDetailSerializer(serializers.ModelSerializer):
             "description",
             "logoUrl",
             "phase",
+            "memberCount",
             "members",
+            "budget",
+            "spentAmount",
+            "remainingBudget",
             "createdAt",
         ]
 
@@ -89,6 +133,22 @@ class ClubDetailSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.logo.url)
         return obj.logo.url
 
+    @extend_schema_field(ClubMemberSerializer(many=True))
+    def get_members(self, obj):
+        return ClubMemberSerializer(getattr(obj, "member_preview", []), many=True).data
+
+    def get_budget(self, obj) -> int | None:
+        return getattr(obj, "budget_total", None)
+
+    def get_spentAmount(self, obj) -> int:
+        return getattr(obj, "spent_total", 0)
+
+    def get_remainingBudget(self, obj) -> int | None:
+        budget = self.get_budget(obj)
+        if budget is None:
+            return None
+        return budget - self.get_spentAmount(obj)
+
 
 # ──────────────────────────────────────────────
 # 동아리 생성
@@ -129,3 +189,59 @@ class AddMemberSerializer(serializers.Serializer):
         if not User.objects.filter(id=value).exists():
             raise serializers.ValidationError("존재하지 않는 사용자입니다.")
         return value
+
+
+# ──────────────────────────────────────────────
+# 멤버 일괄 추가/제거 요청
+# { add?: [{ userId | studentId, role }], remove?: [{ userId | studentId }] }
+# ──────────────────────────────────────────────
+BULK_MEMBER_MAX_ITEMS = 200
+
+
+class MemberRefSerializer(serializers.Serializer):
+    """userId 또는 studentId 중 하나로 사용자 지정."""
+
+    userId = serializers.IntegerField(required=False)
+    studentId = serializers.CharField(required=False, max_length=20)
+
+    def validate(self, attrs):
+        if ("userId" in attrs) == ("studentId" in attrs):
+            raise serializers.ValidationError("userId 또는 studentId 중 하나를 지정해야 합니다.")
+        return attrs
+
+
+class BulkAddMemberSerializer(MemberRefSerializer):
+    role = serializers.ChoiceField(
+        choices=ClubMember.MemberRole.choices, default=ClubMember.MemberRole.MEMBER
+    )
+
+
+class BulkMemberSerializer(serializers.Serializer):
+    add = BulkAddMemberSerializer(many=True, required=False, default=list)
+    remove = MemberRefSerializer(many=True, required=False, default=list)
+
+    def validate(self, attrs):
+        total = len(attrs["add"]) + len(attrs["remove"])
+        if total == 0:
+            raise serializers.ValidationError("add 또는 remove 항목이 필요합니다.")
+        if total > BULK_MEMBER_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {BULK_MEMBER_MAX_ITEMS}명까지 처리할 수 있습니다."
+            )
+        return attrs
+
+
+class BulkMemberResultSerializer(serializers.Serializer):
+    """항목별 결과 — status: ADDED / REMOVED / ALREADY_MEMBER / NOT_MEMBER / NOT_FOUND / DUPLICATE"""
+
+    action = serializers.ChoiceField(choices=["add", "remove"])
+    userId = serializers.IntegerField(allow_null=True)
+    studentId = serializers.CharField(allow_null=True)
+    role = serializers.CharField(allow_null=True)
+    status = serializers.CharField()
+
+
+class BulkMemberResponseSerializer(serializers.Serializer):
+    added = serializers.IntegerField()
+    removed = serializers.IntegerField()
+    results = BulkMemberResultSerializer(many=True)
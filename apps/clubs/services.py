@@ -0,0 +1,124 @@
+"""
+동아리 멤버 일괄 추가/제거.
+
+항목 수와 무관하게 쿼리 수가 일정하다.
+- 사용자 조회 1회 (userId / studentId 모두), 기존 멤버십 조회 1회
+- 제거: 소프트 삭제 UPDATE 1회
+- 추가: bulk_create(update_conflicts) 1회 — 이전에 제거된 멤버십은 재활성화
+- LEADER로 추가된 STUDENT 역할 승격 UPDATE 1회, 권한 버전 증가 UPDATE 1회
+- member_count 재계산 UPDATE 1회, 동아리 응답 캐시 버전 증가
+"""
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.accounts.authz import batch_authz_bumps, bump_authz_version
+from apps.clubs.cache import bump_club_versions
+from apps.clubs.models import ClubMember
+
+User = get_user_model()
+
+
+class MemberStatus:
+    ADDED = "ADDED"
+    REMOVED = "REMOVED"
+    ALREADY_MEMBER = "ALREADY_MEMBER"
+    NOT_MEMBER = "NOT_MEMBER"
+    NOT_FOUND = "NOT_FOUND"
+    DUPLICATE = "DUPLICATE"  # 같은 요청에서 이미 다룬 사용자
+
+
+def _load_users(items):
+    """항목들이 가리키는 활성 사용자 → ({id: 사용자}, {학번: 사용자})."""
+    ids = {item["userId"] for item in items if item.get("userId") is not None}
+    student_ids = {item["studentId"] for item in items if item.get("studentId")}
+    users = User.objects.filter(
+        Q(pk__in=ids) | Q(student_id__in=student_ids), is_active=True
+    ).only("pk", "student_id", "role")
+    by_id = {user.pk: user for user in users}
+    by_student_id = {user.student_id: user for user in by_id.values()}
+    return by_id, by_student_id
+
+
+def bulk_update_members(club, add, remove):
+    """
+    add: [{userId | studentId, role}], remove: [{userId | studentId}]
+
+    Returns:
+        항목별 결과 목록 (요청 순서, 제거 → 추가 순)
+        [{"action", "userId", "studentId", "role", "status"}, ...]
+    """
+    by_id, by_student_id = _load_users(add + remove)
+    members = dict(
+        ClubMember.objects.filter(club=club, user_id__in=by_id).values_list(
+            "user_id", "role"
+        )
+    )
+
+    results, seen = [], set()
+    to_remove, to_add = [], []
+    for action, items in (("remove", remove), ("add", add)):
+        for item in items:
+            user = by_id.get(item.get("userId")) or by_student_id.get(
+                item.get("studentId")
+            )
+            result = {
+                "action": action,
+                "userId": user.pk if user else item.get("userId"),
+                "studentId": user.student_id if user else item.get("studentId"),
+                "role": item.get("role"),
+            }
+            if user is None:
+                result["status"] = MemberStatus.NOT_FOUND
+            elif user.pk in seen:
+                result["status"] = MemberStatus.DUPLICATE
+            elif action == "remove":
+                if user.pk in members:
+                    result["status"] = MemberStatus.REMOVED
+                    to_remove.append(user.pk)
+                else:
+                    result["status"] = MemberStatus.NOT_MEMBER
+            elif user.pk in members:
+                result["status"] = MemberStatus.ALREADY_MEMBER
+            else:
+                result["status"] = MemberStatus.ADDED
+                to_add.append((user, item["role"]))
+            if user is not None:
+                seen.add(user.pk)
+            results.append(result)
+
+    if to_remove or to_add:
+        _apply(club, to_remove, to_add)
+    return results
+
+
+def _apply(club, to_remove, to_add):
+    # UPDATE / bulk_create는 멤버십 시그널을 보내지 않으므로 권한 버전은 직접 증가
+    with transaction.atomic(), batch_authz_bumps():
+        if to_remove:
+            ClubMember.objects.filter(club=club, user_id__in=to_remove).update(
+                is_active=False, updated_at=timezone.now()
+            )
+            bump_authz_version(*to_remove)
+        if to_add:
+            ClubMember.all_objects.bulk_create(
+                [ClubMember(club=club, user=user, role=role) for user, role in to_add],
+                update_conflicts=True,
+                unique_fields=["club", "user"],
+                update_fields=["role", "is_active", "joined_at", "updated_at"],
+            )
+            leaders = [
+                user.pk
+                for user, role in to_add
+                if role == ClubMember.MemberRole.LEADER
+                and user.role == User.Role.STUDENT
+            ]
+            if leaders:
+                User.objects.filter(pk__in=leaders, role=User.Role.STUDENT).update(
+                    role=User.Role.LEADER
+                )
+            bump_authz_version(*[user.pk for user, _role in to_add])
+        club.refresh_member_count()
+        # bulk_create는 멤버십 시그널을 보내지 않으므로 응답 캐시도 직접 무효화
+        bump_club_versions(club.pk)
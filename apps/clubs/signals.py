@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.accounts.authz import bump_authz_version
+from apps.clubs.cache import bump_club_versions
+from apps.clubs.models import Club, ClubMember
+from apps.clubs.search import index_club
+
+User = get_user_model()
+
+# 검색 색인에 들어가는 필드 (update_fields 지정 저장 시 판단 기준)
+SEARCH_FIELDS = {"name", "description"}
+# 동아리 상세 members에 보이는 사용자 필드
+MEMBER_PROFILE_FIELDS = {"name", "student_id", "email", "phone", "is_active"}
+
+
+@receiver(post_save, sender=ClubMember, dispatch_uid="clubs_membership_saved")
+@receiver(post_delete, sender=ClubMember, dispatch_uid="clubs_membership_deleted")
+def membership_changed(sender, instance, **kwargs):
+    """멤버십 추가/변경/삭제 시 해당 사용자의 권한 버전과 동아리 응답 캐시 버전 증가."""
+    bump_authz_version(instance.user_id)
+    bump_club_versions(instance.club_id)
+
+
+@receiver(post_save, sender=Club, dispatch_uid="clubs_club_cache_saved")
+@receiver(post_delete, sender=Club, dispatch_uid="clubs_club_cache_deleted")
+def club_changed(sender, instance, **kwargs):
+    """동아리 생성/수정/소프트 삭제/삭제 시 응답 캐시 무효화."""
+    bump_club_versions(instance.pk)
+
+
+@receiver(post_save, sender=User, dispatch_uid="clubs_member_profile_changed")
+def member_profile_changed(sender, instance, created, update_fields=None, **kwargs):
+    """
+    멤버 정보가 바뀔 수 있는 저장이면 소속 동아리의 상세 응답 캐시 무효화.
+
+    멤버십 updated_at도 갱신해 변경분 동기화에서 바뀐 멤버 정보를 내려준다.
+    """
+    if created:
+        return
+    if update_fields is not None and not MEMBER_PROFILE_FIELDS & set(update_fields):
+        return
+    memberships = ClubMember.objects.filter(user=instance)
+    club_ids = list(memberships.values_list("club_id", flat=True))
+    if club_ids:
+        memberships.update(updated_at=timezone.now())
+        bump_club_versions(*club_ids)
+
+
+@receiver(post_save, sender=Club, dispatch_uid="clubs_club_search_index")
+def club_saved(sender, instance, update_fields=None, **kwargs):
+    """동아리명/설명이 바뀔 수 있는 저장이면 검색 색인 재생성."""
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    index_club(instance)
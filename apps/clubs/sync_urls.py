@@ -0,0 +1,8 @@
+from django.urls import path
+
+from apps.clubs.views import ClubMemberSyncView, ClubSyncView
+
+urlpatterns = [
+    path("clubs/", ClubSyncView.as_view(), name="sync-clubs"),
+    path("members/", ClubMemberSyncView.as_view(), name="sync-members"),
+]
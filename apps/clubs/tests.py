@@ -0,0 +1,24 @@
+from django.test import TestCase
+
+from apps.clubs.filters import ClubFilterSet
+from apps.clubs.models import Club
+from apps.core.pagination import KeysetPagination
+from apps.core.testing import QueryPlanTestMixin
+
+
+class ClubListIndexTests(QueryPlanTestMixin, TestCase):
+    """동아리 목록 쿼리가 0003의 부분 인덱스(is_active=True)를 타는지 확인."""
+
+    def list_queryset(self, params):
+        # ClubViewSet.list와 같은 필터 + 페이지네이션 정렬
+        queryset = ClubFilterSet(params, queryset=Club.objects.all()).qs
+        return queryset.order_by(*KeysetPagination.ordering)[:20]
+
+    def test_list_uses_created_index(self):
+        self.assertUsesIndex(self.list_queryset({}), "club_created_idx")
+
+    def test_phase_filter_uses_phase_index(self):
+        self.assertUsesIndex(
+            self.list_queryset({"phase": Club.Phase.RECRUITING}),
+            "club_phase_created_idx",
+        )
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from apps.clubs.views import (
+    ClubMemberBulkView,
     ClubMemberDestroyView,
     ClubMemberListCreateView,
     ClubViewSet,
@@ -20,6 +21,11 @@ urlpatterns = [
         ClubMemberListCreateView.as_view(),
         name="club-member-list",
     ),
+    path(
+        "<int:pk>/members/bulk/",
+        ClubMemberBulkView.as_view(),
+        name="club-member-bulk",
+    ),
     path(
         "<int:pk>/members/<int:member_id>/",
         ClubMemberDestroyView.as_view(),
@@ -1,28 +1,57 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Count
+from django.db import IntegrityError, transaction
+from django.db.models import OuterRef, Prefetch, Q, Subquery
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import _positive_int
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
+from apps.accounts.authz import bump_authz_version
+from apps.clubs.cache import bump_club_versions, cached_response, response_cache_key
 from apps.clubs.filters import ClubFilterSet
 from apps.clubs.models import Club, ClubMember
+from apps.clubs.pagination import ClubMemberPagination
 from apps.clubs.permissions import IsAdminOrClubLeader
+from apps.clubs.search import search_clubs
 from apps.clubs.serializers import (
     AddMemberSerializer,
+    BulkMemberResponseSerializer,
+    BulkMemberSerializer,
     ClubCreateSerializer,
     ClubDetailSerializer,
     ClubListSerializer,
+    ClubMemberQuerySerializer,
     ClubMemberSerializer,
+    ClubMemberSyncSerializer,
     ClubUpdateSerializer,
 )
+from apps.clubs.services import MemberStatus, bulk_update_members
+from apps.core.conditional import conditional_response, make_etag
 from apps.core.exceptions import BusinessLogicError
-from apps.core.permissions import IsAdmin
+from apps.core.permissions import IsAdmin, get_user_role, is_admin_or_club_leader
+from apps.core.sync import SyncView
+from apps.settlements.rollups import with_budget
 
 User = get_user_model()
 
 
+def member_preview_prefetch(limit):
+    """상세 응답용 최근 가입 멤버 limit명 prefetch (club.member_preview)."""
+    return Prefetch(
+        "memberships",
+        queryset=ClubMember.objects.select_related("user").order_by(
+            "-joined_at", "-id"
+        )[:limit],
+        to_attr="member_preview",
+    )
+
+
 # ──────────────────────────────────────────────
 # Club CRUD — ModelViewSet
 # ──────────────────────────────────────────────
@@ -35,9 +64,20 @@ class ClubViewSet(ModelViewSet):
     retrieve:       GET    /api/clubs/{pk}/
     partial_update: PATCH  /api/clubs/{pk}/       (Admin or Club Leader)
     destroy:        DELETE /api/clubs/{pk}/       (Admin)
+
+    list는 ?cursor= 지정 시 (created_at, id) 커서 페이지네이션으로 동작.
+    retrieve / update 응답의 members는 최근 가입한 ?members=N명 (기본 CLUB_DETAIL_MEMBERS,
+    최대 CLUB_DETAIL_MEMBERS_MAX, 0이면 memberCount만).
+    list / retrieve 응답은 apps.clubs.cache의 버전 키로 캐시되고, 같은 키로 만든 ETag로
+    조건부 GET(If-None-Match → 304)을 지원한다. 멤버/예산 변경은 Club.updated_at을
+    바꾸지 않으므로 updated_at 대신 캐시 버전을 검증자로 쓴다.
+    ?search= / ?keyword=는 동아리명·설명 n-gram 색인 검색 (관련도순, 커서 모드는 최신순).
     """
 
     filterset_class = ClubFilterSet
+    # SearchFilter(?search=)가 사용하는 색인 검색 — search_fields는 스키마/문서용
+    search_backend = staticmethod(search_clubs)
+    search_fields = ["name", "description"]
     # PUT은 사용하지 않음 — PATCH만 허용
     http_method_names = ["get", "post", "patch", "delete", "head", "options"]
 
@@ -45,18 +85,33 @@ class ClubViewSet(ModelViewSet):
         qs = Club.objects.all()
 
         # STUDENT는 자기가 속한 동아리만 조회
-        if self.request.user.role == "STUDENT":
-            qs = qs.filter(memberships__user=self.request.user)
+        if get_user_role(self.request) == "STUDENT":
+            qs = qs.filter(
+                memberships__user=self.request.user, memberships__is_active=True
+            )
 
-        # list: annotation으로 멤버 수 계산 (N+1 방지)
-        if self.action == "list":
-            qs = qs.annotate(member_count=Count("memberships"))
-        else:
-            # retrieve/update/delete: 멤버 정보 prefetch
-            qs = qs.prefetch_related("memberships__user")
+        # list는 비정규화된 member_count 컬럼을 그대로 사용 (GROUP BY 없음)
+        if self.action == "retrieve":
+            qs = self._with_detail(qs)
 
         return qs
 
+    def _with_detail(self, qs):
+        """상세 응답용: 최근 멤버 일부 prefetch + 예산/지출 합계 주석."""
+        limit = self._member_preview_limit()
+        if limit:
+            qs = qs.prefetch_related(member_preview_prefetch(limit))
+        return with_budget(qs)
+
+    def _member_preview_limit(self):
+        try:
+            return _positive_int(
+                self.request.query_params["members"],
+                cutoff=settings.CLUB_DETAIL_MEMBERS_MAX,
+            )
+        except (KeyError, ValueError):
+            return settings.CLUB_DETAIL_MEMBERS
+
     def get_serializer_class(self):
         if self.action == "list":
             return ClubListSerializer
@@ -73,6 +128,20 @@ class ClubViewSet(ModelViewSet):
             return [IsAdminOrClubLeader()]
         return [IsAuthenticated()]
 
+    def list(self, request, *args, **kwargs):
+        return self._cached(request, super().list, None, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(request, super().retrieve, kwargs["pk"], *args, **kwargs)
+
+    def _cached(self, request, build, club_id, *args, **kwargs):
+        key = response_cache_key(request, club_id=club_id)
+        return conditional_response(
+            request,
+            lambda: cached_response(key, lambda: build(request, *args, **kwargs)),
+            make_etag(request, key),
+        )
+
     def create(self, request, *args, **kwargs):
         """생성 후 ClubDetailSerializer로 응답."""
         serializer = self.get_serializer(data=request.data)
@@ -91,7 +160,7 @@ class ClubViewSet(ModelViewSet):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         # 수정된 데이터를 members 포함하여 다시 조회
-        instance = Club.objects.prefetch_related("memberships__user").get(pk=instance.pk)
+        instance = self._with_detail(Club.objects.all()).get(pk=instance.pk)
         return Response(
             ClubDetailSerializer(instance, context=self.get_serializer_context()).data,
         )
@@ -106,7 +175,7 @@ class ClubViewSet(ModelViewSet):
 # ──────────────────────────────────────────────
 class ClubMemberListCreateView(APIView):
     """
-    GET  /api/clubs/{pk}/members/     → 멤버 목록
+    GET  /api/clubs/{pk}/members/     → 멤버 목록 (?role=, ?ordering=, 커서 페이지네이션)
     POST /api/clubs/{pk}/members/     → 멤버 추가 (Admin or Club Leader)
     """
 
@@ -119,22 +188,43 @@ class ClubMemberListCreateView(APIView):
             return None
 
     def _check_leader_or_admin(self, request, club):
-        """Admin이 아니면 해당 동아리 리더인지 확인."""
-        if request.user.role == "ADMIN":
-            return
-        is_leader = club.memberships.filter(
-            user=request.user, role="LEADER"
-        ).exists()
-        if not is_leader:
+        """Admin이 아니면 해당 동아리 리더인지 확인 (토큰 클레임 우선)."""
+        if not is_admin_or_club_leader(request, club.pk):
             self.permission_denied(request, message="리더 또는 관리자 권한이 필요합니다.")
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("role", str, enum=ClubMember.MemberRole.values),
+            OpenApiParameter(
+                "ordering",
+                str,
+                enum=["joinedAt", "-joinedAt"],
+                description="가입일 정렬 (기본 -joinedAt, 최근 가입순)",
+            ),
+            OpenApiParameter("cursor", str, description="이전 응답의 nextCursor"),
+            OpenApiParameter("size", int, description="페이지당 항목 수 (최대 100)"),
+        ],
+        responses={200: ClubMemberSerializer(many=True)},
+    )
     def get(self, request, pk):
         club = self._get_club(pk)
         if club is None:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        members = club.memberships.select_related("user").all()
-        return Response(ClubMemberSerializer(members, many=True).data)
+        params = ClubMemberQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        members = club.memberships.select_related("user")
+        if "role" in params.validated_data:
+            members = members.filter(role=params.validated_data["role"])
+
+        # (club, [role,] joined_at, id) 인덱스 키셋 — 멤버 수와 무관하게 페이지당 비용 일정
+        paginator = ClubMemberPagination(
+            ascending=params.validated_data["ordering"] == "joinedAt"
+        )
+        page = paginator.paginate_queryset(members, request, view=self)
+        return paginator.get_paginated_response(
+            ClubMemberSerializer(page, many=True).data
+        )
 
     def post(self, request, pk):
         club = self._get_club(pk)
@@ -148,17 +238,29 @@ class ClubMemberListCreateView(APIView):
 
         user = User.objects.get(id=serializer.validated_data["userId"])
 
-        if ClubMember.objects.filter(club=club, user=user).exists():
-            raise BusinessLogicError("이미 동아리에 가입된 멤버입니다.")
-
-        member = ClubMember.objects.create(
-            club=club,
-            user=user,
-            role=serializer.validated_data["role"],
-        )
+        role = serializer.validated_data["role"]
+        with transaction.atomic():
+            # 이전에 제거된(소프트 삭제) 멤버십이 있으면 재활성화 — 조건부 UPDATE라
+            # 같은 멤버를 동시에 추가하는 요청 중 실제로 행을 바꾼 쪽만 멤버 수 증가
+            now = timezone.now()
+            reactivated = ClubMember.all_objects.filter(
+                club=club, user=user, is_active=False
+            ).update(is_active=True, role=role, joined_at=now, updated_at=now)
+            if reactivated:
+                # UPDATE는 멤버십 시그널을 보내지 않으므로 권한 / 응답 캐시 버전은 직접 증가
+                bump_authz_version(user.pk)
+                bump_club_versions(club.pk)
+            else:
+                try:
+                    with transaction.atomic():
+                        ClubMember.objects.create(club=club, user=user, role=role)
+                except IntegrityError:
+                    raise BusinessLogicError("이미 동아리에 가입된 멤버입니다.")
+            club.adjust_member_count(1)
+            member = ClubMember.objects.get(club=club, user=user)
 
         # 멤버 추가 시 해당 유저의 role이 STUDENT이고 LEADER로 추가된 경우, 유저 role 업데이트
-        if serializer.validated_data["role"] == "LEADER" and user.role == "STUDENT":
+        if role == "LEADER" and user.role == "STUDENT":
             user.role = "LEADER"
             user.save(update_fields=["role"])
 
@@ -168,6 +270,48 @@ class ClubMemberListCreateView(APIView):
         )
 
 
+# ──────────────────────────────────────────────
+# ClubMember 일괄 추가 / 제거
+# ──────────────────────────────────────────────
+class ClubMemberBulkView(APIView):
+    """
+    POST /api/clubs/{pk}/members/bulk/ → 멤버 일괄 추가/제거 (Admin or Club Leader)
+
+    학기 초 명단 등록처럼 여러 명을 한 요청으로 처리한다 (항목 수와 무관한 쿼리 수,
+    apps.clubs.services 참고). 일부 항목이 실패해도 나머지는 반영하고 항목별 결과를 돌려준다.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=BulkMemberSerializer,
+        responses={200: BulkMemberResponseSerializer},
+        summary="동아리 멤버 일괄 추가/제거",
+    )
+    def post(self, request, pk):
+        try:
+            club = Club.objects.get(pk=pk)
+        except Club.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        if not is_admin_or_club_leader(request, club.pk):
+            self.permission_denied(request, message="리더 또는 관리자 권한이 필요합니다.")
+
+        serializer = BulkMemberSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk_update_members(
+            club,
+            add=serializer.validated_data["add"],
+            remove=serializer.validated_data["remove"],
+        )
+        summary = {
+            "added": sum(r["status"] == MemberStatus.ADDED for r in results),
+            "removed": sum(r["status"] == MemberStatus.REMOVED for r in results),
+            "results": results,
+        }
+        return Response(BulkMemberResponseSerializer(summary).data)
+
+
 # ──────────────────────────────────────────────
 # ClubMember 삭제
 # ──────────────────────────────────────────────
@@ -185,17 +329,78 @@ class ClubMemberDestroyView(APIView):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
         # 권한 확인
-        if request.user.role != "ADMIN":
-            is_leader = club.memberships.filter(
-                user=request.user, role="LEADER"
-            ).exists()
-            if not is_leader:
-                self.permission_denied(request, message="리더 또는 관리자 권한이 필요합니다.")
+        if not is_admin_or_club_leader(request, club.pk):
+            self.permission_denied(request, message="리더 또는 관리자 권한이 필요합니다.")
 
         try:
             membership = club.memberships.get(user_id=member_id)
         except ClubMember.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        membership.delete()
+        with transaction.atomic():
+            # 조건부 UPDATE — 같은 멤버십을 동시에 지우는 요청 중 실제로 행을 바꾼 쪽만 멤버 수 감소
+            removed = ClubMember.objects.filter(
+                pk=membership.pk, is_active=True
+            ).update(is_active=False, updated_at=timezone.now())
+            if removed:
+                club.adjust_member_count(-1)
+                # UPDATE는 멤버십 시그널을 보내지 않으므로 권한 / 응답 캐시 버전은 직접 증가
+                bump_authz_version(membership.user_id)
+                bump_club_versions(club.pk)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ──────────────────────────────────────────────
+# 변경분 동기화 (apps.core.sync)
+# ──────────────────────────────────────────────
+class ClubSyncView(SyncView):
+    """
+    GET /api/sync/clubs/?since= → 바뀐 동아리 (목록 응답 형태) + 삭제된 동아리 ID
+
+    STUDENT는 활성 멤버십이 있는 동아리만 changes로 받고, 멤버십이 제거된 동아리는
+    삭제 표시로 받는다. 멤버십 추가/제거는 member_count 갱신으로 Club.updated_at도
+    바꾸므로 (Club.adjust_member_count / refresh_member_count) 그 시점에 다시 읽힌다.
+    """
+
+    serializer_class = ClubListSerializer
+
+    def get_queryset(self):
+        qs = Club.all_objects.all()
+        if get_user_role(self.request) == "STUDENT":
+            membership = ClubMember.all_objects.filter(
+                club=OuterRef("pk"), user=self.request.user
+            )
+            qs = qs.annotate(
+                member_active=Subquery(membership.values("is_active")[:1])
+            ).filter(member_active__isnull=False)
+        return qs
+
+    def get_active_filter(self):
+        if get_user_role(self.request) == "STUDENT":
+            return Q(is_active=True, member_active=True)
+        return super().get_active_filter()
+
+    def is_deleted(self, obj):
+        return not obj.is_active or getattr(obj, "member_active", True) is False
+
+
+class ClubMemberSyncView(SyncView):
+    """
+    GET /api/sync/members/?since=&club= → 바뀐 멤버십 + 제거된 멤버십 (clubId, userId)
+
+    멤버 목록 API와 같이 인증된 사용자 모두 조회 가능. ?club=로 한 동아리만.
+    """
+
+    serializer_class = ClubMemberSyncSerializer
+
+    def get_queryset(self):
+        qs = ClubMember.all_objects.select_related("user")
+        club_id = self.request.query_params.get("club")
+        if club_id:
+            if not club_id.isdigit():
+                raise ValidationError({"club": "동아리 ID는 정수여야 합니다."})
+            qs = qs.filter(club_id=club_id)
+        return qs
+
+    def get_tombstone(self, obj):
+        return {"clubId": obj.club_id, "userId": obj.user_id}
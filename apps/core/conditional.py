@@ -0,0 +1,63 @@
+"""
+조건부 GET — ETag / If-None-Match, Last-Modified / If-Modified-Since.
+
+검증자는 응답을 직렬화하지 않고 계산한다.
+- 목록: 필터된 쿼리셋의 max(updated_at) + 행 수 (집계 쿼리 1회) + 필터 시그니처(SQL)
+- 상세: 객체의 pk + updated_at
+- 그 외: 호출자가 넘긴 값 (예: 동아리 응답 캐시 버전 키)
+
+요청 URL(호스트, 페이지/크기 등 쿼리 파라미터)도 ETag에 섞는다.
+본문 해시가 아니므로 약한 ETag(W/"...")로 보내며, 일치하면 빈 본문의 304를 돌려준다.
+
+목록은 행이 빠져도(소프트 삭제) max(updated_at)이 그대로일 수 있어 ETag만 보낸다.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(request, *parts):
+    """요청 URL + parts로 만든 약한 ETag."""
+    raw = repr((request.build_absolute_uri(), *parts))
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def queryset_etag(request, queryset):
+    """목록 ETag — max(updated_at), 행 수, 필터 시그니처 (집계 쿼리 1회)."""
+    queryset = queryset.order_by()
+    stats = queryset.aggregate(last_modified=Max("updated_at"), count=Count("pk"))
+    sql, params = queryset.query.sql_with_params()
+    return make_etag(
+        request, stats["count"], stats["last_modified"], queryset.db, sql, params
+    )
+
+
+def object_validators(request, obj):
+    """상세 (ETag, Last-Modified)."""
+    return make_etag(request, obj.pk, obj.updated_at), obj.updated_at
+
+
+def conditional_response(request, build, etag, last_modified=None):
+    """
+    요청의 조건부 헤더가 검증자와 일치하면 304, 아니면 build()의 응답.
+
+    200 / 304 응답에는 ETag(와 Last-Modified)를 붙이고, 클라이언트가 매번
+    재검증하도록 Cache-Control: private, no-cache를 지정한다.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        response = Response(status=response.status_code)
+    else:
+        response = build()
+
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
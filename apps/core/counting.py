@@ -0,0 +1,72 @@
+"""
+페이지네이션 전체 건수(totalElements) 계산 전략.
+
+정확한 COUNT(*)는 필터된 전체 행을 훑기 때문에 큰 테이블에서 가장 비싼 쿼리가 된다.
+
+  1. LIMIT을 건 부분 COUNT로 임계값 이하인지 확인 → 이하면 정확한 값
+  2. 임계값 초과 + PostgreSQL → EXPLAIN 플래너 추정치 (근사값)
+  3. 임계값 초과 + 그 외 DB → 필터 시그니처별 캐시된 COUNT (TTL 동안 근사값)
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+COUNT_CACHE_PREFIX = "pagination:count"
+
+
+def count_queryset(queryset):
+    """
+    (건수, 근사값 여부) 반환.
+
+    queryset이 아닌 리스트 등이 들어오면 len()으로 정확히 센다.
+    """
+    if not hasattr(queryset, "query"):
+        return len(queryset), False
+
+    queryset = queryset.order_by()
+    threshold = settings.PAGINATION_EXACT_COUNT_THRESHOLD
+
+    # 임계값 + 1 건까지만 세는 COUNT(*) FROM (... LIMIT n) — 비용 상한이 고정됨
+    bounded = queryset[: threshold + 1].count()
+    if bounded <= threshold:
+        return bounded, False
+
+    if connections[queryset.db].vendor == "postgresql":
+        estimate = _planner_estimate(queryset)
+        if estimate is not None:
+            # 플래너가 과소 추정해도 최소 임계값 + 1 건은 확실히 존재
+            return max(estimate, bounded), True
+
+    return _cached_count(queryset), True
+
+
+def _planner_estimate(queryset):
+    """PostgreSQL EXPLAIN의 최상위 노드 Plan Rows 추정치."""
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        row = cursor.fetchone()
+
+    plan = row[0] if row else None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (TypeError, LookupError, ValueError):
+        return None
+
+
+def _cached_count(queryset):
+    """필터 시그니처(SQL + 파라미터)별로 정확한 COUNT를 TTL 동안 캐시."""
+    sql, params = queryset.query.sql_with_params()
+    signature = hashlib.sha1(f"{queryset.db}|{sql}|{params!r}".encode()).hexdigest()
+    key = f"{COUNT_CACHE_PREFIX}:{signature}"
+
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, settings.PAGINATION_COUNT_CACHE_TTL)
+    return count
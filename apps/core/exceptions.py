@@ -45,6 +45,9 @@ def _get_error_code(exc, response):
             "method_not_allowed": "METHOD_NOT_ALLOWED",
             "throttled": "THROTTLED",
             "parse_error": "VALIDATION_ERROR",
+            "payload_too_large": "PAYLOAD_TOO_LARGE",
+            "conflict": "CONFLICT",
+            "unsupported_media_type": "UNSUPPORTED_MEDIA_TYPE",
         }
         if exc_code in code_map_by_exc:
             return code_map_by_exc[exc_code]
@@ -57,6 +60,8 @@ def _get_error_code(exc, response):
         404: "NOT_FOUND",
         405: "METHOD_NOT_ALLOWED",
         409: "CONFLICT",
+        413: "PAYLOAD_TOO_LARGE",
+        415: "UNSUPPORTED_MEDIA_TYPE",
         429: "THROTTLED",
     }
     return code_map.get(status_code, "SERVER_ERROR")
@@ -116,3 +121,19 @@ class BusinessLogicError(APIException):
         if code:
             self.default_code = code
         super().__init__(detail=detail)
+
+
+class PayloadTooLarge(APIException):
+    """요청 본문/업로드 크기 또는 개수 제한 초과 (413)."""
+
+    status_code = 413
+    default_detail = "요청 크기가 너무 큽니다."
+    default_code = "payload_too_large"
+
+
+class Conflict(APIException):
+    """현재 리소스 상태와 맞지 않는 요청 (409)."""
+
+    status_code = 409
+    default_detail = "요청이 현재 상태와 충돌합니다."
+    default_code = "conflict"
@@ -0,0 +1,18 @@
+from rest_framework import filters
+
+
+class SearchFilter(filters.SearchFilter):
+    """
+    ?search= 검색 필터 (DEFAULT_FILTER_BACKENDS).
+
+    뷰에 search_backend(queryset, terms) 함수가 있으면 그 색인 검색을 사용하고,
+    없으면 DRF 기본 동작(search_fields icontains)을 따른다.
+      예) ClubViewSet.search_backend = apps.clubs.search.search_clubs
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        backend = getattr(view, "search_backend", None)
+        terms = self.get_search_terms(request)
+        if backend is None or not terms:
+            return super().filter_queryset(request, queryset, view)
+        return backend(queryset, terms)
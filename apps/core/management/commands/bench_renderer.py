@@ -0,0 +1,110 @@
+"""
+API 응답 렌더링 벤치마크.
+
+파일 목록 응답과 같은 형태의 N행 페이로드를
+- drf: 봉투 dict로 감싼 뒤 DRF JSONRenderer (표준 json, 기존 방식)
+- api: ApiRenderer (orjson 설치 시 orjson, 봉투는 바이트로 이어 붙임)
+두 방식으로 렌더링해 지연을 비교하고, 출력이 바이트 단위로 같은지 확인한다.
+
+사용법:
+    python manage.py bench_renderer                       # 100행, 200회
+    python manage.py bench_renderer --rows 5000 --repeat 20
+"""
+import datetime
+import decimal
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from apps.core import renderers
+from apps.core.renderers import ApiRenderer
+
+
+def build_payload(rows):
+    """파일 목록 페이지 응답 형태 (UploadedFileSerializer + 페이지네이션)."""
+    now = datetime.datetime(2026, 3, 2, 9, 30, tzinfo=datetime.timezone.utc)
+    content = [
+        {
+            "id": i,
+            "originalName": f"영수증_{i:05d}.jpg",
+            "s3Key": f"uploads/2026/03/{uuid.UUID(int=i).hex}.jpg",
+            "url": f"http://localhost:8000/media/uploads/2026/03/{i}.jpg",
+            "size": 180_000 + i,
+            "mimeType": "image/jpeg",
+            "category": "RECEIPT",
+            "uploadedAt": (now + datetime.timedelta(seconds=i)).isoformat(),
+            "ocrStatus": "DONE",
+            "ocrResult": {
+                "vendor": "동네마트 본점",
+                "date": "2026-03-02",
+                "total": 12_500 + i,
+                "tax": 1_136,
+                "items": [{"name": "생수 2L", "qty": 3, "price": 1_200}] * 3,
+                "text": "동네마트 본점\n생수 2L x3 3,600\n합계 12,500",
+            },
+            # 직렬화기를 거치지 않은 값 (인코더 기본 처리)
+            "blobId": uuid.UUID(int=i),
+            "checkedAt": now,
+            "ratio": decimal.Decimal("0.25"),
+        }
+        for i in range(rows)
+    ]
+    return {
+        "content": content,
+        "totalElements": rows,
+        "totalPages": 1,
+        "page": 1,
+        "size": rows,
+    }
+
+
+class Command(BaseCommand):
+    help = "ApiRenderer와 DRF JSONRenderer의 응답 렌더링 지연을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100, help="페이로드 행 수")
+        parser.add_argument("--repeat", type=int, default=200, help="반복 횟수")
+
+    def handle(self, *args, **options):
+        payload = build_payload(options["rows"])
+        context = {"response": Response(status=200)}
+        drf, api = JSONRenderer(), ApiRenderer()
+
+        def render_drf():
+            return drf.render(
+                {"success": True, "data": payload, "message": None},
+                renderer_context={},
+            )
+
+        def render_api():
+            return api.render(payload, renderer_context=context)
+
+        expected, actual = render_drf(), render_api()
+        if expected != actual:
+            raise CommandError("ApiRenderer 출력이 JSONRenderer와 다릅니다.")
+
+        engine = "orjson" if renderers.orjson is not None else "json (orjson 미설치)"
+        self.stdout.write(
+            f"인코더: {engine} / {options['rows']}행 ({len(actual):,} bytes)"
+            f" / {options['repeat']}회 — 출력 동일"
+        )
+
+        results = {}
+        for mode, render in (("drf", render_drf), ("api", render_api)):
+            timings = []
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                render()
+                timings.append((time.perf_counter() - started) * 1000)
+            results[mode] = timings
+            self.stdout.write(
+                f"  {mode:<4} median {statistics.median(timings):8.3f}ms"
+                f"  min {min(timings):8.3f}ms"
+            )
+
+        speedup = statistics.median(results["drf"]) / statistics.median(results["api"])
+        self.stdout.write(self.style.SUCCESS(f"ApiRenderer {speedup:.1f}배"))
@@ -134,7 +134,7 @@ class Command(BaseCommand):
     def _reset(self):
         self.stdout.write("기존 시드 데이터 삭제 중...")
         emails = [u["email"] for u in USERS]
-        ClubMember.objects.filter(user__email__in=emails).delete()
+        ClubMember.all_objects.filter(user__email__in=emails).delete()
         club_names = [c["name"] for c in CLUBS]
         Club.all_objects.filter(name__in=club_names).delete()
         User.objects.filter(email__in=emails).delete()
@@ -186,12 +186,21 @@ class Command(BaseCommand):
                 user = user_map.get(email)
                 if user is None:
                     continue
-                _, mem_created = ClubMember.objects.get_or_create(
+                # 소프트 삭제된 멤버십도 (club, user) 유니크에 걸리므로 all_objects로 조회
+                member, mem_created = ClubMember.all_objects.get_or_create(
                     club=club,
                     user=user,
                     defaults={"role": role},
                 )
                 status_tag = "추가" if mem_created else "존재"
+                if not member.is_active:
+                    # 제거된 멤버십 복원
+                    member.is_active = True
+                    member.role = role
+                    member.save(update_fields=["is_active", "role", "updated_at"])
+                    status_tag = "복원"
                 self.stdout.write(
                     f"    [{status_tag}] {user.name} → {club.name} ({role})"
                 )
+
+            club.refresh_member_count()
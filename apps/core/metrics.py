@@ -0,0 +1,104 @@
+"""
+캐시 적중률 카운터.
+
+- HitCounter: 프로세스 로컬. gunicorn 워커별로 따로 집계되며 GET /api/metrics/ 로
+  해당 워커의 값을 조회한다.
+- SharedHitCounter: 캐시(운영은 Redis)에 누적. 웹 요청 밖(process_ocr 워커 등)에서
+  세는 값을 웹 워커의 /api/metrics/에서 볼 수 있다. 카운터를 세는 모듈이 웹 프로세스에서도
+  import되어야 목록에 나온다.
+"""
+import threading
+
+from django.core.cache import cache
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class HitCounter:
+    """캐시 적중/미스 카운터 (스레드 안전)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def snapshot(self):
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hitRate": round(hits / total, 4) if total else None,
+        }
+
+
+class SharedHitCounter:
+    """캐시 키 metrics:{name}:{hits|misses}에 누적하는 적중/미스 카운터 (프로세스 간 공유)."""
+
+    KEY = "metrics:{name}:{field}"
+
+    def __init__(self, name):
+        self.name = name
+        self.keys = {
+            field: self.KEY.format(name=name, field=field)
+            for field in ("hits", "misses")
+        }
+
+    def hit(self):
+        self._incr(self.keys["hits"])
+
+    def miss(self):
+        self._incr(self.keys["misses"])
+
+    def reset(self):
+        cache.delete_many(list(self.keys.values()))
+
+    def snapshot(self):
+        values = cache.get_many(list(self.keys.values()))
+        hits = values.get(self.keys["hits"], 0)
+        misses = values.get(self.keys["misses"], 0)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hitRate": round(hits / total, 4) if total else None,
+        }
+
+    def _incr(self, key):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 키가 없음 — 동시에 다른 프로세스가 먼저 만들었으면 그 값에 더함
+            if not cache.add(key, 1, None):
+                cache.incr(key)
+
+
+def get_counter(name, shared=False):
+    """이름별 카운터 (없으면 생성하여 등록). shared면 SharedHitCounter."""
+    with _registry_lock:
+        if name not in _registry:
+            counter_class = SharedHitCounter if shared else HitCounter
+            _registry[name] = counter_class(name)
+        return _registry[name]
+
+
+def snapshot_all():
+    with _registry_lock:
+        counters = list(_registry.values())
+    return {counter.name: counter.snapshot() for counter in counters}
@@ -0,0 +1,55 @@
+"""
+DB 벤더 중립 마이그레이션 오퍼레이션.
+
+django.contrib.postgres.operations는 import 시 psycopg를 요구하므로,
+SQLite 개발 환경에서도 같은 마이그레이션을 적용할 수 있도록 여기서 구현한다.
+"""
+from django.db import NotSupportedError
+from django.db.migrations import AddIndex
+
+
+class AddIndexConcurrently(AddIndex):
+    """
+    PostgreSQL에서는 CREATE INDEX CONCURRENTLY로 테이블 잠금 없이 인덱스를 생성.
+    그 외 DB에서는 일반 AddIndex와 동일.
+
+    CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로
+    사용하는 마이그레이션에 atomic = False를 지정해야 한다.
+    """
+
+    atomic = False
+
+    def describe(self):
+        return "Concurrently create index %s on field(s) %s of model %s" % (
+            self.index.name,
+            ", ".join(self.index.fields),
+            self.model_name,
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if self._is_postgresql(schema_editor):
+            schema_editor.add_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.add_index(model, self.index)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if self._is_postgresql(schema_editor):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.remove_index(model, self.index)
+
+    def _is_postgresql(self, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return False
+        if schema_editor.connection.in_atomic_block:
+            raise NotSupportedError(
+                "The %s operation cannot be executed inside a transaction "
+                "(set atomic = False on the migration)." % self.__class__.__name__
+            )
+        return True
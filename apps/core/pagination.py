@@ -1,8 +1,231 @@
+import base64
+import binascii
+import json
 from collections import OrderedDict
 
-from rest_framework.pagination import PageNumberPagination
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
 from rest_framework.response import Response
 
+from apps.core.counting import count_queryset
+
+
+class KeysetPagination(BasePagination):
+    """
+    (created_at, id) 키셋(커서) 기반 페이지네이션.
+
+    OFFSET 없이 마지막으로 본 행의 정렬 키 이후만 조회하므로
+    깊은 페이지도 첫 페이지와 같은 비용이 들고 COUNT 쿼리를 실행하지 않는다.
+
+    Query params:
+      - cursor: 이전 응답의 nextCursor / prevCursor (첫 페이지는 빈 값)
+      - size: 페이지당 항목 수 (기본 20, 최대 100)
+
+    응답 data:
+    {
+      "content": [...],
+      "totalElements": null,
+      "totalPages": null,
+      "page": null,
+      "size": 20,
+      "nextCursor": "WzAsIFsiMjAyNi0w...",
+      "prevCursor": null
+    }
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 20
+    page_size_query_param = "size"
+    max_page_size = 100
+    # 마지막 키는 반드시 유일해야 함 (동일 created_at 행 사이의 순서 보장)
+    ordering = ("-created_at", "-id")
+
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    @classmethod
+    def is_requested(cls, request):
+        """요청이 커서 모드를 선택했는지 여부."""
+        return cls.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+
+        position, reverse = self.decode_cursor(request)
+        ordering = self._get_ordering(reverse)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._seek_filter(ordering, position))
+
+        # 한 건을 더 읽어 다음 페이지 존재 여부를 판단
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("content", data),
+                    ("totalElements", None),
+                    ("totalPages", None),
+                    ("page", None),
+                    ("size", self.page_size),
+                    ("nextCursor", self.get_next_cursor()),
+                    ("prevCursor", self.get_previous_cursor()),
+                ]
+            )
+        )
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_next_cursor(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_cursor(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    # ── 커서 인코딩 ─────────────────────────────
+    def encode_cursor(self, obj, reverse):
+        values = []
+        for field_name in self._get_field_names():
+            value = getattr(obj, field_name)
+            values.append(value.isoformat() if hasattr(value, "isoformat") else value)
+        raw = json.dumps([int(reverse), values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        """커서 문자열 → (정렬 키 값 목록 | None, 역방향 여부)."""
+        encoded = request.query_params.get(self.cursor_query_param, "")
+        if not encoded:
+            return None, False
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            reverse, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            field_names = self._get_field_names()
+            if len(values) != len(field_names):
+                raise ValueError
+            position = [
+                self.model._meta.get_field(name).to_python(value)
+                for name, value in zip(field_names, values)
+            ]
+        except (TypeError, ValueError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, bool(reverse)
+
+    # ── 키셋 조건 ───────────────────────────────
+    def _get_field_names(self):
+        return [field.lstrip("-") for field in self.ordering]
+
+    def _get_ordering(self, reverse):
+        if not reverse:
+            return list(self.ordering)
+        return [
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        ]
+
+    def _seek_filter(self, ordering, position):
+        """
+        (a, b) 정렬에서 커서 이후 행 조건.
+
+        예) -created_at, -id  →  created_at < v1 OR (created_at = v1 AND id < v2)
+        """
+        condition = Q()
+        equal_prefix = {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal_prefix, **{f"{name}__{lookup}": value})
+            equal_prefix[name] = value
+        return condition
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "커서 페이지네이션 (첫 페이지는 빈 값, 이후 nextCursor / prevCursor)",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "페이지당 항목 수",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    count_queryset() 전략으로 전체 건수를 구하는 Django Paginator.
+
+    건수가 근사값이면 추정치보다 실제 행이 더 많을 수 있으므로
+    마지막 페이지 번호 검증과 마지막 페이지 잘라내기를 하지 않는다.
+    """
+
+    count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        count, self.count_is_approximate = count_queryset(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.count_is_approximate and int(number) >= 1:
+                return int(number)
+            raise
+
+    def page(self, number):
+        if not self.count_is_approximate:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        return self._get_page(self.object_list[bottom:top], number, self)
+
 
 class CustomPageNumberPagination(PageNumberPagination):
     """
@@ -11,6 +234,7 @@ class CustomPageNumberPagination(PageNumberPagination):
     Query params:
       - page: 페이지 번호 (1-based, 기본 1)
       - size: 페이지당 항목 수 (기본 20, 최대 100)
+      - cursor: 지정하면 KeysetPagination(커서 모드)으로 전환
 
     응답 data:
     {
@@ -18,9 +242,13 @@ class CustomPageNumberPagination(PageNumberPagination):
       "totalElements": 100,
       "totalPages": 5,
       "page": 1,
-      "size": 20
+      "size": 20,
+      "totalApproximate": false
     }
 
+    totalElements / totalPages는 PAGINATION_EXACT_COUNT_THRESHOLD 초과 시
+    근사값이 될 수 있으며, 이때 totalApproximate가 true (apps.core.counting 참고).
+
     NOTE: ApiRenderer가 이 응답을 다시 {"success": true, "data": {...}} 로 감쌈.
     """
 
@@ -28,8 +256,22 @@ class CustomPageNumberPagination(PageNumberPagination):
     page_size_query_param = "size"
     max_page_size = 100
     page_query_param = "page"
+    django_paginator_class = EstimatedCountPaginator
+
+    keyset_pagination_class = KeysetPagination
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.keyset_pagination_class.is_requested(request):
+            self.keyset = self.keyset_pagination_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+
         return Response(
             OrderedDict(
                 [
@@ -38,10 +280,18 @@ class CustomPageNumberPagination(PageNumberPagination):
                     ("totalPages", self.page.paginator.num_pages),
                     ("page", self.page.number),
                     ("size", self.get_page_size(self.request) or self.page_size),
+                    ("totalApproximate", self.page.paginator.count_is_approximate),
                 ]
             )
         )
 
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        keyset_parameters = (
+            self.keyset_pagination_class().get_schema_operation_parameters(view)
+        )
+        return parameters + keyset_parameters[:1]
+
     def get_paginated_response_schema(self, schema):
         """drf-spectacular용 스키마."""
         return {
@@ -51,17 +301,20 @@ class CustomPageNumberPagination(PageNumberPagination):
                 "content": schema,
                 "totalElements": {
                     "type": "integer",
-                    "description": "전체 항목 수",
+                    "nullable": True,
+                    "description": "전체 항목 수 (커서 모드에서는 null)",
                     "example": 100,
                 },
                 "totalPages": {
                     "type": "integer",
-                    "description": "전체 페이지 수",
+                    "nullable": True,
+                    "description": "전체 페이지 수 (커서 모드에서는 null)",
                     "example": 5,
                 },
                 "page": {
                     "type": "integer",
-                    "description": "현재 페이지 (1-based)",
+                    "nullable": True,
+                    "description": "현재 페이지 (1-based, 커서 모드에서는 null)",
                     "example": 1,
                 },
                 "size": {
@@ -69,5 +322,20 @@ class CustomPageNumberPagination(PageNumberPagination):
                     "description": "페이지당 항목 수",
                     "example": 20,
                 },
+                "totalApproximate": {
+                    "type": "boolean",
+                    "description": "totalElements / totalPages가 근사값인지 여부",
+                    "example": False,
+                },
+                "nextCursor": {
+                    "type": "string",
+                    "nullable": True,
+                    "description": "다음 페이지 커서 (커서 모드 전용)",
+                },
+                "prevCursor": {
+                    "type": "string",
+                    "nullable": True,
+                    "description": "이전 페이지 커서 (커서 모드 전용)",
+                },
             },
         }
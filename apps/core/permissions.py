@@ -1,5 +1,67 @@
 from rest_framework.permissions import BasePermission
 
+# apps.accounts.authz 클레임 키 (순환 import 방지를 위해 값으로 정의)
+CLAIM_ROLE = "role"
+CLAIM_CLUBS = "clubs"
+
+
+def _get_authz_claims(request):
+    """
+    검증된 권한 클레임 (없으면 None).
+
+    authz 버전 검사를 수행하는 인증(provides_authz_claims)을 통과한 토큰만 신뢰한다.
+    """
+    authenticator = getattr(request, "successful_authenticator", None)
+    if not getattr(authenticator, "provides_authz_claims", False):
+        return None
+    token = getattr(request, "auth", None)
+    if token is None or CLAIM_CLUBS not in token:
+        return None
+    return token
+
+
+def _get_cached_authz(request):
+    """서버 측 권한 캐시의 (역할, {동아리 ID: 멤버 역할}) — 요청 단위로 재사용."""
+    if not hasattr(request, "_authz_entry"):
+        # 순환 import 방지를 위해 함수 내부에서 import
+        from apps.accounts.authz import get_cached_authz
+
+        request._authz_entry = get_cached_authz(request.user.pk)
+    return request._authz_entry
+
+
+def get_user_role(request):
+    """
+    요청 사용자의 전역 역할 (STUDENT / LEADER / ADMIN).
+
+    조회 순서: 검증된 토큰 클레임 → 버전 키 권한 캐시 → 사용자 객체
+    """
+    claims = _get_authz_claims(request)
+    if claims is not None:
+        return claims[CLAIM_ROLE]
+    entry = _get_cached_authz(request)
+    if entry is not None:
+        return entry[0]
+    return request.user.role
+
+
+def get_club_role(request, club_id):
+    """요청 사용자의 해당 동아리 멤버 역할 (LEADER / MEMBER), 멤버가 아니면 None."""
+    claims = _get_authz_claims(request)
+    if claims is not None:
+        return claims[CLAIM_CLUBS].get(str(club_id))
+    entry = _get_cached_authz(request)
+    if entry is not None:
+        return entry[1].get(str(club_id))
+    return None
+
+
+def is_admin_or_club_leader(request, club_id):
+    """관리자이거나 해당 동아리의 리더인지 여부."""
+    if get_user_role(request) == "ADMIN":
+        return True
+    return get_club_role(request, club_id) == "LEADER"
+
 
 class IsAdmin(BasePermission):
     """관리자(ADMIN) 역할만 접근 허용."""
@@ -10,7 +72,7 @@ class IsAdmin(BasePermission):
         return (
             request.user
             and request.user.is_authenticated
-            and request.user.role == "ADMIN"
+            and get_user_role(request) == "ADMIN"
         )
 
 
@@ -23,7 +85,7 @@ class IsLeader(BasePermission):
         return (
             request.user
             and request.user.is_authenticated
-            and request.user.role == "LEADER"
+            and get_user_role(request) == "LEADER"
         )
 
 
@@ -36,7 +98,7 @@ class IsLeaderOrAdmin(BasePermission):
         return (
             request.user
             and request.user.is_authenticated
-            and request.user.role in ("LEADER", "ADMIN")
+            and get_user_role(request) in ("LEADER", "ADMIN")
         )
 
 
@@ -57,7 +119,7 @@ class IsClubMember(BasePermission):
             return False
 
         # 관리자는 모든 동아리에 접근 가능
-        if user.role == "ADMIN":
+        if get_user_role(request) == "ADMIN":
             return True
 
         club_pk = (
@@ -68,10 +130,4 @@ class IsClubMember(BasePermission):
         if club_pk is None:
             return False
 
-        # 순환 import 방지를 위해 함수 내부에서 import
-        from apps.clubs.models import ClubMember
-
-        return ClubMember.objects.filter(
-            club_id=club_pk,
-            user=user,
-        ).exists()
+        return get_club_role(request, club_pk) is not None
@@ -1,5 +1,47 @@
+import json
+import re
+
+from rest_framework.compat import SHORT_SEPARATORS
 from rest_framework.renderers import JSONRenderer
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 — 표준 json 인코더만 사용
+    orjson = None
+
+# 정상 응답 봉투의 앞뒤 — data만 인코딩해 이어 붙인다 (래핑 dict를 만들지 않음)
+ENVELOPE_HEAD = b'{"success":true,"data":'
+ENVELOPE_TAIL = b',"message":null}'
+
+# DRF JSONEncoder와 같이 UTC는 Z로, dict 키는 문자열로 변환
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+# orjson과 표준 json의 실수 표기가 다른 경우 (1e16 ↔ 1e+16, 1e-7 ↔ 1e-07,
+# 0.00001 ↔ 1e-05)의 후보. 리터럴로 시작해야 re가 빠르게 훑는다.
+FLOAT_CANDIDATE_RE = re.compile(rb"e(?:\d|-\d(?:[,\]}]|\Z))|\.0000\d")
+
+
+def has_float_mismatch(content):
+    """
+    orjson 출력에 표준 json과 표기가 다른 실수가 있는지.
+
+    후보 앞이 숫자 토큰(`:` `,` `[` 뒤에서 시작)일 때만 실수로 본다 —
+    UUID hex 같은 문자열 속 `0e1`은 건너뛴다. 문자열 안에서 드물게 걸려도
+    표준 json 경로로 갈 뿐 결과는 같다.
+    """
+    for match in FLOAT_CANDIDATE_RE.finditer(content):
+        end = start = match.start()
+        while start > 0 and content[start - 1] in b"0123456789.-":
+            start -= 1
+        if start > 0 and content[start - 1] not in b":,[":
+            continue
+        token = content[start:end]
+        if content[end] == ord("e") and token[-1:].isdigit():
+            return True
+        if token in (b"0", b"-0"):
+            return True
+    return False
+
 
 class ApiRenderer(JSONRenderer):
     """
@@ -18,6 +60,11 @@ class ApiRenderer(JSONRenderer):
       "data": null,
       "error": { "code": "...", "detail": "..." }
     }
+
+    들여쓰기 없는 응답(기본)은 orjson이 설치되어 있으면 orjson으로 인코딩한다.
+    출력은 JSONRenderer와 바이트 단위로 같다 — 다를 수 있는 값(지수 표기 실수,
+    64비트를 넘는 정수, orjson이 처리하지 못하는 타입의 오류)은 표준 json으로
+    다시 인코딩한다. 단, NaN / Infinity는 null이 된다 (유효한 JSON이 아님).
     """
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
@@ -26,17 +73,21 @@ class ApiRenderer(JSONRenderer):
         if response is None:
             return super().render(data, accepted_media_type, renderer_context)
 
-        # 204 No Content — 빈 바디
-        if response.status_code == 204:
+        # 204 No Content / 304 Not Modified — 빈 바디
+        if response.status_code in (204, 304):
             return b""
 
+        compact = self.is_compact(accepted_media_type, renderer_context)
+
         # 에러 응답: custom_exception_handler 또는 뷰에서 직접 구성한 경우
         if response.status_code >= 400:
             # 이미 {"success": false, ...} 형태이면 그대로
             if isinstance(data, dict) and "success" in data:
-                return super().render(data, accepted_media_type, renderer_context)
+                return self._render(
+                    data, compact, accepted_media_type, renderer_context
+                )
             # 아니면 (직접 Response로 에러를 보낸 경우) 래핑
-            return super().render(
+            return self._render(
                 {
                     "success": False,
                     "data": None,
@@ -45,18 +96,58 @@ class ApiRenderer(JSONRenderer):
                         "detail": data,
                     },
                 },
+                compact,
                 accepted_media_type,
                 renderer_context,
             )
 
         # 이미 래핑된 응답이면 다시 래핑하지 않음
         if isinstance(data, dict) and "success" in data and "data" in data:
-            return super().render(data, accepted_media_type, renderer_context)
+            return self._render(data, compact, accepted_media_type, renderer_context)
 
         # 정상 응답 래핑
+        if compact:
+            return ENVELOPE_HEAD + self.encode(data) + ENVELOPE_TAIL
         wrapped = {
             "success": True,
             "data": data,
             "message": None,
         }
         return super().render(wrapped, accepted_media_type, renderer_context)
+
+    def is_compact(self, accepted_media_type, renderer_context):
+        """들여쓰기 없는 compact 출력인지 (?indent / Accept의 indent 파라미터가 없을 때)."""
+        return (
+            self.compact
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
+
+    def _render(self, data, compact, accepted_media_type, renderer_context):
+        if compact:
+            return self.encode(data)
+        return super().render(data, accepted_media_type, renderer_context)
+
+    def encode(self, data):
+        """compact JSON 바이트 (JSONRenderer와 동일) — orjson 우선, 안 되면 표준 json."""
+        if orjson is not None and not self.ensure_ascii:
+            try:
+                ret = orjson.dumps(
+                    data, default=self.encoder_class().default, option=ORJSON_OPTIONS
+                )
+            except orjson.JSONEncodeError:
+                ret = None
+            if ret is not None and not has_float_mismatch(ret):
+                # JSONRenderer와 같이 U+2028 / U+2029는 이스케이프
+                return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                    b"\xe2\x80\xa9", b"\\u2029"
+                )
+
+        ret = json.dumps(
+            data,
+            cls=self.encoder_class,
+            ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict,
+            separators=SHORT_SEPARATORS,
+        )
+        ret = ret.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+        return ret.encode()
@@ -0,0 +1,174 @@
+"""
+변경분 동기화 — 마지막 동기화 이후 바뀐 행만 돌려준다.
+
+BaseModel.updated_at 순 (updated_at, id) 키셋으로 읽고, 소프트 삭제된 행(is_active=False)도
+all_objects로 함께 읽어 삭제 표시(tombstone)로 돌려준다. 각 모델의 (updated_at, id)
+인덱스 범위 스캔이므로 전체 행 수가 아니라 바뀐 행 수만큼만 읽는다.
+
+Query params:
+  - since: 이전 응답의 nextSince 또는 ISO 8601 시각 (없으면 전체 — 삭제 표시 제외)
+  - size: 최대 항목 수 (기본 100, 최대 500)
+
+응답 data:
+{
+  "changes": [...],       # 생성/수정된 행 (목록 API와 같은 형태)
+  "deleted": [...],       # 삭제된 행의 식별자
+  "nextSince": "WyIy...", # 다음 요청의 since
+  "hasMore": false        # true면 nextSince로 바로 이어서 요청
+}
+
+updated_at은 저장 시점에 기록되므로 늦게 커밋된 트랜잭션의 행이 이미 지나간 위치에
+나타날 수 있다. 최근 SYNC_SETTLE_SECONDS 이내에 바뀐 행은 다음 동기화로 미룬다.
+
+bulk_update / update()로 응답 필드를 바꾸는 경로는 updated_at도 함께 갱신해야 한다.
+"""
+import base64
+import binascii
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import _positive_int
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+invalid_since_message = "유효하지 않은 since 값입니다."
+
+
+def encode_position(updated_at, pk):
+    raw = json.dumps([updated_at.isoformat(), pk], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_position(value):
+    """
+    since → (시각, id | None). id가 None이면 그 시각 '이후'(초과)만.
+
+    이전 응답의 nextSince 토큰 또는 ISO 8601 시각을 받는다.
+    """
+    updated_at = parse_datetime(value)
+    if updated_at is not None:
+        if timezone.is_naive(updated_at):
+            updated_at = timezone.make_aware(updated_at)
+        return updated_at, None
+
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        raw_time, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        updated_at = parse_datetime(raw_time)
+        if updated_at is None or not (pk is None or isinstance(pk, int)):
+            raise ValueError
+    except (TypeError, ValueError, binascii.Error):
+        raise ValidationError({"since": invalid_since_message})
+    return updated_at, pk
+
+
+def changed_rows(queryset, since, size, active=Q(is_active=True)):
+    """
+    since 이후 바뀐 행 (updated_at, id 순, 최대 size개).
+
+    since가 없으면(전체) active 조건을 만족하는 행만 — 삭제 표시는 보내지 않는다.
+
+    Returns:
+        (행 목록, 다음 위치 (시각, id | None), 남은 행 존재 여부)
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+    queryset = queryset.filter(updated_at__lte=cutoff).order_by("updated_at", "id")
+    if since is None:
+        queryset = queryset.filter(active)
+    else:
+        updated_at, pk = since
+        condition = Q(updated_at__gt=updated_at)
+        if pk is not None:
+            condition |= Q(updated_at=updated_at, id__gt=pk)
+        queryset = queryset.filter(condition)
+
+    rows = list(queryset[: size + 1])
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if has_more:
+        position = (rows[-1].updated_at, rows[-1].pk)
+    else:
+        # cutoff까지는 모두 내려줬으므로 다음에는 cutoff 이후만 읽음
+        position = (cutoff, None)
+    return rows, position, has_more
+
+
+class SyncView(APIView):
+    """
+    변경분 동기화 뷰 기반 클래스.
+
+    하위 클래스: serializer_class, get_queryset() (all_objects 기반 — 삭제 표시 포함),
+    필요하면 get_tombstone() / get_active_filter() + is_deleted()
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = None
+    page_size = 100
+    page_size_query_param = "size"
+    max_page_size = 500
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get_tombstone(self, obj):
+        """삭제된 행의 식별자."""
+        return {"id": obj.pk}
+
+    def get_active_filter(self):
+        """살아 있는 행의 조건 (전체 동기화에서 사용)."""
+        return Q(is_active=True)
+
+    def is_deleted(self, obj):
+        """삭제 표시로 보낼 행인지 (get_active_filter()의 반대)."""
+        return not obj.is_active
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "since",
+                str,
+                description="이전 응답의 nextSince 또는 ISO 8601 시각 (없으면 전체)",
+            ),
+            OpenApiParameter("size", int, description="최대 항목 수 (최대 500)"),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        since = request.query_params.get("since")
+        since = decode_position(since) if since else None
+        rows, (updated_at, pk), has_more = changed_rows(
+            self.get_queryset(),
+            since,
+            self.get_page_size(request),
+            active=self.get_active_filter(),
+        )
+        changes = [obj for obj in rows if not self.is_deleted(obj)]
+        serializer = self.serializer_class(
+            changes, many=True, context={"request": request, "view": self}
+        )
+        return Response(
+            {
+                "changes": serializer.data,
+                "deleted": [
+                    self.get_tombstone(obj) for obj in rows if self.is_deleted(obj)
+                ],
+                "nextSince": encode_position(updated_at, pk),
+                "hasMore": has_more,
+            }
+        )
@@ -0,0 +1,30 @@
+"""
+테스트 공용 도우미.
+
+- QueryPlanTestMixin: EXPLAIN 결과로 쿼리가 특정 인덱스를 타는지 확인
+"""
+from django.db import connection, transaction
+
+
+class QueryPlanTestMixin:
+    """
+    TestCase 믹스인 — assertUsesIndex(queryset, index_name).
+
+    SQLite(로컬 / CI)와 PostgreSQL(운영)의 실행 계획만 해석하고 그 외 백엔드는 skip.
+    PostgreSQL은 테스트 테이블이 거의 비어 있어 순차 스캔 + 정렬이 더 싸게 나오므로,
+    이 트랜잭션에서 seqscan / sort / bitmap scan을 꺼 정렬 순서를 그대로 주는
+    인덱스 스캔 중에서 고르게 한다 (어느 인덱스를 고르는지가 검증 대상).
+    """
+
+    def assertUsesIndex(self, queryset, index_name):
+        if connection.vendor == "sqlite":
+            plan = queryset.explain()
+        elif connection.vendor == "postgresql":
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute("SET LOCAL enable_sort = off")
+                cursor.execute("SET LOCAL enable_bitmapscan = off")
+                plan = queryset.explain()
+        else:
+            self.skipTest(f"{connection.vendor} 실행 계획은 해석하지 않음")
+        self.assertIn(index_name, plan, msg=f"{index_name} 미사용:\n{plan}")
@@ -0,0 +1,19 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.core.metrics import snapshot_all
+from apps.core.permissions import IsAdmin
+
+
+# ──────────────────────────────────────────────
+# 캐시 적중률 (현재 워커 프로세스 기준, 공유 카운터는 전체 누적)
+# ──────────────────────────────────────────────
+class MetricsView(APIView):
+    """GET /api/metrics/ — 캐시별 hits / misses / hitRate (Admin)."""
+
+    permission_classes = [IsAdmin]
+
+    @extend_schema(summary="캐시 적중률 조회 (Admin)")
+    def get(self, request):
+        return Response(snapshot_all())
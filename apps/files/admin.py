@@ -1,7 +1,8 @@
 from django.contrib import admin
 from django.template.defaultfilters import filesizeformat
+from django.utils import timezone
 
-from apps.files.models import UploadedFile
+from apps.files.models import FileBlob, OcrResultCache, UploadedFile, UploadSession
 
 
 @admin.register(UploadedFile)
@@ -15,11 +16,71 @@ class UploadedFileAdmin(admin.ModelAdmin):
         "is_active",
         "created_at",
     )
-    list_filter = ("category", "is_active", "club")
+    list_filter = ("category", "ocr_status", "is_active", "club")
     search_fields = ("original_name", "uploaded_by__name", "club__name")
     raw_id_fields = ("uploaded_by", "club")
-    readonly_fields = ("file", "original_name", "size", "mime_type", "ocr_result")
+    actions = ["requeue_ocr"]
+    readonly_fields = (
+        "file",
+        "original_name",
+        "size",
+        "mime_type",
+        "content_hash",
+        "blob",
+        "ocr_result",
+        "ocr_status",
+        "ocr_attempts",
+        "ocr_available_at",
+        "ocr_error",
+    )
 
     @admin.display(description="파일 크기")
     def get_size_display(self, obj):
         return filesizeformat(obj.size)
+
+    @admin.action(description="선택한 영수증 OCR 다시 처리")
+    def requeue_ocr(self, request, queryset):
+        count = queryset.filter(category=UploadedFile.Category.RECEIPT).update(
+            updated_at=timezone.now(),
+            ocr_status=UploadedFile.OcrStatus.PENDING,
+            ocr_attempts=0,
+            ocr_available_at=timezone.now(),
+            ocr_error="",
+        )
+        self.message_user(request, f"{count}개 영수증을 OCR 대기열에 넣었습니다.")
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    list_display = (
+        "original_name",
+        "category",
+        "uploaded_by",
+        "offset",
+        "size",
+        "is_active",
+        "updated_at",
+    )
+    list_filter = ("category", "is_active")
+    search_fields = ("original_name", "uploaded_by__name")
+    raw_id_fields = ("uploaded_by", "club", "uploaded_file")
+    readonly_fields = ("size", "offset", "chunk_count")
+
+
+@admin.register(FileBlob)
+class FileBlobAdmin(admin.ModelAdmin):
+    list_display = ("sha256", "get_size_display", "ref_count", "created_at")
+    search_fields = ("sha256",)
+    readonly_fields = ("sha256", "file", "size", "ref_count", "created_at")
+
+    @admin.display(description="파일 크기")
+    def get_size_display(self, obj):
+        return filesizeformat(obj.size)
+
+
+@admin.register(OcrResultCache)
+class OcrResultCacheAdmin(admin.ModelAdmin):
+    list_display = ("content_hash", "engine_version", "hit_count", "created_at")
+    list_filter = ("engine_version",)
+    search_fields = ("content_hash",)
+    readonly_fields = ("content_hash", "engine_version", "result", "hit_count")
@@ -5,3 +5,7 @@ class FilesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.files"
     verbose_name = "Files"
+
+    def ready(self):
+        # ocr: /api/metrics/에 OCR 캐시 카운터(공유 캐시 누적)를 등록 — 웹 요청은 ocr을 쓰지 않음
+        from apps.files import ocr, signals  # noqa: F401
@@ -0,0 +1,164 @@
+"""
+내용 주소(content-addressed) 블롭 저장소.
+
+같은 바이트는 blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}{ext} 키에 한 번만 저장하고
+FileBlob.ref_count로 참조하는 활성 UploadedFile 수를 센다.
+
+- acquire_blob(): 참조 획득 (없으면 저장 후 생성) — 호출자 트랜잭션 안에서
+- acquire_blobs(): 여러 블롭 참조를 고정된 쿼리 수로 한 번에 획득 (다중 업로드용)
+- release_blob(): 참조 해제, 마지막 참조면 커밋 후 객체와 행 삭제
+- write_blob(): 키가 비어 있을 때만 바이트 저장 (같은 키 = 같은 내용)
+
+확장자는 처음 올라온 파일명을 따른다 (스토리지/브라우저의 Content-Type 추정용).
+
+참조 증가는 UPDATE ... ref_count + n 이고 삭제는 행을 잠근 뒤 ref_count = 0을 확인하고
+처리하므로, 삭제 중인 블롭을 동시에 재사용하려는 요청은 잠금이 풀린 뒤 행이 없는 것을
+보고 객체를 다시 저장한다. 삭제 전에 참조가 다시 늘면 객체와 행은 그대로 재사용된다.
+"""
+import hashlib
+import os
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from apps.files.models import FileBlob
+
+HASH_BLOCK_SIZE = 64 * 1024
+
+
+def blob_name(digest, filename=""):
+    ext = os.path.splitext(filename)[1].lower()
+    return f"blobs/{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+
+def hash_file(f):
+    """파일 객체 전체의 SHA-256 (chunks()로 읽음)."""
+    hasher = hashlib.sha256()
+    for chunk in f.chunks(HASH_BLOCK_SIZE):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def existing_digests(digests):
+    return set(
+        FileBlob.objects.filter(sha256__in=list(digests)).values_list(
+            "sha256", flat=True
+        )
+    )
+
+
+def write_blob(storage, name, save):
+    """
+    블롭 키 name에 save(name)으로 바이트 저장.
+
+    키가 이미 있으면 내용이 같으므로 쓰지 않고 False 반환.
+    save가 (동시 저장으로) 다른 이름에 썼다면 그 사본은 지운다.
+    """
+    if storage.exists(name):
+        return False
+    stored = save(name)
+    if stored != name:
+        storage.delete(stored)
+    return True
+
+
+def acquire_blob(storage, digest, size, save, count=1, filename=""):
+    """
+    digest 블롭의 참조 count개 획득 (호출자의 transaction.atomic 안에서 호출).
+
+    행이 없으면 write_blob으로 바이트를 저장(이미 있으면 생략)하고 행을 만든다.
+    """
+    updated = FileBlob.objects.filter(sha256=digest).update(
+        ref_count=F("ref_count") + count
+    )
+    if not updated:
+        name = blob_name(digest, filename)
+        write_blob(storage, name, save)
+        try:
+            with transaction.atomic():
+                return FileBlob.objects.create(
+                    sha256=digest, file=name, size=size, ref_count=count
+                )
+        except IntegrityError:
+            # 다른 요청이 같은 내용을 동시에 먼저 등록
+            FileBlob.objects.filter(sha256=digest).update(
+                ref_count=F("ref_count") + count
+            )
+    return FileBlob.objects.get(sha256=digest)
+
+
+def acquire_blobs(storage, entries, stored):
+    """
+    여러 블롭의 참조를 한 번에 획득 (호출자의 transaction.atomic 안에서 호출).
+
+    Args:
+        entries: {digest: (name, size, count, save)}
+        stored: 바이트가 방금 name에 저장된(또는 이미 있던) digest — 나머지는
+            조회 시점에 이미 등록돼 있던 블롭
+
+    Returns:
+        {digest: FileBlob}
+
+    INSERT(충돌 무시) → count별 UPDATE → 조회로 처리하고, 그 사이 다른 요청이
+    마지막 참조를 지워 행이 사라진 블롭만 acquire_blob으로 다시 저장한다.
+    """
+    FileBlob.objects.bulk_create(
+        [
+            FileBlob(sha256=digest, file=name, size=size, ref_count=0)
+            for digest, (name, size, _, _) in entries.items()
+            if digest in stored
+        ],
+        ignore_conflicts=True,
+    )
+
+    by_count = {}
+    for digest, (_, _, count, _) in sorted(entries.items()):
+        by_count.setdefault(count, []).append(digest)
+    for count, digests in by_count.items():
+        FileBlob.objects.filter(sha256__in=digests).update(
+            ref_count=F("ref_count") + count
+        )
+
+    blobs = FileBlob.objects.in_bulk(list(entries), field_name="sha256")
+    for digest, (name, size, count, save) in entries.items():
+        if digest not in blobs:
+            blobs[digest] = acquire_blob(
+                storage, digest, size, save, count=count, filename=name
+            )
+    return blobs
+
+
+def release_blob(blob_id):
+    """
+    참조 하나 해제. 마지막 참조였으면 커밋 후 스토리지 객체와 행을 삭제.
+
+    바깥 트랜잭션이 롤백되면 바이트도 그대로 남아야 하므로 여기서는 ref_count만
+    내리고, 삭제는 transaction.on_commit에서 그때도 참조가 0일 때만 한다.
+    """
+    with transaction.atomic():
+        blob = FileBlob.objects.select_for_update().filter(pk=blob_id).first()
+        if blob is None or blob.ref_count < 1:
+            return
+        FileBlob.objects.filter(pk=blob_id).update(ref_count=F("ref_count") - 1)
+        if blob.ref_count == 1:
+            transaction.on_commit(lambda: _delete_unreferenced_blob(blob_id))
+
+
+def _delete_unreferenced_blob(blob_id):
+    """참조가 0인 블롭의 객체와 행 삭제 (그 사이 다시 참조됐으면 건너뜀)."""
+    with transaction.atomic():
+        blob = (
+            FileBlob.objects.select_for_update().filter(pk=blob_id, ref_count=0).first()
+        )
+        if blob is None:
+            return
+        blob.file.delete(save=False)
+        blob.delete()
+
+
+def discard_unreferenced(storage, names):
+    """보상 처리 — 방금 저장했지만 등록되지 못한 블롭 객체 삭제 ({digest: name})."""
+    registered = existing_digests(names)
+    for digest, name in names.items():
+        if digest not in registered:
+            storage.delete(name)
@@ -1,6 +1,7 @@
 from django_filters import rest_framework as filters
 
 from apps.files.models import UploadedFile
+from apps.files.search import search_files
 
 
 class FileFilterSet(filters.FilterSet):
@@ -10,11 +11,20 @@ class FileFilterSet(filters.FilterSet):
     Query params:
       - club: 동아리 ID (exact match)
       - category: 파일 카테고리 (exact match)
+      - q: 파일명 / 영수증 거래처·본문 검색 (관련도순, apps.files.search)
     """
 
     club = filters.NumberFilter(field_name="club_id")
     category = filters.ChoiceFilter(choices=UploadedFile.Category.choices)
+    q = filters.CharFilter(method="filter_q")
 
     class Meta:
         model = UploadedFile
-        fields = ["club", "category"]
+        fields = ["club", "category", "q"]
+
+    def filter_q(self, queryset, name, value):
+        if not value.strip():
+            return queryset
+        return search_files(queryset, value).order_by(
+            "-search_rank", "-created_at", "-id"
+        )
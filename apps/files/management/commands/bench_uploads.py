@@ -0,0 +1,134 @@
+"""
+다중 파일 업로드 저장 벤치마크.
+
+현재 설정된 스토리지(로컬 파일시스템 또는 docker 환경의 MinIO)에 N개 파일 배치를
+- sequential: 파일마다 UploadedFile.objects.create (스토리지 쓰기 + INSERT 반복)
+- parallel  : POST /api/files/upload/ 요청을 FileUploadView로 처리
+              (StorageUploadHandler 스트리밍 + 요청 제한 검사 + 스레드 풀 이동 + bulk_create)
+두 방식으로 저장하고 배치 지연을 비교한다. parallel은 multipart 파싱까지 포함하므로
+뷰의 파일 수 / 요청 크기 제한(MAX_UPLOAD_FILES, MAX_UPLOAD_REQUEST_SIZE)에 걸리면
+실패한다. 만든 행과 객체는 끝나면 삭제.
+
+사용법:
+    python manage.py bench_uploads                       # 50개 × 100KB, 3회
+    python manage.py bench_uploads --files 30 --size-kb 500 --repeat 5
+"""
+import os
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.files.models import UploadedFile
+from apps.files.storage import get_upload_storage
+from apps.files.views import FileUploadView
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "다중 파일 업로드 저장 지연을 순차 방식과 병렬 방식으로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--files", type=int, default=50, help="배치당 파일 수")
+        parser.add_argument("--size-kb", type=int, default=100, help="파일 크기 (KB)")
+        parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+
+    def handle(self, *args, **options):
+        storage = get_upload_storage()
+        self.stdout.write(
+            f"스토리지: {storage.__class__.__name__} / "
+            f"{options['files']}개 × {options['size_kb']}KB / {options['repeat']}회"
+        )
+
+        user, created = User.objects.get_or_create(
+            email="bench-uploads@bench.local",
+            defaults={
+                "name": "bench",
+                "student_id": "bench-uploads",
+                "is_active": False,
+            },
+        )
+        try:
+            results = self._run(storage, user, options)
+        finally:
+            if created:
+                user.delete()
+
+        for mode, timings in results.items():
+            self.stdout.write(
+                f"  {mode:<10} median {statistics.median(timings):8.1f}ms"
+                f"  min {min(timings):8.1f}ms"
+            )
+        speedup = statistics.median(results["sequential"]) / statistics.median(
+            results["parallel"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"병렬 방식 {speedup:.1f}배"))
+
+    def _run(self, storage, user, options):
+        results = {"sequential": [], "parallel": []}
+        for _ in range(options["repeat"]):
+            for mode, prepare in (
+                ("sequential", self._sequential),
+                ("parallel", self._parallel),
+            ):
+                files = [
+                    # 파일마다 다른 내용 (중복 제거로 쓰기가 생략되지 않도록)
+                    SimpleUploadedFile(
+                        f"bench_{i:03d}.bin", os.urandom(options["size_kb"] * 1024)
+                    )
+                    for i in range(options["files"])
+                ]
+                upload = prepare(files, user)
+                started = time.perf_counter()
+                objs = upload()
+                results[mode].append((time.perf_counter() - started) * 1000)
+                self._cleanup(storage, objs)
+        return results
+
+    def _sequential(self, files, user):
+        return lambda: [
+            UploadedFile.objects.create(
+                file=f,
+                original_name=f.name,
+                size=f.size,
+                mime_type="application/octet-stream",
+                category=UploadedFile.Category.GENERAL,
+                uploaded_by=user,
+            )
+            for f in files
+        ]
+
+    def _parallel(self, files, user):
+        # multipart 본문 인코딩은 측정 전에 (요청 생성 시) 끝난다
+        request = APIRequestFactory().post(
+            "/api/files/upload/",
+            {"file": files, "category": UploadedFile.Category.GENERAL},
+            format="multipart",
+            # 응답의 파일 URL(build_absolute_uri)이 ALLOWED_HOSTS 검사를 통과하도록
+            HTTP_HOST=next(
+                (host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"),
+                "localhost",
+            ),
+        )
+        force_authenticate(request, user=user)
+        return lambda: self._upload(request)
+
+    def _upload(self, request):
+        response = FileUploadView.as_view()(request)
+        if response.status_code != 201:
+            raise CommandError(f"업로드 요청 실패 ({response.status_code}): {response.data}")
+        return list(
+            UploadedFile.objects.filter(pk__in=[row["id"] for row in response.data])
+        )
+
+    def _cleanup(self, storage, objs):
+        for obj in objs:
+            storage.delete(obj.file.name)
+        with transaction.atomic():
+            UploadedFile.all_objects.filter(pk__in=[obj.pk for obj in objs]).delete()
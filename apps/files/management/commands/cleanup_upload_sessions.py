@@ -0,0 +1,59 @@
+"""
+방치된 재개 가능 업로드 세션 정리 커맨드.
+
+마지막 청크 이후 RESUMABLE_UPLOAD_EXPIRE_HOURS가 지난 미완료 세션의
+청크 객체와 세션 행을 삭제한다. cron 등으로 주기 실행.
+
+사용법:
+    python manage.py cleanup_upload_sessions              # 만료 세션 삭제
+    python manage.py cleanup_upload_sessions --hours 6    # 기준 시간 지정
+    python manage.py cleanup_upload_sessions --dry-run    # 대상만 출력
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.files.models import UploadSession
+from apps.files.resumable import discard_session
+
+
+class Command(BaseCommand):
+    help = "오래 방치된 미완료 청크 업로드 세션을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours",
+            type=int,
+            default=settings.RESUMABLE_UPLOAD_EXPIRE_HOURS,
+            help="마지막 청크 이후 이 시간이 지난 세션을 삭제합니다.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 대상 목록만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["hours"])
+        expired = list(UploadSession.objects.filter(updated_at__lt=cutoff))
+
+        for session in expired:
+            self.stdout.write(
+                f"  [만료] {session.original_name} (id={session.pk}): "
+                f"{session.offset}/{session.size} bytes"
+            )
+
+        if not expired:
+            self.stdout.write(self.style.SUCCESS("만료된 세션 없음"))
+            return
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{len(expired)}개 세션 만료 (dry-run)"))
+            return
+
+        for session in expired:
+            discard_session(session)
+            session.delete()
+        self.stdout.write(self.style.SUCCESS(f"{len(expired)}개 세션 삭제 완료"))
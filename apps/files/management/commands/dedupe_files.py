@@ -0,0 +1,83 @@
+"""
+기존 업로드 파일을 내용 주소 블롭으로 옮기는 커맨드.
+
+중복 제거 도입 전 업로드(upload_to 경로에 개별 저장)나 presigned 직접 업로드처럼
+blob이 없는 활성 파일을 해시해 블롭에 연결하고, 더 이상 쓰지 않는 원래 객체를 삭제한다.
+
+사용법:
+    python manage.py dedupe_files            # 블롭으로 이전
+    python manage.py dedupe_files --dry-run  # 중복 현황만 출력
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.template.defaultfilters import filesizeformat
+from django.utils import timezone
+
+from apps.files.blobs import acquire_blob, hash_file
+from apps.files.models import UploadedFile
+from apps.files.storage import get_upload_storage
+
+
+class Command(BaseCommand):
+    help = "blob이 없는 업로드 파일을 내용 주소 블롭으로 옮겨 중복을 제거합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="옮기지 않고 중복 현황만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        storage = get_upload_storage()
+        pending = UploadedFile.objects.filter(blob__isnull=True).exclude(file="")
+
+        seen, migrated, saved = set(), 0, 0
+        for obj in pending.iterator():
+            old_name = obj.file.name
+            try:
+                with storage.open(old_name) as fh:
+                    digest = hash_file(fh)
+            except FileNotFoundError:
+                self.stdout.write(
+                    self.style.WARNING(f"  [누락] {obj.original_name} (id={obj.pk})")
+                )
+                continue
+
+            duplicate = digest in seen
+            seen.add(digest)
+            if options["dry_run"]:
+                saved += obj.size if duplicate else 0
+                continue
+
+            def save(name):
+                with storage.open(old_name) as fh:
+                    return storage.save(name, fh)
+
+            with transaction.atomic():
+                blob = acquire_blob(
+                    storage, digest, obj.size, save, filename=obj.original_name
+                )
+                UploadedFile.all_objects.filter(pk=obj.pk).update(
+                    file=blob.file.name,
+                    content_hash=digest,
+                    blob=blob,
+                    updated_at=timezone.now(),
+                )
+            if blob.ref_count > 1:
+                saved += obj.size
+            migrated += 1
+
+            if not UploadedFile.all_objects.filter(file=old_name).exists():
+                storage.delete(old_name)
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(seen)}개 고유 내용, 중복 {filesizeformat(saved)} (dry-run)"
+                )
+            )
+            return
+        self.stdout.write(
+            self.style.SUCCESS(f"{migrated}개 파일 이전 완료, 중복 {filesizeformat(saved)} 절감")
+        )
@@ -0,0 +1,110 @@
+"""
+영수증 OCR 워커.
+
+UploadedFile의 OCR 대기열(apps.files.ocr)에서 작업을 배치로 가져와
+스레드 풀에서 처리한다. 여러 프로세스/컨테이너로 띄워도 작업이 중복되지 않는다.
+SIGTERM/SIGINT를 받으면 진행 중인 배치를 마치고 종료.
+
+사용법:
+    python manage.py process_ocr                  # 계속 실행 (docker-compose ocr-worker)
+    python manage.py process_ocr --once           # 현재 쌓인 작업만 처리하고 종료
+    python manage.py process_ocr --enqueue-existing --once
+                                                  # 기존 영수증을 대기열에 넣고 처리
+    python manage.py process_ocr --purge-stale-cache --once
+                                                  # 엔진 교체 후 이전 버전 캐시 삭제
+"""
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.files.models import UploadedFile
+from apps.files.ocr import (
+    claim_batch,
+    get_engine,
+    ocr_cache_counter,
+    purge_stale_cache,
+    run_batch,
+)
+
+
+class Command(BaseCommand):
+    help = "영수증 OCR 대기열을 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.OCR_BATCH_SIZE,
+            help="한 번에 가져올 작업 수",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.OCR_WORKERS,
+            help="OCR 엔진 병렬 실행 스레드 수",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="처리 가능한 작업이 없으면 대기하지 않고 종료합니다.",
+        )
+        parser.add_argument(
+            "--enqueue-existing",
+            action="store_true",
+            help="OCR 상태가 없는 기존 영수증 파일을 먼저 대기열에 넣습니다.",
+        )
+        parser.add_argument(
+            "--purge-stale-cache",
+            action="store_true",
+            help="현재 엔진 버전이 아닌 OCR 결과 캐시를 먼저 삭제합니다.",
+        )
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        if options["enqueue_existing"]:
+            count = UploadedFile.objects.filter(
+                category=UploadedFile.Category.RECEIPT,
+                ocr_status="",
+                ocr_result__isnull=True,
+            ).update(
+                updated_at=timezone.now(),
+                ocr_status=UploadedFile.OcrStatus.PENDING,
+                ocr_available_at=timezone.now(),
+            )
+            self.stdout.write(f"기존 영수증 {count}개 대기열 등록")
+
+        if options["purge_stale_cache"]:
+            self.stdout.write(f"이전 엔진 버전 캐시 {purge_stale_cache()}개 삭제")
+
+        engine = get_engine()
+        self.stdout.write(
+            f"OCR 워커 시작 (엔진 {engine.name}/{engine.version}, "
+            f"배치 {options['batch_size']}, 스레드 {options['workers']})"
+        )
+
+        while not self.stopping:
+            close_old_connections()
+            batch = claim_batch(options["batch_size"])
+            if not batch:
+                if options["once"]:
+                    break
+                time.sleep(settings.OCR_POLL_INTERVAL_SECONDS)
+                continue
+
+            done, failed = run_batch(batch, options["workers"])
+            self.stdout.write(
+                f"  배치 {len(batch)}개: 완료 {done}, 실패 {failed} "
+                f"(캐시 적중률 {ocr_cache_counter.snapshot()['hitRate']})"
+            )
+
+        self.stdout.write(self.style.SUCCESS("OCR 워커 종료"))
+
+    def _stop(self, signum, frame):
+        self.stopping = True
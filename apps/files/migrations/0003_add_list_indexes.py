@@ -0,0 +1,49 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:41
+
+from django.db import migrations, models
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 인덱스 생성은 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("files", "0002_add_ocr_result"),
+    ]
+
+    operations = [
+        apps.core.operations.AddIndexConcurrently(
+            model_name="uploadedfile",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["club", "category", "-created_at", "-id"],
+                name="file_club_cat_created_idx",
+            ),
+        ),
+        apps.core.operations.AddIndexConcurrently(
+            model_name="uploadedfile",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["club", "-created_at", "-id"],
+                name="file_club_created_idx",
+            ),
+        ),
+        apps.core.operations.AddIndexConcurrently(
+            model_name="uploadedfile",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["category", "-created_at", "-id"],
+                name="file_cat_created_idx",
+            ),
+        ),
+        apps.core.operations.AddIndexConcurrently(
+            model_name="uploadedfile",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-created_at", "-id"],
+                name="file_created_idx",
+            ),
+        ),
+    ]
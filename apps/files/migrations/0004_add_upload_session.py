@@ -0,0 +1,119 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:53
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clubs", "0004_add_club_member_count"),
+        ("files", "0003_add_list_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UploadSession",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        db_index=True, default=True, verbose_name="활성 여부"
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "original_name",
+                    models.CharField(max_length=255, verbose_name="원본 파일명"),
+                ),
+                ("mime_type", models.CharField(max_length=100, verbose_name="MIME 타입")),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("RECEIPT", "영수증"),
+                            ("REPORT", "보고서"),
+                            ("INSPECTION", "점검"),
+                            ("ACHIEVEMENT", "성과물"),
+                            ("GENERAL", "일반"),
+                        ],
+                        default="GENERAL",
+                        max_length=20,
+                        verbose_name="카테고리",
+                    ),
+                ),
+                ("size", models.PositiveBigIntegerField(verbose_name="전체 크기 (bytes)")),
+                (
+                    "offset",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="수신한 크기 (bytes)"
+                    ),
+                ),
+                (
+                    "chunk_count",
+                    models.PositiveIntegerField(default=0, verbose_name="수신한 청크 수"),
+                ),
+                (
+                    "club",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upload_sessions",
+                        to="clubs.club",
+                        verbose_name="동아리",
+                    ),
+                ),
+                (
+                    "uploaded_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upload_sessions",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="업로더",
+                    ),
+                ),
+                (
+                    "uploaded_file",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="upload_session",
+                        to="files.uploadedfile",
+                        verbose_name="완료된 파일",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "업로드 세션",
+                "verbose_name_plural": "업로드 세션",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("is_active", True)),
+                        fields=["updated_at"],
+                        name="uploadsession_updated_idx",
+                    )
+                ],
+            },
+        ),
+    ]
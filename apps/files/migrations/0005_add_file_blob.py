@@ -0,0 +1,66 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("files", "0004_add_upload_session"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FileBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sha256",
+                    models.CharField(
+                        max_length=64, unique=True, verbose_name="SHA-256"
+                    ),
+                ),
+                ("file", models.FileField(upload_to="", verbose_name="파일")),
+                ("size", models.PositiveIntegerField(verbose_name="파일 크기 (bytes)")),
+                (
+                    "ref_count",
+                    models.PositiveIntegerField(default=0, verbose_name="참조 수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "파일 블롭",
+                "verbose_name_plural": "파일 블롭",
+            },
+        ),
+        migrations.AddField(
+            model_name="uploadedfile",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=64, verbose_name="내용 해시 (SHA-256)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadedfile",
+            name="blob",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="uploaded_files",
+                to="files.fileblob",
+                verbose_name="블롭",
+            ),
+        ),
+    ]
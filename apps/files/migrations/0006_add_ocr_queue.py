@@ -0,0 +1,50 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clubs", "0004_add_club_member_count"),
+        ("files", "0005_add_file_blob"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadedfile",
+            name="ocr_attempts",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="OCR 시도 횟수"),
+        ),
+        migrations.AddField(
+            model_name="uploadedfile",
+            name="ocr_available_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="PENDING: 다음 시도 시각 (재시도 대기) / RUNNING: 작업 임대 만료 시각",
+                null=True,
+                verbose_name="OCR 처리 가능 시각",
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadedfile",
+            name="ocr_error",
+            field=models.TextField(blank=True, verbose_name="OCR 오류"),
+        ),
+        migrations.AddField(
+            model_name="uploadedfile",
+            name="ocr_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("PENDING", "대기"),
+                    ("RUNNING", "처리 중"),
+                    ("DONE", "완료"),
+                    ("FAILED", "실패"),
+                ],
+                max_length=10,
+                verbose_name="OCR 상태",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:58
+
+from django.db import migrations, models
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 인덱스 생성은 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("files", "0006_add_ocr_queue"),
+    ]
+
+    operations = [
+        apps.core.operations.AddIndexConcurrently(
+            model_name="uploadedfile",
+            index=models.Index(
+                condition=models.Q(("ocr_status__in", ["PENDING", "RUNNING"])),
+                fields=["ocr_available_at"],
+                name="file_ocr_queue_idx",
+            ),
+        ),
+    ]
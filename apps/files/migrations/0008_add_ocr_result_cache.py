@@ -0,0 +1,48 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("files", "0007_add_ocr_queue_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OcrResultCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(max_length=64, verbose_name="내용 해시 (SHA-256)"),
+                ),
+                (
+                    "engine_version",
+                    models.CharField(max_length=50, verbose_name="엔진 버전"),
+                ),
+                ("result", models.JSONField(verbose_name="OCR 결과")),
+                (
+                    "hit_count",
+                    models.PositiveIntegerField(default=0, verbose_name="재사용 횟수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "OCR 결과 캐시",
+                "verbose_name_plural": "OCR 결과 캐시",
+                "unique_together": {("content_hash", "engine_version")},
+            },
+        ),
+    ]
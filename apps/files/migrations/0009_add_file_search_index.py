@@ -0,0 +1,67 @@
+from django.db import migrations
+
+# apps.files.search의 검색 문서 식과 같아야 인덱스를 탄다. 식이나 색인 구성을 바꾸면
+# 이 파일을 고치지 말고 새 마이그레이션을 추가한다 (이미 적용된 DB는 다시 실행하지 않음).
+TABLE = "files_uploadedfile"
+FTS_TABLE = "files_uploadedfile_fts"
+INDEX_NAME = "file_search_trgm_idx"
+
+PG_DOCUMENT = (
+    "(original_name || ' ' || coalesce(ocr_result->>'vendor', '')"
+    " || ' ' || coalesce(ocr_result->>'text', ''))"
+)
+SQLITE_DOCUMENT = (
+    "{row}.original_name || ' ' || coalesce(json_extract({row}.ocr_result, '$.vendor'), '')"
+    " || ' ' || coalesce(json_extract({row}.ocr_result, '$.text'), '')"
+)
+
+
+def forwards(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        # 마이그레이션이 atomic = False이므로 CONCURRENTLY로 잠금 없이 생성
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON {TABLE}"
+            f" USING gin ({PG_DOCUMENT} gin_trgm_ops) WHERE is_active"
+        )
+    elif vendor == "sqlite":
+        new_document = SQLITE_DOCUMENT.format(row="new")
+        for sql in [
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(document, tokenize='trigram')",
+            f"INSERT INTO {FTS_TABLE}(rowid, document)"
+            f" SELECT id, {SQLITE_DOCUMENT.format(row=TABLE)} FROM {TABLE} WHERE is_active",
+            f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {TABLE} WHEN new.is_active"
+            f" BEGIN INSERT INTO {FTS_TABLE}(rowid, document) VALUES (new.id, {new_document}); END",
+            f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF original_name, ocr_result, is_active"
+            f" ON {TABLE} BEGIN"
+            f" DELETE FROM {FTS_TABLE} WHERE rowid = old.id;"
+            f" INSERT INTO {FTS_TABLE}(rowid, document)"
+            f" SELECT new.id, {new_document} WHERE new.is_active; END",
+            f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {TABLE}"
+            f" BEGIN DELETE FROM {FTS_TABLE} WHERE rowid = old.id; END",
+        ]:
+            schema_editor.execute(sql)
+
+
+def backwards(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+    elif vendor == "sqlite":
+        for suffix in ("ai", "au", "ad"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+    # PostgreSQL: CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("files", "0008_add_ocr_result_cache"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:41
+
+from django.db import migrations, models
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 인덱스 생성은 트랜잭션 밖에서 실행되어야 함
+    atomic = False
+
+    dependencies = [
+        ("files", "0009_add_file_search_index"),
+    ]
+
+    operations = [
+        apps.core.operations.AddIndexConcurrently(
+            model_name="uploadedfile",
+            index=models.Index(fields=["updated_at", "id"], name="file_updated_idx"),
+        ),
+    ]
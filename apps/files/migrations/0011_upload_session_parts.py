@@ -0,0 +1,39 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("files", "0010_add_sync_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadsession",
+            name="multipart_id",
+            field=models.CharField(
+                blank=True, max_length=1024, verbose_name="S3 multipart upload ID"
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadsession",
+            name="parts",
+            field=models.JSONField(blank=True, default=list, verbose_name="수신한 파트"),
+        ),
+        migrations.AddField(
+            model_name="uploadsession",
+            name="reserved_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="예약 일시"),
+        ),
+        migrations.AddField(
+            model_name="uploadsession",
+            name="reserved_by",
+            field=models.UUIDField(blank=True, null=True, verbose_name="처리 중인 요청"),
+        ),
+        migrations.AddField(
+            model_name="uploadsession",
+            name="upload_key",
+            field=models.CharField(blank=True, max_length=100, verbose_name="저장 키"),
+        ),
+    ]
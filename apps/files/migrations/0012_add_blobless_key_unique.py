@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-17 09:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clubs", "0008_add_sync_indexes"),
+        ("files", "0011_upload_session_parts"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="uploadedfile",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("blob__isnull", True)),
+                fields=("file",),
+                name="file_blobless_key_uniq",
+            ),
+        ),
+    ]
@@ -1,7 +1,8 @@
 import re
+import uuid
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from apps.core.models import BaseModel
@@ -31,8 +32,36 @@ def upload_to(instance, filename):
     return f"{year}/{club_name}/{category}/{filename}"
 
 
+class FileBlob(models.Model):
+    """
+    내용 주소(content-addressed) 파일 저장 단위.
+
+    같은 바이트는 SHA-256 기준으로 한 번만 저장하고, 이를 가리키는 활성
+    UploadedFile 수를 ref_count로 센다. 마지막 참조가 사라지면 객체와 행을 삭제.
+    """
+
+    sha256 = models.CharField("SHA-256", max_length=64, unique=True)
+    file = models.FileField("파일")
+    size = models.PositiveIntegerField("파일 크기 (bytes)")
+    ref_count = models.PositiveIntegerField("참조 수", default=0)
+    created_at = models.DateTimeField("생성일시", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "파일 블롭"
+        verbose_name_plural = "파일 블롭"
+
+    def __str__(self):
+        return f"{self.sha256[:12]} (refs={self.ref_count})"
+
+
 class UploadedFile(BaseModel):
-    """업로드 파일 모델 — 프론트엔드 UploadedFile 타입 대응."""
+    """
+    업로드 파일 모델 — 프론트엔드 UploadedFile 타입 대응.
+
+    파일명/카테고리 등은 행마다 따로 가지지만, 바이트는 blob(내용 주소 저장)을
+    공유하므로 같은 파일을 여러 번 올려도 스토리지에는 한 번만 저장된다.
+    (blob이 없는 행은 중복 제거 도입 전 업로드 또는 presigned 직접 업로드)
+    """
 
     class Category(models.TextChoices):
         RECEIPT = "RECEIPT", "영수증"
@@ -41,6 +70,12 @@ class UploadedFile(BaseModel):
         ACHIEVEMENT = "ACHIEVEMENT", "성과물"
         GENERAL = "GENERAL", "일반"
 
+    class OcrStatus(models.TextChoices):
+        PENDING = "PENDING", "대기"
+        RUNNING = "RUNNING", "처리 중"
+        DONE = "DONE", "완료"
+        FAILED = "FAILED", "실패"
+
     file = models.FileField("파일", upload_to=upload_to)
     original_name = models.CharField("원본 파일명", max_length=255)
     size = models.PositiveIntegerField("파일 크기 (bytes)")
@@ -65,6 +100,17 @@ class UploadedFile(BaseModel):
         null=True,
         blank=True,
     )
+    content_hash = models.CharField(
+        "내용 해시 (SHA-256)", max_length=64, blank=True, db_index=True
+    )
+    blob = models.ForeignKey(
+        FileBlob,
+        on_delete=models.SET_NULL,
+        related_name="uploaded_files",
+        verbose_name="블롭",
+        null=True,
+        blank=True,
+    )
     # Phase 3에서 AI OCR 결과를 저장할 필드
     ocr_result = models.JSONField(
         "OCR 결과",
@@ -72,11 +118,180 @@ class UploadedFile(BaseModel):
         blank=True,
         help_text="Phase 3 AI OCR 처리 결과 (JSON)",
     )
+    # OCR 작업 대기열 상태 (영수증만, 그 외 파일은 빈 값) — apps.files.ocr
+    ocr_status = models.CharField(
+        "OCR 상태", max_length=10, choices=OcrStatus.choices, blank=True
+    )
+    ocr_attempts = models.PositiveSmallIntegerField("OCR 시도 횟수", default=0)
+    ocr_available_at = models.DateTimeField(
+        "OCR 처리 가능 시각",
+        null=True,
+        blank=True,
+        help_text="PENDING: 다음 시도 시각 (재시도 대기) / RUNNING: 작업 임대 만료 시각",
+    )
+    ocr_error = models.TextField("OCR 오류", blank=True)
 
     class Meta:
         verbose_name = "업로드 파일"
         verbose_name_plural = "업로드 파일"
         ordering = ["-created_at"]
+        # FileListView 접근 경로: is_active(ActiveManager) + club / category 필터
+        # + created_at 역순 정렬 (키셋 페이지네이션의 id까지 포함)
+        indexes = [
+            models.Index(
+                fields=["club", "category", "-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="file_club_cat_created_idx",
+            ),
+            models.Index(
+                fields=["club", "-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="file_club_created_idx",
+            ),
+            models.Index(
+                fields=["category", "-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="file_cat_created_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="file_created_idx",
+            ),
+            # OCR 워커 작업 조회: 대기/처리 중 행만 처리 가능 시각 순으로
+            models.Index(
+                fields=["ocr_available_at"],
+                condition=models.Q(ocr_status__in=["PENDING", "RUNNING"]),
+                name="file_ocr_queue_idx",
+            ),
+            # 변경분 동기화 (apps.core.sync): 삭제 표시 포함 updated_at 순 범위 스캔
+            models.Index(fields=["updated_at", "id"], name="file_updated_idx"),
+        ]
+        constraints = [
+            # 블롭 없이 등록되는 파일(presigned / 재개 업로드)은 저장 키가 업로드마다 유일 —
+            # 같은 키를 동시에 완료 처리해도 행은 하나만 생긴다 (블롭 키는 여러 행이 공유)
+            models.UniqueConstraint(
+                fields=["file"],
+                condition=models.Q(blob__isnull=True),
+                name="file_blobless_key_uniq",
+            ),
+        ]
 
     def __str__(self):
         return self.original_name
+
+    def queue_ocr(self):
+        """영수증이면 OCR 대기열에 넣는다 (저장 전 호출, 저장은 호출자 몫)."""
+        if self.category == self.Category.RECEIPT:
+            self.ocr_status = self.OcrStatus.PENDING
+            self.ocr_attempts = 0
+            self.ocr_available_at = timezone.now()
+            self.ocr_error = ""
+
+    def soft_delete(self):
+        """소프트 삭제 + 블롭 참조 해제 (마지막 참조면 블롭 삭제)."""
+        from apps.files.blobs import release_blob
+
+        with transaction.atomic():
+            super().soft_delete()
+            if self.blob_id:
+                release_blob(self.blob_id)
+
+
+class UploadSession(BaseModel):
+    """
+    재개 가능한 청크 업로드 세션 (tus 프로토콜 방식).
+
+    받은 청크는 S3면 multipart upload의 파트(multipart_id)로, 그 외 스토리지는
+    {prefix}/{index}-{예약 토큰} 객체로 저장하고 진행 상태(offset, parts)는 이 행에 기록하므로,
+    어느 워커든 다음 청크를 이어서 받을 수 있다. 완료(finalize) 시 파트를 합쳐
+    upload_key에 저장하고 일반 UploadedFile을 만든다.
+
+    청크를 받는 동안에는 행을 잠그지 않고 reserved_by로 offset을 예약한다
+    (apps.files.resumable).
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    original_name = models.CharField("원본 파일명", max_length=255)
+    mime_type = models.CharField("MIME 타입", max_length=100)
+    category = models.CharField(
+        "카테고리",
+        max_length=20,
+        choices=UploadedFile.Category.choices,
+        default=UploadedFile.Category.GENERAL,
+    )
+    size = models.PositiveBigIntegerField("전체 크기 (bytes)")
+    offset = models.PositiveBigIntegerField("수신한 크기 (bytes)", default=0)
+    chunk_count = models.PositiveIntegerField("수신한 청크 수", default=0)
+    upload_key = models.CharField("저장 키", max_length=100, blank=True)
+    multipart_id = models.CharField(
+        "S3 multipart upload ID", max_length=1024, blank=True
+    )
+    parts = models.JSONField("수신한 파트", default=list, blank=True)
+    reserved_by = models.UUIDField("처리 중인 요청", null=True, blank=True)
+    reserved_at = models.DateTimeField("예약 일시", null=True, blank=True)
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="upload_sessions",
+        verbose_name="업로더",
+    )
+    club = models.ForeignKey(
+        "clubs.Club",
+        on_delete=models.CASCADE,
+        related_name="upload_sessions",
+        verbose_name="동아리",
+        null=True,
+        blank=True,
+    )
+    uploaded_file = models.OneToOneField(
+        UploadedFile,
+        on_delete=models.SET_NULL,
+        related_name="upload_session",
+        verbose_name="완료된 파일",
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = "업로드 세션"
+        verbose_name_plural = "업로드 세션"
+        ordering = ["-created_at"]
+        # cleanup_upload_sessions: 진행 중인 세션 중 오래 방치된 것 조회
+        indexes = [
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(is_active=True),
+                name="uploadsession_updated_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.original_name} ({self.offset}/{self.size})"
+
+    @property
+    def chunk_prefix(self):
+        return f"staging/sessions/{self.pk.hex}"
+
+
+class OcrResultCache(models.Model):
+    """
+    OCR 결과 캐시 — (내용 해시, 엔진 버전) 단위로 영속 저장.
+
+    같은 영수증 이미지를 여러 멤버가 올리거나 삭제 후 다시 올려도 추론은 한 번만 한다.
+    엔진 버전이 바뀌면 키가 달라지므로 이전 결과는 자동으로 쓰이지 않는다.
+    """
+
+    content_hash = models.CharField("내용 해시 (SHA-256)", max_length=64)
+    engine_version = models.CharField("엔진 버전", max_length=50)
+    result = models.JSONField("OCR 결과")
+    hit_count = models.PositiveIntegerField("재사용 횟수", default=0)
+    created_at = models.DateTimeField("생성일시", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "OCR 결과 캐시"
+        verbose_name_plural = "OCR 결과 캐시"
+        unique_together = ("content_hash", "engine_version")
+
+    def __str__(self):
+        return f"{self.content_hash[:12]} @ {self.engine_version}"
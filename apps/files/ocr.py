@@ -0,0 +1,192 @@
+"""
+영수증 OCR 작업 대기열 (DB 기반).
+
+UploadedFile의 ocr_* 필드가 곧 작업 큐다.
+- 업로드 시 RECEIPT 파일은 queue_ocr()로 PENDING 상태로 저장 (요청은 OCR을 기다리지 않음)
+- process_ocr 워커가 claim_batch()로 처리 가능한 작업을 잠가 가져가고
+  (SELECT ... FOR UPDATE SKIP LOCKED → 워커 여러 개를 동시에 띄워도 중복 처리 없음)
+- run_batch()가 스레드 풀에서 엔진을 실행한 뒤 결과를 한 번에 반영
+- 실패하면 지수 백오프로 다시 PENDING, OCR_MAX_ATTEMPTS 도달 시 FAILED
+- RUNNING 작업은 임대(lease) 만료 시각을 가지므로 워커가 죽어도 다른 워커가 회수
+
+엔진 앞에는 (내용 해시, 엔진 버전) 키의 영속 결과 캐시(OcrResultCache)가 있어
+같은 바이트는 한 번만 추론한다. 같은 배치 안의 중복도 엔진을 한 번만 호출.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.core.metrics import get_counter
+from apps.files.models import OcrResultCache, UploadedFile
+from apps.files.signals import ocr_completed
+
+logger = logging.getLogger(__name__)
+
+Status = UploadedFile.OcrStatus
+
+# 파일 단위 캐시 적중률 (같은 배치 안 중복 재사용도 적중으로 집계) — process_ocr 워커가
+# 세고 웹 워커의 /api/metrics/가 읽으므로 공유 캐시에 누적
+ocr_cache_counter = get_counter("ocrCache", shared=True)
+
+
+@lru_cache(maxsize=None)
+def get_engine():
+    return import_string(settings.OCR_ENGINE)()
+
+
+def backoff_delay(attempts):
+    """attempts번째 실패 후 다음 시도까지 대기 시간 (지수 증가, 상한 있음)."""
+    seconds = settings.OCR_RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.OCR_RETRY_BACKOFF_MAX_SECONDS))
+
+
+def claim_batch(size):
+    """
+    처리할 작업을 최대 size개 가져와 RUNNING으로 표시.
+
+    대상: 재시도 시각이 지난 PENDING + 임대가 만료된 RUNNING (워커 비정상 종료)
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        queryset = (
+            UploadedFile.objects.filter(
+                ocr_status__in=[Status.PENDING, Status.RUNNING],
+                ocr_available_at__lte=now,
+            )
+            .order_by("ocr_available_at")
+            .select_for_update(
+                skip_locked=connection.features.has_select_for_update_skip_locked
+            )
+        )
+        ids = list(queryset.values_list("pk", flat=True)[:size])
+        if not ids:
+            return []
+        UploadedFile.objects.filter(pk__in=ids).update(
+            updated_at=now,
+            ocr_status=Status.RUNNING,
+            ocr_attempts=F("ocr_attempts") + 1,
+            ocr_available_at=now + timedelta(seconds=settings.OCR_LEASE_SECONDS),
+        )
+    return list(UploadedFile.objects.filter(pk__in=ids).select_related("blob"))
+
+
+def run_batch(files, workers):
+    """
+    files에 엔진을 병렬 실행하고 상태를 반영.
+
+    Returns:
+        (완료 수, 실패 수) — 실패에는 재시도 대기로 돌아간 작업 포함
+    """
+    engine = get_engine()
+    cached = _load_cached(engine, files)
+
+    # 캐시에 없는 내용만 추론 대상 (해시가 없는 파일은 개별 처리)
+    pending = {}
+    for obj in files:
+        key = obj.content_hash or obj.pk
+        if key in cached or key in pending:
+            ocr_cache_counter.hit()
+        else:
+            ocr_cache_counter.miss()
+            pending[key] = obj
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") as pool:
+        futures = {
+            key: pool.submit(_recognize, engine, obj) for key, obj in pending.items()
+        }
+    _store_cached(engine, futures)
+
+    now = timezone.now()
+    done, failed = [], []
+    for obj in files:
+        key = obj.content_hash or obj.pk
+        # bulk_update는 auto_now를 적용하지 않음 — 조건부 GET 검증자(updated_at) 유지
+        obj.updated_at = now
+        try:
+            if key in cached:
+                obj.ocr_result = cached[key].result
+            else:
+                obj.ocr_result = futures[key].result()
+        except Exception as e:
+            logger.warning("OCR 실패 (file=%s, 시도 %s): %s", obj.pk, obj.ocr_attempts, e)
+            _mark_failed(obj, e, now)
+            failed.append(obj)
+        else:
+            obj.ocr_status = Status.DONE
+            obj.ocr_available_at = None
+            obj.ocr_error = ""
+            done.append(obj)
+
+    # 처리 중 파일이 삭제/재등록됐을 수 있으므로 RUNNING인 행만 갱신
+    running = UploadedFile.objects.filter(ocr_status=Status.RUNNING)
+    if done:
+        running.bulk_update(
+            done,
+            ["ocr_result", "ocr_status", "ocr_available_at", "ocr_error", "updated_at"],
+        )
+        ocr_completed.send(sender=UploadedFile, files=done)
+    if failed:
+        running.bulk_update(
+            failed, ["ocr_status", "ocr_available_at", "ocr_error", "updated_at"]
+        )
+    return len(done), len(failed)
+
+
+def _load_cached(engine, files):
+    """배치 파일들의 캐시된 결과 {content_hash: OcrResultCache} (적중 행은 hit_count 증가)."""
+    hashes = {obj.content_hash for obj in files if obj.content_hash}
+    if not hashes:
+        return {}
+    cached = {
+        entry.content_hash: entry
+        for entry in OcrResultCache.objects.filter(
+            content_hash__in=hashes, engine_version=engine.version
+        )
+    }
+    if cached:
+        OcrResultCache.objects.filter(
+            pk__in=[entry.pk for entry in cached.values()]
+        ).update(hit_count=F("hit_count") + 1)
+    return cached
+
+
+def _store_cached(engine, futures):
+    """성공한 추론 결과를 캐시에 저장 (동시에 다른 워커가 저장했으면 무시)."""
+    entries = [
+        OcrResultCache(
+            content_hash=key, engine_version=engine.version, result=future.result()
+        )
+        for key, future in futures.items()
+        if isinstance(key, str) and future.exception() is None
+    ]
+    OcrResultCache.objects.bulk_create(entries, ignore_conflicts=True)
+
+
+def purge_stale_cache():
+    """현재 엔진 버전이 아닌 캐시 항목 삭제. 삭제 건수 반환."""
+    deleted, _ = OcrResultCache.objects.exclude(
+        engine_version=get_engine().version
+    ).delete()
+    return deleted
+
+
+def _recognize(engine, obj):
+    with obj.file.open("rb") as fh:
+        return engine.recognize(fh, obj.mime_type)
+
+
+def _mark_failed(obj, error, now):
+    obj.ocr_error = f"{error.__class__.__name__}: {error}"[:1000]
+    if obj.ocr_attempts >= settings.OCR_MAX_ATTEMPTS:
+        obj.ocr_status = Status.FAILED
+        obj.ocr_available_at = None
+    else:
+        obj.ocr_status = Status.PENDING
+        obj.ocr_available_at = now + backoff_delay(obj.ocr_attempts)
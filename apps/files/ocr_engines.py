@@ -0,0 +1,55 @@
+"""
+OCR 엔진.
+
+settings.OCR_ENGINE에 클래스 경로를 지정해 교체한다 (import_string).
+엔진은 version 속성과 recognize(fh, mime_type) → dict 메서드를 가진다.
+- version: 결과 형식/모델이 바뀌면 올린다 (결과 재사용 판단 기준)
+- recognize: 파일 객체를 읽어 결과 JSON(dict) 반환, 실패 시 예외
+"""
+import hashlib
+from datetime import date, timedelta
+
+
+class BaseOcrEngine:
+    name = "base"
+    version = "0"
+
+    def recognize(self, fh, mime_type):
+        raise NotImplementedError
+
+
+class StubOcrEngine(BaseOcrEngine):
+    """
+    오프라인 테스트용 결정적(deterministic) 스텁 엔진.
+
+    실제 인식 없이 파일 내용의 SHA-256에서 영수증 필드를 만들어 낸다.
+    같은 바이트에는 항상 같은 결과를 돌려준다.
+    """
+
+    name = "stub"
+    version = "stub-1"
+
+    VENDORS = ["다이소", "쿠팡", "교보문고", "스타벅스", "이마트", "오피스디포"]
+    CATEGORIES = ["비품", "도서", "회의비", "소모품", "인쇄"]
+
+    def recognize(self, fh, mime_type):
+        hasher = hashlib.sha256()
+        for chunk in fh.chunks():
+            hasher.update(chunk)
+        digest = hasher.digest()
+
+        total = 1000 + int.from_bytes(digest[:4], "big") % 200000 // 10 * 10
+        tax = total // 11
+        issued = date(2026, 1, 1) + timedelta(days=digest[4] % 365)
+        vendor = self.VENDORS[digest[5] % len(self.VENDORS)]
+        return {
+            "engine": self.name,
+            "engineVersion": self.version,
+            "vendor": vendor,
+            "date": issued.isoformat(),
+            "totalAmount": total,
+            "taxAmount": tax,
+            "category": self.CATEGORIES[digest[6] % len(self.CATEGORIES)],
+            "confidence": round(0.8 + digest[7] / 255 * 0.2, 3),
+            "text": f"{vendor}\n{issued.isoformat()}\n합계 {total:,}원",
+        }
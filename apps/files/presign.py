@@ -0,0 +1,88 @@
+"""
+presigned 직접 업로드 티켓.
+
+발급 시점의 업로드 정보(키, 크기, 업로더 등)를 서명된 토큰(uploadToken)에 담아
+별도 테이블 없이 완료 요청에서 그대로 검증한다.
+S3가 아닌 스토리지(로컬 개발)에서는 같은 토큰으로 LocalPresignedUploadView가
+S3 역할을 대신한다.
+"""
+import os
+
+from django.conf import settings
+from django.core import signing
+from django.urls import reverse
+
+from apps.core.exceptions import BusinessLogicError
+from apps.files.models import UploadedFile, upload_to
+from apps.files.storage import is_s3_storage, presign_s3_upload
+
+SALT = "apps.files.presign"
+
+# 업로드 URL 만료 후에도 완료 요청은 받아줘야 하므로 토큰 자체는 더 길게 유효
+COMPLETE_MAX_AGE = 24 * 60 * 60
+
+
+def build_upload_key(storage, club, category, filename):
+    """
+    upload_to 경로 규칙({year}/{club}/{category}/{filename})에 따른 업로드 키.
+
+    업로드 전에 키를 확정해야 하므로 존재 여부 확인 대신 무작위 접미사로 충돌을 피하고,
+    FileField max_length를 넘으면 파일명 부분을 줄인다.
+    """
+    max_length = UploadedFile._meta.get_field("file").max_length
+    name = upload_to(
+        UploadedFile(club=club, category=category), storage.get_valid_name(filename)
+    )
+    root, ext = os.path.splitext(name)
+    key = storage.get_alternative_name(root, ext)
+
+    overflow = len(key) - max_length
+    if overflow > 0:
+        root = root[:-overflow]
+        if not os.path.basename(root):
+            raise BusinessLogicError("파일명이 너무 깁니다.")
+        key = storage.get_alternative_name(root, ext)
+    return key
+
+
+def issue_ticket(request, storage, *, key, size, mime_type, method, **extra):
+    """업로드 대상 URL과 uploadToken 발급."""
+    expires = settings.FILES_PRESIGN_EXPIRES
+    token = signing.dumps(
+        {
+            "key": key,
+            "size": size,
+            "mimeType": mime_type,
+            "method": method,
+            "user": request.user.pk,
+            **extra,
+        },
+        salt=SALT,
+    )
+
+    if is_s3_storage(storage):
+        target = presign_s3_upload(storage, key, mime_type, size, method, expires)
+    else:
+        target = {
+            "url": request.build_absolute_uri(
+                reverse("file-presign-local", args=[token])
+            ),
+            "fields": {},
+            "headers": {"Content-Type": mime_type} if method == "PUT" else {},
+        }
+
+    return {
+        "key": key,
+        "method": method,
+        **target,
+        "expiresIn": expires,
+        "uploadToken": token,
+    }
+
+
+def load_ticket(token, max_age=COMPLETE_MAX_AGE):
+    """uploadToken 검증. 위조/만료 시 None."""
+    try:
+        return signing.loads(token, salt=SALT, max_age=max_age)
+    except signing.BadSignature:
+        return None
@@ -0,0 +1,242 @@
+"""
+재개 가능한 청크 업로드 (tus 프로토콜 방식) 처리.
+
+- create_session(): 세션 생성 (저장 키 확정, S3면 multipart upload 시작)
+- append_chunk(): Upload-Offset 위치에 청크 하나를 파트로 기록
+- finalize(): 파트를 합쳐 UploadedFile 생성
+- discard_session(): 세션의 파트(multipart upload / 청크 객체) 삭제
+
+세션 행은 offset을 예약(reserve)하거나 반영(commit)할 때만 잠그고, 클라이언트에서
+청크를 읽고 스토리지에 쓰는 동안에는 트랜잭션 밖에서 reserved_by 예약으로 보호한다.
+예약 중인 세션에 들어온 PATCH / complete와 offset이 맞지 않는 요청은 409로 거절된다.
+
+S3는 청크 1개를 multipart 파트 1개로 올리므로 완료 시 S3가 서버 측에서 이어 붙이고
+(바이트를 다시 읽거나 쓰지 않음), 그래서 마지막을 제외한 청크는 PART_SIZE 이상이어야 한다.
+완료된 파일은 presigned 직접 업로드처럼 블롭 없이 등록되고 dedupe_files가 나중에
+내용 주소 블롭으로 옮긴다 (완료 요청에서 전체를 다시 읽어 해시하지 않음).
+"""
+import tempfile
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+
+from apps.core.exceptions import BusinessLogicError, Conflict, PayloadTooLarge
+from apps.files.models import UploadedFile, UploadSession
+from apps.files.presign import build_upload_key
+from apps.files.storage import (
+    PART_SIZE,
+    ObjectPartUpload,
+    S3PartUpload,
+    get_upload_storage,
+    is_s3_storage,
+)
+
+# 요청 본문을 읽을 때 블록 크기
+READ_BLOCK_SIZE = 64 * 1024
+
+# 예약이 이보다 오래되면 요청이 죽은 것으로 본다 (gunicorn --timeout 120보다 길게)
+RESERVATION_TIMEOUT = timedelta(seconds=180)
+
+
+def create_session(**fields):
+    """세션 생성 — 저장 키를 정하고 S3면 multipart upload를 시작한다."""
+    storage = get_upload_storage()
+    session = UploadSession(**fields)
+    session.upload_key = build_upload_key(
+        storage, session.club, session.category, session.original_name
+    )
+    if is_s3_storage(storage):
+        session.multipart_id = S3PartUpload.start(
+            storage, session.upload_key, session.mime_type
+        ).upload_id
+    session.save()
+    return session
+
+
+def append_chunk(session_id, user, offset, stream, length):
+    """
+    stream에서 length 바이트를 읽어 offset 위치의 청크로 저장.
+
+    전송이 중간에 끊기면 청크를 버리고 offset을 그대로 두므로,
+    클라이언트는 HEAD로 offset을 확인한 뒤 같은 위치부터 다시 보내면 된다.
+    """
+    max_chunk = settings.RESUMABLE_UPLOAD_CHUNK_SIZE
+    if length > max_chunk:
+        raise PayloadTooLarge(f"청크 크기가 {max_chunk // (1024 * 1024)}MB를 초과합니다.")
+
+    def check(session):
+        if offset != session.offset:
+            raise Conflict(f"Upload-Offset이 현재 위치({session.offset})와 다릅니다.")
+        if session.offset + length > session.size:
+            raise BusinessLogicError("선언한 전체 크기를 초과합니다.")
+        if length < 1:
+            raise BusinessLogicError("빈 청크는 보낼 수 없습니다.")
+        if length < PART_SIZE and session.offset + length != session.size:
+            raise BusinessLogicError(
+                f"마지막 청크를 제외한 청크는 {PART_SIZE // (1024 * 1024)}MB 이상이어야 합니다."
+            )
+
+    session, token = _reserve(session_id, user, check)
+    number = session.chunk_count + 1
+    try:
+        # 느린 클라이언트에서 읽는 동안 트랜잭션 / 잠금 없음 (메모리 상한 후 디스크로 넘김)
+        with tempfile.SpooledTemporaryFile(
+            max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+        ) as buffer:
+            _receive(stream, length, buffer)
+            part = _part_upload(session).write_part(number, buffer, length, token)
+    except Exception:
+        _release(session_id, token)
+        raise
+
+    with transaction.atomic():
+        session = _get_reserved_for_update(session_id, user, token)
+        session.offset += length
+        session.chunk_count = number
+        session.parts = [*session.parts, part]
+        session.reserved_by = session.reserved_at = None
+        session.save(
+            update_fields=[
+                "offset",
+                "chunk_count",
+                "parts",
+                "reserved_by",
+                "reserved_at",
+                "updated_at",
+            ]
+        )
+    return session
+
+
+def finalize(session_id, user):
+    """모든 청크를 받은 세션을 UploadedFile로 만든다."""
+
+    def check(session):
+        if session.offset != session.size:
+            raise Conflict(f"아직 업로드가 끝나지 않았습니다 ({session.offset}/{session.size}).")
+
+    session, token = _reserve(session_id, user, check)
+    try:
+        name = _part_upload(session).complete(_parts(session))
+    except Exception:
+        _release(session_id, token)
+        raise
+
+    with transaction.atomic():
+        session = _get_reserved_for_update(session_id, user, token)
+        obj = UploadedFile(
+            file=name,
+            original_name=session.original_name,
+            size=session.size,
+            mime_type=session.mime_type,
+            category=session.category,
+            uploaded_by=session.uploaded_by,
+            club=session.club,
+        )
+        obj.queue_ocr()
+        obj.save()
+
+        session.uploaded_file = obj
+        session.is_active = False
+        session.reserved_by = session.reserved_at = None
+        session.save(
+            update_fields=[
+                "uploaded_file",
+                "is_active",
+                "reserved_by",
+                "reserved_at",
+                "updated_at",
+            ]
+        )
+        transaction.on_commit(lambda: discard_session(session))
+    return obj
+
+
+def discard_session(session):
+    """세션의 파트를 모두 삭제 (offset에 반영되지 못한 청크 객체 포함)."""
+    if session.multipart_id:
+        if session.uploaded_file_id is None:
+            _part_upload(session).abort()
+        return
+    # 청크 객체 (S3가 아닌 스토리지, multipart 도입 전 세션)
+    ObjectPartUpload(
+        get_upload_storage(), session.upload_key, session.chunk_prefix
+    ).abort()
+
+
+def _receive(stream, length, buffer):
+    """stream에서 length 바이트를 buffer로 읽고 처음 위치로 되돌린다."""
+    received = 0
+    while received < length:
+        block = stream.read(min(READ_BLOCK_SIZE, length - received))
+        if not block:
+            break
+        buffer.write(block)
+        received += len(block)
+    if received != length:
+        raise BusinessLogicError("청크 전송이 중단되었습니다. 현재 offset부터 다시 보내세요.")
+    buffer.seek(0)
+
+
+def _part_upload(session):
+    storage = get_upload_storage()
+    name = session.upload_key or build_upload_key(
+        storage, session.club, session.category, session.original_name
+    )
+    if session.multipart_id:
+        return S3PartUpload(storage, name, session.multipart_id)
+    return ObjectPartUpload(storage, name, session.chunk_prefix)
+
+
+def _parts(session):
+    # multipart 도입 전 세션은 parts 없이 chunk_count만 기록됨
+    return session.parts or [
+        {"PartNumber": number, "ETag": ""}
+        for number in range(1, session.chunk_count + 1)
+    ]
+
+
+def _reserve(session_id, user, check):
+    """
+    세션을 잠가 check(session)를 통과하면 예약하고 (session, 예약 토큰) 반환.
+
+    다른 요청의 예약이 살아 있으면 409. 잠금은 이 짧은 트랜잭션 안에서만 유지된다.
+    """
+    with transaction.atomic():
+        session = _get_session_for_update(session_id, user)
+        now = timezone.now()
+        if session.reserved_by and session.reserved_at > now - RESERVATION_TIMEOUT:
+            raise Conflict("같은 세션의 다른 요청을 처리 중입니다. 잠시 후 다시 시도하세요.")
+        check(session)
+        session.reserved_by = uuid.uuid4()
+        session.reserved_at = now
+        session.save(update_fields=["reserved_by", "reserved_at"])
+    return session, session.reserved_by
+
+
+def _release(session_id, token):
+    """예약 해제 (실패한 요청) — 이미 다른 요청이 가져간 예약은 건드리지 않음."""
+    UploadSession.objects.filter(pk=session_id, reserved_by=token).update(
+        reserved_by=None, reserved_at=None
+    )
+
+
+def _get_reserved_for_update(session_id, user, token):
+    session = _get_session_for_update(session_id, user)
+    if session.reserved_by != token:
+        # 예약이 만료되어 다른 요청이 이어받음 — 이 요청의 결과는 반영하지 않음
+        raise Conflict("업로드 세션 예약이 만료되었습니다. HEAD로 offset을 확인하세요.")
+    return session
+
+
+def _get_session_for_update(session_id, user):
+    try:
+        return UploadSession.objects.select_for_update().get(
+            pk=session_id, uploaded_by=user
+        )
+    except UploadSession.DoesNotExist:
+        raise NotFound("존재하지 않거나 이미 종료된 업로드 세션입니다.")
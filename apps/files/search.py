@@ -0,0 +1,92 @@
+"""
+파일 검색 (파일명 + 영수증 OCR 거래처/본문).
+
+검색 문서는 original_name, ocr_result의 vendor / text를 이어 붙인 문자열이고,
+DB가 직접 색인을 유지하므로 저장 경로(일괄 생성, OCR 반영 등)는 신경 쓰지 않는다.
+
+- PostgreSQL: 검색 문서 식에 대한 GIN 트라이그램 인덱스 (pg_trgm, 활성 행만)
+  → ILIKE '%검색어%'가 인덱스로 처리되고 word_similarity로 순위를 매긴다.
+  (한국어는 공백 단위 tsvector로는 부분 일치가 안 되므로 트라이그램 사용)
+- SQLite: FTS5 가상 테이블 (trigram 토크나이저) + 트리거로 동기화
+  → MATCH로 후보를 찾고 bm25로 순위를 매긴다.
+- 그 외 DB: 파일명 icontains (순위 없음)
+
+색인(GIN 인덱스 / FTS 테이블과 트리거)은 마이그레이션 0009_add_file_search_index가 만든다.
+검색 문서 식을 바꾸면 새 마이그레이션으로 색인도 다시 만들어야 한다.
+"""
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Value
+from django.db.models.expressions import RawSQL
+
+TABLE = "files_uploadedfile"
+FTS_TABLE = "files_uploadedfile_fts"
+
+# 검색 문서 식 — 인덱스(마이그레이션 0009)와 조회 쿼리가 같은 식을 써야 인덱스를 탄다
+PG_DOCUMENT = (
+    "(original_name || ' ' || coalesce(ocr_result->>'vendor', '')"
+    " || ' ' || coalesce(ocr_result->>'text', ''))"
+)
+
+# trigram 토크나이저는 3글자 이상만 색인으로 찾을 수 있다
+FTS_MIN_LENGTH = 3
+
+
+def search_files(queryset, q):
+    """
+    검색어 q를 포함하는 파일만 남기고 search_rank(클수록 관련도 높음)를 주석.
+
+    정렬은 호출자가 정한다 (보통 -search_rank, -created_at, -id).
+    """
+    q = q.strip()
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        return _search_postgresql(queryset, q)
+    if vendor == "sqlite":
+        return _search_sqlite(queryset, q)
+    return queryset.filter(original_name__icontains=q).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
+
+
+def _like_pattern(q):
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _search_postgresql(queryset, q):
+    return queryset.filter(
+        RawSQL(
+            f"{PG_DOCUMENT} ILIKE %s",
+            [_like_pattern(q)],
+            output_field=BooleanField(),
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            f"word_similarity(%s, {PG_DOCUMENT})", [q], output_field=FloatField()
+        )
+    )
+
+
+def _search_sqlite(queryset, q):
+    if len(q) < FTS_MIN_LENGTH:
+        # 짧은 검색어: FTS 테이블(검색 문서만 담은 작은 테이블)을 LIKE로 훑음
+        matches = RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE document LIKE %s ESCAPE '\\'",
+            [_like_pattern(q)],
+        )
+        return queryset.filter(pk__in=matches).annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        )
+
+    phrase = '"' + q.replace('"', '""') + '"'
+    matches = RawSQL(
+        f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [phrase]
+    )
+    # bm25는 작을수록 관련도가 높으므로 부호를 바꿔 PostgreSQL과 방향을 맞춤
+    rank = RawSQL(
+        f"SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE}"
+        f" WHERE {FTS_TABLE} MATCH %s AND rowid = {TABLE}.id",
+        [phrase],
+        output_field=FloatField(),
+    )
+    return queryset.filter(pk__in=matches).annotate(search_rank=rank)
@@ -1,11 +1,14 @@
+from django.conf import settings
 from rest_framework import serializers
 
-from apps.files.models import UploadedFile
+from apps.files.models import UploadedFile, UploadSession
+from apps.files.storage import PART_SIZE
 
 
 # ──────────────────────────────────────────────
 # 프론트엔드 UploadedFile 타입 대응 (읽기 전용)
-# { id, originalName, s3Key, url, size, mimeType, category, uploadedAt }
+# { id, originalName, s3Key, url, size, mimeType, category, uploadedAt,
+#   ocrStatus, ocrResult }
 # ──────────────────────────────────────────────
 class UploadedFileSerializer(serializers.ModelSerializer):
     originalName = serializers.CharField(source="original_name", read_only=True)
@@ -13,6 +16,9 @@ class UploadedFileSerializer(serializers.ModelSerializer):
     url = serializers.SerializerMethodField()
     mimeType = serializers.CharField(source="mime_type", read_only=True)
     uploadedAt = serializers.DateTimeField(source="created_at", read_only=True)
+    # 영수증 OCR: PENDING / RUNNING / DONE / FAILED (영수증이 아니면 null)
+    ocrStatus = serializers.SerializerMethodField()
+    ocrResult = serializers.JSONField(source="ocr_result", read_only=True)
 
     class Meta:
         model = UploadedFile
@@ -25,6 +31,8 @@ class UploadedFileSerializer(serializers.ModelSerializer):
             "mimeType",
             "category",
             "uploadedAt",
+            "ocrStatus",
+            "ocrResult",
         ]
 
     def get_url(self, obj):
@@ -35,6 +43,9 @@ class UploadedFileSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.file.url)
         return obj.file.url
 
+    def get_ocrStatus(self, obj) -> str | None:
+        return obj.ocr_status or None
+
 
 # ──────────────────────────────────────────────
 # 파일 업로드 요청
@@ -54,3 +65,98 @@ class FileUploadSerializer(serializers.Serializer):
         default=UploadedFile.Category.GENERAL,
     )
     club = serializers.IntegerField(required=False, allow_null=True)
+
+
+# ──────────────────────────────────────────────
+# presigned 직접 업로드
+# ──────────────────────────────────────────────
+class PresignedUploadSerializer(serializers.Serializer):
+    """
+    직접 업로드 URL 발급 요청.
+
+    - fileName / size / mimeType: 업로드할 파일 정보 (size는 정확한 바이트 수)
+    - category / club: FileUploadView와 동일
+    - method: POST (form 업로드, 기본) 또는 PUT (본문 그대로 업로드)
+    """
+
+    fileName = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
+    mimeType = serializers.CharField(max_length=100, default="application/octet-stream")
+    category = serializers.ChoiceField(
+        choices=UploadedFile.Category.choices,
+        default=UploadedFile.Category.GENERAL,
+    )
+    club = serializers.IntegerField(required=False, allow_null=True)
+    method = serializers.ChoiceField(choices=["POST", "PUT"], default="POST")
+
+
+class PresignedUploadTicketSerializer(serializers.Serializer):
+    """
+    발급 응답 — 클라이언트는 url로 method 요청을 보내고 uploadToken으로 완료 처리.
+
+    POST면 fields를 form 필드로 먼저 넣고 마지막에 file 필드를 넣는다.
+    PUT이면 headers를 그대로 붙여 파일 본문을 보낸다.
+    """
+
+    key = serializers.CharField()
+    method = serializers.CharField()
+    url = serializers.URLField()
+    fields = serializers.DictField(child=serializers.CharField())
+    headers = serializers.DictField(child=serializers.CharField())
+    expiresIn = serializers.IntegerField()
+    uploadToken = serializers.CharField()
+
+
+class PresignedUploadCompleteSerializer(serializers.Serializer):
+    uploadToken = serializers.CharField()
+
+
+# ──────────────────────────────────────────────
+# 재개 가능한 청크 업로드 세션
+# ──────────────────────────────────────────────
+class UploadSessionCreateSerializer(serializers.Serializer):
+    """업로드 세션 생성 요청 (fileName / size / mimeType / category / club)."""
+
+    fileName = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
+    mimeType = serializers.CharField(max_length=100, default="application/octet-stream")
+    category = serializers.ChoiceField(
+        choices=UploadedFile.Category.choices,
+        default=UploadedFile.Category.GENERAL,
+    )
+    club = serializers.IntegerField(required=False, allow_null=True)
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    업로드 세션 상태.
+
+    offset부터 chunkSize 이하 크기로 PATCH를 이어 보내면 된다.
+    마지막 청크를 제외한 청크는 minChunkSize 이상이어야 한다 (S3 multipart 파트 최소 크기).
+    """
+
+    originalName = serializers.CharField(source="original_name", read_only=True)
+    mimeType = serializers.CharField(source="mime_type", read_only=True)
+    chunkSize = serializers.SerializerMethodField()
+    minChunkSize = serializers.SerializerMethodField()
+    updatedAt = serializers.DateTimeField(source="updated_at", read_only=True)
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            "id",
+            "originalName",
+            "mimeType",
+            "category",
+            "size",
+            "offset",
+            "chunkSize",
+            "minChunkSize",
+            "updatedAt",
+        ]
+
+    def get_chunkSize(self, obj) -> int:
+        return settings.RESUMABLE_UPLOAD_CHUNK_SIZE
+
+    def get_minChunkSize(self, obj) -> int:
+        return PART_SIZE
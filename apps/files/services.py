@@ -0,0 +1,144 @@
+"""
+다중 파일 업로드 저장 서비스.
+
+파일마다 스토리지 쓰기(S3 PUT/COPY)와 INSERT를 순서대로 하면 배치 지연이
+파일 수 × 왕복 시간이 되므로:
+
+1) 파일별 SHA-256으로 이미 저장된 블롭을 찾고 (내용이 같으면 쓰지 않음)
+2) 새 내용만 제한된 스레드 풀에서 병렬로 스토리지에 기록
+3) 블롭 참조 증가(acquire_blobs)와 메타데이터 bulk_create를 한 트랜잭션에서
+   고정된 쿼리 수로 처리
+4) 어느 단계든 실패하면 방금 저장한 객체를 삭제 (보상)
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.files.blobs import (
+    acquire_blobs,
+    blob_name,
+    discard_unreferenced,
+    existing_digests,
+    hash_file,
+    write_blob,
+)
+from apps.files.models import UploadedFile
+from apps.files.storage import get_upload_storage
+from apps.files.uploadhandlers import StagedUploadedFile
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """프로세스 공용 스토리지 쓰기 스레드 풀 (FILE_UPLOAD_WORKERS개)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.FILE_UPLOAD_WORKERS,
+                    thread_name_prefix="file-upload",
+                )
+    return _executor
+
+
+def store_uploads(files, *, category, club, uploaded_by):
+    """
+    files를 스토리지에 병렬 저장하고 UploadedFile을 한 번에 생성.
+
+    Args:
+        files: request.FILES의 파일 목록 (StagedUploadedFile 또는 일반 UploadedFile)
+
+    Returns:
+        생성된 UploadedFile 리스트 (files 순서)
+    """
+    storage = get_upload_storage()
+
+    # 내용 해시별로 묶기 (같은 배치 안의 중복도 한 번만 저장)
+    groups = {}
+    for f in files:
+        groups.setdefault(_digest(f), []).append(f)
+
+    known = existing_digests(groups)
+    entries = {
+        digest: (
+            blob_name(digest, group[0].name),
+            group[0].size,
+            len(group),
+            _saver(storage, group[0]),
+        )
+        for digest, group in groups.items()
+    }
+    new = [digest for digest in entries if digest not in known]
+    written = _write_parallel(storage, {digest: entries[digest] for digest in new})
+
+    objs = []
+    try:
+        with transaction.atomic():
+            blobs = acquire_blobs(storage, entries, stored=new)
+            for f in files:
+                blob = blobs[f.checksum]
+                objs.append(
+                    UploadedFile(
+                        file=blob.file.name,
+                        original_name=f.name,
+                        size=f.size,
+                        mime_type=f.content_type or "application/octet-stream",
+                        category=category,
+                        uploaded_by=uploaded_by,
+                        club=club,
+                        content_hash=blob.sha256,
+                        blob=blob,
+                    )
+                )
+            for obj in objs:
+                obj.queue_ocr()
+            UploadedFile.objects.bulk_create(objs)
+    except Exception:
+        discard_unreferenced(storage, written)
+        raise
+    return objs
+
+
+def _write_parallel(storage, entries):
+    """
+    새 블롭 바이트를 스레드 풀에서 병렬 저장.
+
+    Returns:
+        이번에 실제로 쓴 {digest: name} — 하나라도 실패하면 이들을 지우고 예외 전파
+    """
+    futures = {
+        digest: get_executor().submit(write_blob, storage, name, save)
+        for digest, (name, _, _, save) in entries.items()
+    }
+
+    written, error = {}, None
+    for digest, future in futures.items():
+        try:
+            if future.result():
+                written[digest] = entries[digest][0]
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        discard_unreferenced(storage, written)
+        raise error
+    return written
+
+
+def _digest(f):
+    if getattr(f, "checksum", None) is None:
+        # 업로드 핸들러를 거치지 않은 파일은 직접 해시 계산
+        f.checksum = hash_file(f)
+    return f.checksum
+
+
+def _saver(storage, f):
+    """write_blob용 저장 함수 — 저장된 실제 이름 반환."""
+    if isinstance(f, StagedUploadedFile):
+        # 업로드 핸들러가 이미 스테이징 키에 기록 → 블롭 키로 이동만
+        # (S3에서 메모리에 남겨 둔 작은 파일은 블롭 키에 PUT 한 번)
+        return f.commit
+    return lambda name: storage.save(name, f)
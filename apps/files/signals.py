@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete
+from django.dispatch import Signal, receiver
+
+from apps.files.blobs import release_blob
+from apps.files.models import UploadedFile
+
+# OCR 워커가 결과를 반영한 직후 발송 (kwargs: files — DONE 처리된 UploadedFile 목록)
+ocr_completed = Signal()
+
+
+@receiver(post_delete, sender=UploadedFile, dispatch_uid="files_uploaded_file_deleted")
+def uploaded_file_deleted(sender, instance, **kwargs):
+    """
+    활성 파일 행이 실제 삭제되면 블롭 참조 해제.
+
+    (소프트 삭제된 행은 soft_delete에서 이미 해제했으므로 제외)
+    """
+    if instance.is_active and instance.blob_id:
+        release_blob(instance.blob_id)
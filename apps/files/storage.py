@@ -0,0 +1,476 @@
+"""
+업로드 바이트를 최종 스토리지로 바로 흘려보내기 위한 헬퍼.
+
+- open_writer(): 스토리지별 스트리밍 writer
+    * FileSystemStorage → 대상 파일에 직접 기록
+    * S3Boto3Storage   → S3 multipart upload (파트 버퍼 최대 PART_SIZE,
+                         PART_SIZE 미만인 파일은 쓰지 않고 메모리에 남김)
+    * 그 외            → SpooledTemporaryFile에 모았다가 storage.save (폴백)
+- move(): 스테이징 키를 최종 경로로 이동 (로컬 rename / S3 서버 측 copy)
+- put(): 메모리에 남긴 작은 파일을 최종 경로에 한 번에 기록 (S3 PUT 1회)
+- discard(): 커밋되지 않은 스테이징 객체 삭제
+- presign_s3_upload() / stat(): 클라이언트 직접 업로드(presigned URL)와 완료 확인(HEAD)
+- S3PartUpload / ObjectPartUpload: 여러 요청에 걸쳐 파트를 받아 하나로 합치는 업로드
+  (재개 가능한 청크 업로드용)
+
+어느 경우든 업로드 1건당 메모리 사용량은 파일 크기와 무관하게 상한이 있다.
+"""
+import os
+import tempfile
+import uuid
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+
+try:
+    from botocore.exceptions import ClientError
+    from storages.backends.s3boto3 import S3Boto3Storage
+    from storages.utils import clean_name
+except ImportError:  # 로컬 개발 환경 (django-storages 미설치)
+    S3Boto3Storage = None
+
+# S3 multipart 최소 파트 크기 (마지막 파트 제외)
+PART_SIZE = 5 * 1024 * 1024
+
+# 스토리지 객체 간 복사 시 블록 크기
+COPY_BLOCK_SIZE = 64 * 1024
+
+STAGING_DIR = "staging"
+
+
+def get_upload_storage():
+    """UploadedFile.file 필드가 사용하는 스토리지."""
+    from apps.files.models import UploadedFile
+
+    return UploadedFile._meta.get_field("file").storage
+
+
+def is_s3_storage(storage):
+    return S3Boto3Storage is not None and isinstance(storage, S3Boto3Storage)
+
+
+def staging_name(storage, filename):
+    """최종 경로가 정해지기 전 임시로 기록할 키 (요청마다 유일)."""
+    return f"{STAGING_DIR}/{uuid.uuid4().hex}/{storage.get_valid_name(filename)}"
+
+
+def open_writer(storage, name, content_type=None):
+    if isinstance(storage, FileSystemStorage):
+        return LocalFileWriter(storage, name)
+    if is_s3_storage(storage):
+        return S3MultipartWriter(storage, name, content_type)
+    return SpooledWriter(storage, name)
+
+
+def move(storage, source, target):
+    """source 객체를 target(사용 가능한 이름으로 보정) 으로 옮기고 최종 이름 반환."""
+    target = storage.get_available_name(target)
+
+    if isinstance(storage, FileSystemStorage):
+        target_path = storage.path(target)
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        os.replace(storage.path(source), target_path)
+        _remove_empty_parent(storage.path(source))
+        return target
+
+    if is_s3_storage(storage):
+        client = storage.bucket.meta.client
+        source_key = storage._normalize_name(clean_name(source))
+        client.copy_object(
+            Bucket=storage.bucket_name,
+            Key=storage._normalize_name(clean_name(target)),
+            CopySource={"Bucket": storage.bucket_name, "Key": source_key},
+        )
+        client.delete_object(Bucket=storage.bucket_name, Key=source_key)
+        return target
+
+    with storage.open(source) as fh:
+        target = storage.save(target, fh)
+    storage.delete(source)
+    return target
+
+
+def put(storage, name, data, content_type=None):
+    """메모리에 있는 data를 name(사용 가능한 이름으로 보정)에 한 번에 기록하고 최종 이름 반환."""
+    name = storage.get_available_name(name)
+
+    if is_s3_storage(storage):
+        key = storage._normalize_name(clean_name(name))
+        params = storage._get_write_parameters(key)
+        if content_type:
+            params["ContentType"] = content_type
+        storage.bucket.meta.client.put_object(
+            Bucket=storage.bucket_name, Key=key, Body=data, **params
+        )
+        return name
+
+    return storage.save(name, ContentFile(data))
+
+
+def discard(storage, name):
+    """스테이징 객체 삭제 (로컬이면 비게 된 스테이징 디렉터리도 정리)."""
+    storage.delete(name)
+    if isinstance(storage, FileSystemStorage):
+        _remove_empty_parent(storage.path(name))
+
+
+def stat(storage, name):
+    """
+    객체 메타데이터 조회 (S3는 HEAD 요청).
+
+    Returns:
+        (size, content_type) — 로컬 스토리지는 content_type이 None
+        객체가 없으면 None
+    """
+    if is_s3_storage(storage):
+        try:
+            head = storage.bucket.meta.client.head_object(
+                Bucket=storage.bucket_name,
+                Key=storage._normalize_name(clean_name(name)),
+            )
+        except ClientError as e:
+            if e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
+                return None
+            raise
+        return head["ContentLength"], head.get("ContentType")
+
+    if not storage.exists(name):
+        return None
+    return storage.size(name), None
+
+
+_presign_clients = {}
+
+
+def get_presign_client(storage):
+    """
+    presigned URL 서명용 S3 클라이언트.
+
+    컨테이너 내부 엔드포인트(minio:9000)로 서명하면 브라우저가 접근할 수 없으므로
+    AWS_S3_PRESIGN_ENDPOINT_URL이 있으면 그 주소로 서명한다.
+    """
+    endpoint_url = getattr(settings, "AWS_S3_PRESIGN_ENDPOINT_URL", None)
+    if not endpoint_url:
+        return storage.bucket.meta.client
+
+    client = _presign_clients.get(endpoint_url)
+    if client is None:
+        client = storage._create_session().client(
+            "s3",
+            region_name=storage.region_name,
+            use_ssl=storage.use_ssl,
+            endpoint_url=endpoint_url,
+            config=storage.client_config,
+            verify=storage.verify,
+        )
+        _presign_clients[endpoint_url] = client
+    return client
+
+
+def presign_s3_upload(storage, name, content_type, size, method, expires):
+    """
+    name 키로 직접 업로드할 수 있는 presigned 요청 정보 생성.
+
+    - POST: 정책(policy)에 Content-Type과 정확한 크기(content-length-range)를 고정
+    - PUT : Content-Type/Content-Length를 서명 파라미터에 포함
+
+    Returns:
+        {"url": ..., "fields": {...}, "headers": {...}}
+    """
+    client = get_presign_client(storage)
+    key = storage._normalize_name(clean_name(name))
+
+    if method == "POST":
+        presigned = client.generate_presigned_post(
+            Bucket=storage.bucket_name,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", size, size],
+            ],
+            ExpiresIn=expires,
+        )
+        return {"url": presigned["url"], "fields": presigned["fields"], "headers": {}}
+
+    url = client.generate_presigned_url(
+        "put_object",
+        Params={
+            "Bucket": storage.bucket_name,
+            "Key": key,
+            "ContentType": content_type,
+            "ContentLength": size,
+        },
+        ExpiresIn=expires,
+        HttpMethod="PUT",
+    )
+    return {"url": url, "fields": {}, "headers": {"Content-Type": content_type}}
+
+
+def _remove_empty_parent(path):
+    try:
+        os.rmdir(os.path.dirname(path))
+    except OSError:
+        pass
+
+
+# ──────────────────────────────────────────────
+# Writers — write(chunk) / close() → 저장된 이름 (아직 쓰지 않았으면 None) / abort()
+# ──────────────────────────────────────────────
+class LocalFileWriter:
+    """FileSystemStorage 대상 파일에 청크를 바로 기록."""
+
+    def __init__(self, storage, name):
+        self.storage = storage
+        self.name = name
+        self.path = storage.path(name)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._fh = open(self.path, "wb")
+
+    def write(self, chunk):
+        self._fh.write(chunk)
+
+    def close(self):
+        self._fh.close()
+        return self.name
+
+    def abort(self):
+        self._fh.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        _remove_empty_parent(self.path)
+
+
+class S3MultipartWriter:
+    """
+    S3 multipart upload로 청크를 전송.
+
+    버퍼가 처음 PART_SIZE에 도달할 때 multipart upload를 시작하고 PART_SIZE만큼
+    모일 때마다 파트 하나를 올리므로 버퍼는 최대 PART_SIZE.
+    그보다 작은 파일은 S3에 아무것도 보내지 않고 close()가 None을 반환한다 —
+    호출자가 pending 바이트를 최종 키에 put()으로 한 번에 올린다 (스테이징 / 이동 없음).
+    """
+
+    def __init__(self, storage, name, content_type=None):
+        self.storage = storage
+        self.name = name
+        self.client = storage.bucket.meta.client
+        self.bucket = storage.bucket_name
+        self.key = storage._normalize_name(clean_name(name))
+        self.params = storage._get_write_parameters(self.key)
+        if content_type:
+            self.params["ContentType"] = content_type
+
+        self.upload_id = None
+        self.parts = []
+        self.buffer = bytearray()
+
+    @property
+    def pending(self):
+        """multipart를 시작하지 않은 (아직 어디에도 쓰지 않은) 파일의 바이트."""
+        return bytes(self.buffer) if self.upload_id is None else None
+
+    def write(self, chunk):
+        self.buffer.extend(chunk)
+        if len(self.buffer) >= PART_SIZE:
+            self._flush_part()
+
+    def close(self):
+        if self.upload_id is None:
+            return None
+
+        if self.buffer:
+            self._flush_part()
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
+        )
+        return self.name
+
+    def abort(self):
+        self.buffer.clear()
+        if self.upload_id is not None:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
+            )
+
+    def _flush_part(self):
+        if self.upload_id is None:
+            self.upload_id = self.client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key, **self.params
+            )["UploadId"]
+        part_number = len(self.parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=bytes(self.buffer),
+        )
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self.buffer.clear()
+
+
+class SpooledWriter:
+    """스트리밍 쓰기를 지원하지 않는 스토리지용 폴백 (메모리 상한 후 디스크로 넘김)."""
+
+    def __init__(self, storage, name):
+        self.storage = storage
+        self.name = name
+        self._fh = tempfile.SpooledTemporaryFile(
+            max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+        )
+
+    def write(self, chunk):
+        self._fh.write(chunk)
+
+    def close(self):
+        self._fh.seek(0)
+        try:
+            return self.storage.save(self.name, File(self._fh))
+        finally:
+            self._fh.close()
+
+    def abort(self):
+        self._fh.close()
+
+
+# ──────────────────────────────────────────────
+# 파트 업로드 — 요청마다 write_part() → parts 항목 하나, 마지막에 complete(parts) → 저장된 이름
+# / abort()
+# ──────────────────────────────────────────────
+class S3PartUpload:
+    """
+    여러 요청에 걸친 S3 multipart upload (파트 1개 = 청크 1개).
+
+    complete()는 S3가 서버 측에서 파트를 이어 붙이므로 바이트를 다시 읽거나 쓰지 않는다.
+    마지막 파트를 제외한 파트는 PART_SIZE 이상이어야 한다.
+    """
+
+    def __init__(self, storage, name, upload_id):
+        self.storage = storage
+        self.name = name
+        self.upload_id = upload_id
+        self.client = storage.bucket.meta.client
+        self.bucket = storage.bucket_name
+        self.key = storage._normalize_name(clean_name(name))
+
+    @classmethod
+    def start(cls, storage, name, content_type=None):
+        key = storage._normalize_name(clean_name(name))
+        params = storage._get_write_parameters(key)
+        if content_type:
+            params["ContentType"] = content_type
+        upload_id = storage.bucket.meta.client.create_multipart_upload(
+            Bucket=storage.bucket_name, Key=key, **params
+        )["UploadId"]
+        return cls(storage, name, upload_id)
+
+    def write_part(self, number, content, length, token):
+        """
+        content(파일 객체)에서 length 바이트를 number번 파트로 올리고 parts 항목 반환.
+
+        같은 번호를 늦게 다시 올려 파트가 바뀌면 complete()가 ETag 불일치로 실패한다
+        (token은 ObjectPartUpload와 인터페이스를 맞추기 위한 인자).
+        """
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=number,
+            Body=content,
+            ContentLength=length,
+        )
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    def complete(self, parts):
+        """
+        parts([{"PartNumber", "ETag"}])를 이어 붙여 객체 생성.
+
+        이미 완료된 업로드(완료 후 DB 반영 전에 실패해 다시 호출된 경우)면 객체가
+        있는지만 확인한다.
+        """
+        try:
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                raise
+            if stat(self.storage, self.name) is None:
+                raise
+        return self.name
+
+    def abort(self):
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                raise
+
+
+class ObjectPartUpload:
+    """
+    multipart upload가 없는 스토리지용 — 파트를 {prefix}/{번호-1:06d}-{예약 토큰} 객체로
+    따로 저장하고 그 이름을 parts 항목("Name")에 남긴다.
+
+    예약이 만료된 요청이 늦게 쓰더라도 다른 요청이 반영한 파트를 덮어쓰지 않도록
+    파트 이름에 예약 토큰을 넣는다. complete()는 parts의 이름을 순서대로 이어 붙여
+    스테이징에 쓴 뒤 name으로 옮긴다 (로컬 스토리지에서는 디스크 복사 + rename).
+    """
+
+    def __init__(self, storage, name, prefix):
+        self.storage = storage
+        self.name = name
+        self.prefix = prefix
+
+    def part_name(self, number, token=None):
+        if token is None:
+            # 예약 토큰을 쓰기 전 세션의 파트 이름
+            return f"{self.prefix}/{number - 1:06d}"
+        return f"{self.prefix}/{number - 1:06d}-{token.hex}"
+
+    def write_part(self, number, content, length, token):
+        writer = open_writer(self.storage, self.part_name(number, token))
+        try:
+            for block in iter(lambda: content.read(COPY_BLOCK_SIZE), b""):
+                writer.write(block)
+        except Exception:
+            writer.abort()
+            raise
+        return {"PartNumber": number, "Name": writer.close()}
+
+    def complete(self, parts):
+        """parts([{"PartNumber", "Name"}])를 순서대로 이어 붙여 name(사용 가능한 이름으로 보정)에 저장."""
+        staged = staging_name(self.storage, os.path.basename(self.name))
+        writer = open_writer(self.storage, staged)
+        try:
+            for part in parts:
+                name = part.get("Name") or self.part_name(part["PartNumber"])
+                with self.storage.open(name, "rb") as fh:
+                    for block in fh.chunks(COPY_BLOCK_SIZE):
+                        writer.write(block)
+        except Exception:
+            writer.abort()
+            raise
+        writer.close()
+        return move(self.storage, staged, self.name)
+
+    def abort(self):
+        try:
+            _, names = self.storage.listdir(self.prefix)
+        except FileNotFoundError:
+            names = []
+        for name in names:
+            discard(self.storage, f"{self.prefix}/{name}")
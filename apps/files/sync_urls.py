@@ -0,0 +1,7 @@
+from django.urls import path
+
+from apps.files.views import FileSyncView
+
+urlpatterns = [
+    path("files/", FileSyncView.as_view(), name="sync-files"),
+]
@@ -0,0 +1,28 @@
+from django.test import TestCase
+
+from apps.core.pagination import KeysetPagination
+from apps.core.testing import QueryPlanTestMixin
+from apps.files.filters import FileFilterSet
+from apps.files.models import UploadedFile
+
+
+class FileListIndexTests(QueryPlanTestMixin, TestCase):
+    """파일 목록 쿼리가 필터 조합별로 0003의 부분 인덱스(is_active=True)를 타는지 확인."""
+
+    def list_queryset(self, params):
+        # FileListView와 같은 queryset / 필터 + 페이지네이션 정렬
+        queryset = UploadedFile.objects.select_related("club", "uploaded_by").all()
+        queryset = FileFilterSet(params, queryset=queryset).qs
+        return queryset.order_by(*KeysetPagination.ordering)[:20]
+
+    def test_list_uses_partial_indexes(self):
+        receipt = UploadedFile.Category.RECEIPT
+        cases = [
+            ({}, "file_created_idx"),
+            ({"club": "1"}, "file_club_created_idx"),
+            ({"category": receipt}, "file_cat_created_idx"),
+            ({"club": "1", "category": receipt}, "file_club_cat_created_idx"),
+        ]
+        for params, index_name in cases:
+            with self.subTest(params=params):
+                self.assertUsesIndex(self.list_queryset(params), index_name)
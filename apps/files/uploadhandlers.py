@@ -0,0 +1,189 @@
+import hashlib
+import io
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile as DjangoUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+
+from apps.core.exceptions import PayloadTooLarge
+from apps.files.storage import (
+    discard,
+    get_upload_storage,
+    move,
+    open_writer,
+    put,
+    staging_name,
+)
+
+# 요청 하나가 스토리지에 쓰지 않고 메모리에 들고 있을 작은 파일 합계 상한
+# (넘으면 그 뒤 파일은 스테이징 키에 바로 기록)
+MAX_PENDING_SIZE = 32 * 1024 * 1024
+
+
+class StagedUploadedFile(DjangoUploadedFile):
+    """
+    스토리지 스테이징 키에 이미 기록된 업로드 파일.
+
+    commit()으로 최종 경로(upload_to)에 옮기기 전까지는 임시 객체이며,
+    요청 종료 시 Django가 close()를 호출하면 커밋되지 않은 스테이징 객체는 삭제된다.
+
+    pending이 있으면 (S3에 PART_SIZE 미만인 작은 파일) 바이트가 아직 메모리에만 있고
+    commit()이 최종 경로에 한 번에 기록한다 — 스테이징 쓰기와 이동(copy + delete)이 없다.
+    """
+
+    def __init__(
+        self,
+        storage,
+        staged_name,
+        name,
+        content_type,
+        size,
+        checksum,
+        charset=None,
+        content_type_extra=None,
+        pending=None,
+    ):
+        super().__init__(
+            file=None,
+            name=name,
+            content_type=content_type,
+            size=size,
+            charset=charset,
+            content_type_extra=content_type_extra,
+        )
+        self.storage = storage
+        self.staged_name = staged_name
+        self.checksum = checksum
+        self.pending = pending
+        self.committed = False
+
+    def commit(self, name):
+        """스테이징 객체를 name 경로로 옮기고 (pending이면 기록하고) 실제 저장된 이름 반환."""
+        if self.pending is not None:
+            stored_name = put(self.storage, name, self.pending, self.content_type)
+            self.pending = None
+        else:
+            stored_name = move(self.storage, self.staged_name, name)
+        self.staged_name = stored_name
+        self.committed = True
+        return stored_name
+
+    def open(self, mode="rb"):
+        if self.pending is not None:
+            self.file = io.BytesIO(self.pending)
+        else:
+            self.file = self.storage.open(self.staged_name, mode)
+        return self
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if not self.committed:
+            self.committed = True
+            if self.pending is None:
+                discard(self.storage, self.staged_name)
+            self.pending = None
+
+
+class StorageUploadHandler(FileUploadHandler):
+    """
+    multipart 파일 파트를 메모리/임시 파일을 거치지 않고 스토리지에 바로 기록하는 핸들러.
+
+    - 청크를 받는 즉시 S3 multipart upload(또는 로컬 파일)로 전송
+      (S3에서 PART_SIZE 미만인 파일은 MAX_PENDING_SIZE까지 메모리에 두었다가
+      commit 때 최종 경로에 PUT 한 번으로 기록)
+    - 전송하면서 크기와 SHA-256 체크섬을 계산
+    - 결과로 StagedUploadedFile을 request.FILES에 넣음 (view에서 commit)
+
+    요청 수준 제한 (초과하는 즉시 413, 남은 본문은 읽지 않음):
+    - Content-Length > MAX_UPLOAD_REQUEST_SIZE → 본문을 읽기 전에 거절
+    - 파일 수 > MAX_UPLOAD_FILES
+    - 파일별 누적 크기 > MAX_UPLOAD_SIZE, 요청 전체 누적 크기 > MAX_UPLOAD_REQUEST_SIZE
+      (Content-Length가 없거나 틀린 요청 대비)
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_size = settings.MAX_UPLOAD_SIZE
+        self.max_request_size = settings.MAX_UPLOAD_REQUEST_SIZE
+        self.max_files = settings.MAX_UPLOAD_FILES
+        self.writer = None
+        self.completed = []
+        self.total_size = 0
+        self.pending_size = 0
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        if content_length > self.max_request_size:
+            self._reject(f"요청 크기가 {self.max_request_size // (1024 * 1024)}MB를 초과합니다.")
+        return None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        if len(self.completed) >= self.max_files:
+            self._reject(f"파일은 한 번에 최대 {self.max_files}개까지 업로드할 수 있습니다.")
+        self.storage = get_upload_storage()
+        self.staged_name = staging_name(self.storage, self.file_name)
+        self.writer = open_writer(self.storage, self.staged_name, self.content_type)
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.size += len(raw_data)
+        self.total_size += len(raw_data)
+        if self.size > self.max_size:
+            self._reject(
+                f"파일 크기가 {self.max_size // (1024 * 1024)}MB를 초과합니다: {self.file_name}"
+            )
+        if self.total_size > self.max_request_size:
+            self._reject(f"요청 크기가 {self.max_request_size // (1024 * 1024)}MB를 초과합니다.")
+        self.hasher.update(raw_data)
+        self.writer.write(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        stored_name = self.writer.close()
+        pending = None
+        if stored_name is None:
+            pending = self.writer.pending
+            if self.pending_size + len(pending) > MAX_PENDING_SIZE:
+                stored_name = put(
+                    self.storage, self.staged_name, pending, self.content_type
+                )
+                pending = None
+            else:
+                self.pending_size += len(pending)
+        self.writer = None
+        staged = StagedUploadedFile(
+            storage=self.storage,
+            staged_name=stored_name,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=self.size,
+            checksum=self.hasher.hexdigest(),
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+            pending=pending,
+        )
+        self.completed.append(staged)
+        return staged
+
+    def upload_interrupted(self):
+        if self.writer is not None:
+            self.writer.abort()
+            self.writer = None
+
+    def _reject(self, detail):
+        """
+        진행 중인 업로드와 이미 스테이징된 파일을 정리하고 413으로 중단.
+
+        예외가 파서 밖으로 전파되면 request.FILES가 채워지지 않아
+        요청 종료 시 정리가 되지 않으므로 여기서 직접 지운다.
+        """
+        self.upload_interrupted()
+        for staged in self.completed:
+            staged.close()
+        raise PayloadTooLarge(detail)
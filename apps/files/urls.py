@@ -1,9 +1,48 @@
 from django.urls import path
 
-from apps.files.views import FileDetailView, FileListView, FileUploadView
+from apps.files.storage import get_upload_storage, is_s3_storage
+from apps.files.views import (
+    FileDetailView,
+    FileListView,
+    FileUploadView,
+    LocalPresignedUploadView,
+    PresignedUploadCompleteView,
+    PresignedUploadView,
+    UploadSessionCompleteView,
+    UploadSessionCreateView,
+    UploadSessionDetailView,
+)
 
 urlpatterns = [
     path("", FileListView.as_view(), name="file-list"),
     path("upload/", FileUploadView.as_view(), name="file-upload"),
+    path("presign/", PresignedUploadView.as_view(), name="file-presign"),
+    path(
+        "presign/complete/",
+        PresignedUploadCompleteView.as_view(),
+        name="file-presign-complete",
+    ),
+    path("uploads/", UploadSessionCreateView.as_view(), name="upload-session-create"),
+    path(
+        "uploads/<uuid:pk>/",
+        UploadSessionDetailView.as_view(),
+        name="upload-session-detail",
+    ),
+    path(
+        "uploads/<uuid:pk>/complete/",
+        UploadSessionCompleteView.as_view(),
+        name="upload-session-complete",
+    ),
     path("<int:pk>/", FileDetailView.as_view(), name="file-detail"),
 ]
+
+# 로컬 스토리지용 presigned URL 대역 (인증 없이 토큰만으로 업로드) — S3 환경에서는
+# 클라이언트가 S3 presigned URL로 직접 올리므로 라우팅하지 않는다
+if not is_s3_storage(get_upload_storage()):
+    urlpatterns.append(
+        path(
+            "presign/local/<str:token>/",
+            LocalPresignedUploadView.as_view(),
+            name="file-presign-local",
+        )
+    )
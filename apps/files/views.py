@@ -1,29 +1,63 @@
 from django.conf import settings
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.urls import reverse
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
-from rest_framework.exceptions import NotFound
-from rest_framework.parsers import FormParser, MultiPartParser
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import (
+    NotFound,
+    PermissionDenied,
+    UnsupportedMediaType,
+    ValidationError,
+)
+from rest_framework.parsers import FileUploadParser, FormParser, MultiPartParser
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.clubs.models import Club
-from apps.core.exceptions import BusinessLogicError
+from apps.core.conditional import conditional_response, object_validators, queryset_etag
+from apps.core.exceptions import BusinessLogicError, PayloadTooLarge
 from apps.core.pagination import CustomPageNumberPagination
+from apps.core.sync import SyncView
 from apps.files.filters import FileFilterSet
-from apps.files.models import UploadedFile
-from apps.files.serializers import FileUploadSerializer, UploadedFileSerializer
+from apps.files.models import UploadedFile, UploadSession
+from apps.files.presign import build_upload_key, issue_ticket, load_ticket
+from apps.files.resumable import append_chunk, create_session, discard_session, finalize
+from apps.files.serializers import (
+    FileUploadSerializer,
+    PresignedUploadCompleteSerializer,
+    PresignedUploadSerializer,
+    PresignedUploadTicketSerializer,
+    UploadedFileSerializer,
+    UploadSessionCreateSerializer,
+    UploadSessionSerializer,
+)
+from apps.files.services import store_uploads
+from apps.files.storage import discard, get_upload_storage, stat
+from apps.files.uploadhandlers import StorageUploadHandler
 
 
 # ──────────────────────────────────────────────
 # 파일 업로드 (다중 파일 지원)
 # ──────────────────────────────────────────────
 class FileUploadView(APIView):
-    """POST /api/files/upload/ — multipart 파일 업로드."""
+    """
+    POST /api/files/upload/ — multipart 파일 업로드.
+
+    StorageUploadHandler가 파일 파트를 스트리밍으로 스토리지 스테이징 키에 바로 기록하고,
+    검증이 끝나면 upload_to 경로로 옮긴다 (메모리/임시 파일에 전체를 버퍼링하지 않음).
+    최종 경로 이동은 스레드 풀에서 병렬로, 메타데이터는 bulk_create 한 번으로 저장한다.
+    """
 
     permission_classes = [IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
 
+    def initialize_request(self, request, *args, **kwargs):
+        # request.FILES 접근 전에 업로드 핸들러를 교체해야 한다
+        request.upload_handlers = [StorageUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
+
     @extend_schema(
         request={
             "multipart/form-data": {
@@ -71,25 +105,18 @@ class FileUploadView(APIView):
             except Club.DoesNotExist:
                 raise NotFound("존재하지 않는 동아리입니다.")
 
-        # 파일 크기 검증 + 저장
+        # 파일 크기 검증 (스토리지에 쓰기 전에 배치 전체 검사)
         max_size = settings.MAX_UPLOAD_SIZE
-        uploaded = []
         for f in files:
             if f.size > max_size:
-                raise BusinessLogicError(
+                raise PayloadTooLarge(
                     f"파일 크기가 {max_size // (1024 * 1024)}MB를 초과합니다: {f.name}"
                 )
 
-            obj = UploadedFile.objects.create(
-                file=f,
-                original_name=f.name,
-                size=f.size,
-                mime_type=f.content_type or "application/octet-stream",
-                category=category,
-                uploaded_by=request.user,
-                club=club,
-            )
-            uploaded.append(obj)
+        # 병렬 저장 + bulk INSERT (실패 시 저장된 객체 삭제)
+        uploaded = store_uploads(
+            files, category=category, club=club, uploaded_by=request.user
+        )
 
         serializer = UploadedFileSerializer(
             uploaded, many=True, context={"request": request}
@@ -97,12 +124,318 @@ class FileUploadView(APIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+# ──────────────────────────────────────────────
+# presigned 직접 업로드 (S3/MinIO로 바로 업로드, Django는 바이트를 받지 않음)
+# ──────────────────────────────────────────────
+class PresignedUploadView(APIView):
+    """
+    POST /api/files/presign/ — 직접 업로드용 URL/키 발급.
+
+    1) 이 API로 url + uploadToken 발급
+    2) 클라이언트가 url로 파일을 직접 업로드 (POST form 또는 PUT)
+    3) POST /api/files/presign/complete/ 에 uploadToken 전달 → UploadedFile 생성
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=PresignedUploadSerializer,
+        responses={201: PresignedUploadTicketSerializer},
+        summary="직접 업로드 URL 발급",
+    )
+    def post(self, request):
+        serializer = PresignedUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        max_size = settings.MAX_UPLOAD_SIZE
+        if data["size"] > max_size:
+            raise PayloadTooLarge(
+                f"파일 크기가 {max_size // (1024 * 1024)}MB를 초과합니다: {data['fileName']}"
+            )
+
+        club = None
+        if data.get("club"):
+            try:
+                club = Club.objects.get(pk=data["club"])
+            except Club.DoesNotExist:
+                raise NotFound("존재하지 않는 동아리입니다.")
+
+        storage = get_upload_storage()
+        key = build_upload_key(storage, club, data["category"], data["fileName"])
+        ticket = issue_ticket(
+            request,
+            storage,
+            key=key,
+            size=data["size"],
+            mime_type=data["mimeType"],
+            method=data["method"],
+            originalName=data["fileName"],
+            category=data["category"],
+            club=club.pk if club else None,
+        )
+        return Response(ticket, status=status.HTTP_201_CREATED)
+
+
+class PresignedUploadCompleteView(APIView):
+    """
+    POST /api/files/presign/complete/ — 직접 업로드 완료 처리.
+
+    스토리지에 HEAD 요청으로 객체 존재와 크기를 확인한 뒤 UploadedFile 생성.
+    발급 시 선언한 크기와 다르면 객체를 지우고 거절한다.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=PresignedUploadCompleteSerializer,
+        responses={201: UploadedFileSerializer},
+        summary="직접 업로드 완료 확인 및 등록",
+    )
+    def post(self, request):
+        serializer = PresignedUploadCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ticket = load_ticket(serializer.validated_data["uploadToken"])
+        if ticket is None or ticket["user"] != request.user.pk:
+            raise PermissionDenied("유효하지 않거나 만료된 업로드 토큰입니다.")
+
+        key = ticket["key"]
+        if UploadedFile.all_objects.filter(file=key).exists():
+            raise BusinessLogicError("이미 등록된 업로드입니다.")
+
+        storage = get_upload_storage()
+        head = stat(storage, key)
+        if head is None:
+            raise BusinessLogicError("업로드된 파일을 찾을 수 없습니다.")
+        size, content_type = head
+        if size != ticket["size"]:
+            discard(storage, key)
+            raise BusinessLogicError("업로드된 파일 크기가 발급 시 선언한 크기와 다릅니다.")
+
+        club = None
+        if ticket["club"]:
+            try:
+                club = Club.objects.get(pk=ticket["club"])
+            except Club.DoesNotExist:
+                raise NotFound("존재하지 않는 동아리입니다.")
+
+        obj = UploadedFile(
+            file=key,
+            original_name=ticket["originalName"],
+            size=size,
+            mime_type=content_type or ticket["mimeType"],
+            category=ticket["category"],
+            uploaded_by=request.user,
+            club=club,
+        )
+        obj.queue_ocr()
+        try:
+            with transaction.atomic():
+                obj.save()
+        except IntegrityError:
+            # 같은 토큰의 완료 요청이 동시에 먼저 등록 (file_blobless_key_uniq)
+            raise BusinessLogicError("이미 등록된 업로드입니다.")
+        serializer = UploadedFileSerializer(obj, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class LocalPresignedUploadView(APIView):
+    """
+    POST|PUT /api/files/presign/local/{token}/ — 로컬 스토리지용 presigned URL 대역.
+
+    S3가 아닌 환경(로컬 개발)에서 presign 흐름을 그대로 테스트하기 위한 엔드포인트.
+    업로드 스토리지가 S3면 라우팅하지 않는다 (apps.files.urls).
+    S3 presigned URL처럼 URL의 토큰 자체가 인증이며 JWT는 요구하지 않는다.
+    - POST: multipart form의 file 필드
+    - PUT : 요청 본문 전체
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    parser_classes = [MultiPartParser, FileUploadParser]
+
+    @extend_schema(exclude=True)
+    def post(self, request, token):
+        return self._store(request, token, "POST")
+
+    @extend_schema(exclude=True)
+    def put(self, request, token):
+        return self._store(request, token, "PUT")
+
+    def _store(self, request, token, method):
+        ticket = load_ticket(token, max_age=settings.FILES_PRESIGN_EXPIRES)
+        if ticket is None or ticket["method"] != method:
+            raise PermissionDenied("유효하지 않거나 만료된 업로드 URL입니다.")
+
+        if method == "PUT":
+            content = File(request._request)
+            size = int(request.META.get("CONTENT_LENGTH") or 0)
+        else:
+            content = request.FILES.get("file")
+            if content is None:
+                raise BusinessLogicError("파일이 필요합니다.")
+            size = content.size
+        if size != ticket["size"]:
+            raise BusinessLogicError("파일 크기가 발급 시 선언한 크기와 다릅니다.")
+
+        storage = get_upload_storage()
+        key = ticket["key"]
+        if storage.exists(key):
+            raise BusinessLogicError("이미 업로드된 키입니다.")
+        storage.save(key, content)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ──────────────────────────────────────────────
+# 재개 가능한 청크 업로드 (tus 프로토콜 방식)
+# ──────────────────────────────────────────────
+class UploadSessionCreateView(APIView):
+    """
+    POST /api/files/uploads/ — 업로드 세션 생성.
+
+    대용량 보고서/성과물(영상, 발표 자료)처럼 중간에 끊기기 쉬운 업로드용.
+    1) 세션 생성 → id, offset(0), chunkSize
+    2) PATCH /uploads/{id}/ 로 청크 전송 (Upload-Offset 헤더 = 현재 offset)
+    3) 끊기면 HEAD /uploads/{id}/ 로 offset 확인 후 이어서 전송
+    4) POST /uploads/{id}/complete/ → UploadedFile 생성
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=UploadSessionCreateSerializer,
+        responses={201: UploadSessionSerializer},
+        summary="재개 가능한 업로드 세션 생성",
+    )
+    def post(self, request):
+        serializer = UploadSessionCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        max_size = settings.RESUMABLE_UPLOAD_MAX_SIZE
+        if data["size"] > max_size:
+            raise PayloadTooLarge(
+                f"파일 크기가 {max_size // (1024 * 1024)}MB를 초과합니다: {data['fileName']}"
+            )
+
+        club = None
+        if data.get("club"):
+            try:
+                club = Club.objects.get(pk=data["club"])
+            except Club.DoesNotExist:
+                raise NotFound("존재하지 않는 동아리입니다.")
+
+        session = create_session(
+            original_name=data["fileName"],
+            mime_type=data["mimeType"],
+            category=data["category"],
+            size=data["size"],
+            uploaded_by=request.user,
+            club=club,
+        )
+        location = reverse("upload-session-detail", args=[session.pk])
+        return Response(
+            UploadSessionSerializer(session).data,
+            status=status.HTTP_201_CREATED,
+            headers={"Location": request.build_absolute_uri(location)},
+        )
+
+
+class UploadSessionDetailView(APIView):
+    """
+    GET|HEAD /api/files/uploads/{id}/ → 세션 상태 (Upload-Offset / Upload-Length 헤더)
+    PATCH    /api/files/uploads/{id}/ → 청크 업로드
+    DELETE   /api/files/uploads/{id}/ → 세션 취소 (받은 청크 삭제)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    # tus 규격의 청크 요청 Content-Type
+    CHUNK_CONTENT_TYPE = "application/offset+octet-stream"
+
+    def _get_object(self, pk):
+        try:
+            return UploadSession.objects.get(pk=pk, uploaded_by=self.request.user)
+        except UploadSession.DoesNotExist:
+            raise NotFound("존재하지 않거나 이미 종료된 업로드 세션입니다.")
+
+    @extend_schema(
+        responses={200: UploadSessionSerializer},
+        summary="업로드 세션 상태 (현재 offset)",
+    )
+    def get(self, request, pk):
+        session = self._get_object(pk)
+        return Response(
+            UploadSessionSerializer(session).data,
+            headers=self._offset_headers(session),
+        )
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "Upload-Offset",
+                int,
+                location=OpenApiParameter.HEADER,
+                required=True,
+                description="청크 시작 위치 (현재 offset과 같아야 함)",
+            ),
+        ],
+        request={CHUNK_CONTENT_TYPE: {"type": "string", "format": "binary"}},
+        responses={204: None},
+        summary="청크 업로드",
+    )
+    def patch(self, request, pk):
+        if request.content_type.split(";")[0].strip() != self.CHUNK_CONTENT_TYPE:
+            raise UnsupportedMediaType(request.content_type)
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            length = int(request.headers["Content-Length"])
+        except (KeyError, ValueError):
+            raise BusinessLogicError("Upload-Offset, Content-Length 헤더가 필요합니다.")
+
+        session = append_chunk(pk, request.user, offset, request._request, length)
+        return Response(
+            status=status.HTTP_204_NO_CONTENT, headers=self._offset_headers(session)
+        )
+
+    @extend_schema(responses={204: None}, summary="업로드 세션 취소")
+    def delete(self, request, pk):
+        session = self._get_object(pk)
+        discard_session(session)
+        session.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def _offset_headers(self, session):
+        return {
+            "Upload-Offset": str(session.offset),
+            "Upload-Length": str(session.size),
+            "Cache-Control": "no-store",
+        }
+
+
+class UploadSessionCompleteView(APIView):
+    """POST /api/files/uploads/{id}/complete/ — 청크를 합쳐 UploadedFile 생성."""
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=None,
+        responses={201: UploadedFileSerializer},
+        summary="청크 업로드 완료 → 파일 등록",
+    )
+    def post(self, request, pk):
+        obj = finalize(pk, request.user)
+        serializer = UploadedFileSerializer(obj, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
 # ──────────────────────────────────────────────
 # 파일 상세 / 삭제
 # ──────────────────────────────────────────────
 class FileDetailView(APIView):
     """
-    GET    /api/files/{id}/   → 파일 정보 조회
+    GET    /api/files/{id}/   → 파일 정보 조회 (ETag / Last-Modified 조건부 GET)
     DELETE /api/files/{id}/   → 파일 삭제 (소프트 삭제)
     """
 
@@ -120,8 +453,15 @@ class FileDetailView(APIView):
     )
     def get(self, request, pk):
         obj = self._get_object(pk)
-        serializer = UploadedFileSerializer(obj, context={"request": request})
-        return Response(serializer.data)
+        etag, last_modified = object_validators(request, obj)
+        return conditional_response(
+            request,
+            lambda: Response(
+                UploadedFileSerializer(obj, context={"request": request}).data
+            ),
+            etag,
+            last_modified,
+        )
 
     @extend_schema(
         responses={204: None},
@@ -137,7 +477,11 @@ class FileDetailView(APIView):
 # 파일 목록 (필터, 페이지네이션)
 # ──────────────────────────────────────────────
 class FileListView(APIView):
-    """GET /api/files/ — 동아리별/카테고리별 파일 목록."""
+    """
+    GET /api/files/ — 동아리별/카테고리별 파일 목록.
+
+    If-None-Match가 필터된 목록의 ETag와 같으면 목록을 조회/직렬화하지 않고 304.
+    """
 
     permission_classes = [IsAuthenticated]
 
@@ -150,8 +494,18 @@ class FileListView(APIView):
                 enum=[c.value for c in UploadedFile.Category],
                 description="카테고리로 필터",
             ),
+            OpenApiParameter(
+                "q",
+                str,
+                description="파일명 / 영수증 거래처·본문 검색 (관련도순, 커서 모드에서는 최신순)",
+            ),
             OpenApiParameter("page", int, description="페이지 번호 (1-based)"),
             OpenApiParameter("size", int, description="페이지당 항목 수"),
+            OpenApiParameter(
+                "cursor",
+                str,
+                description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 nextCursor / prevCursor)",
+            ),
         ],
         responses={200: UploadedFileSerializer(many=True)},
         summary="파일 목록 (필터, 페이지네이션)",
@@ -163,9 +517,34 @@ class FileListView(APIView):
         filterset = FileFilterSet(request.query_params, queryset=queryset)
         queryset = filterset.qs
 
+        return conditional_response(
+            request,
+            lambda: self._page(request, queryset),
+            queryset_etag(request, queryset),
+        )
+
+    def _page(self, request, queryset):
         paginator = CustomPageNumberPagination()
         page = paginator.paginate_queryset(queryset, request)
         serializer = UploadedFileSerializer(
             page, many=True, context={"request": request}
         )
         return paginator.get_paginated_response(serializer.data)
+
+
+# ──────────────────────────────────────────────
+# 변경분 동기화 (apps.core.sync)
+# ──────────────────────────────────────────────
+class FileSyncView(SyncView):
+    """GET /api/sync/files/?since=&club= → 바뀐 파일 (목록 응답 형태) + 삭제된 파일 ID"""
+
+    serializer_class = UploadedFileSerializer
+
+    def get_queryset(self):
+        qs = UploadedFile.all_objects.all()
+        club_id = self.request.query_params.get("club")
+        if club_id:
+            if not club_id.isdigit():
+                raise ValidationError({"club": "동아리 ID는 정수여야 합니다."})
+            qs = qs.filter(club_id=club_id)
+        return qs
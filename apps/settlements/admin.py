@@ -0,0 +1,48 @@
+from django.contrib import admin
+
+from apps.settlements.models import BudgetAllocation, ExpenseLine, SpendRollup
+
+
+@admin.register(ExpenseLine)
+class ExpenseLineAdmin(admin.ModelAdmin):
+    list_display = (
+        "spent_on",
+        "vendor",
+        "amount",
+        "tax_amount",
+        "category",
+        "club",
+        "is_active",
+    )
+    list_filter = ("category", "is_active", "club")
+    search_fields = ("vendor", "club__name")
+    raw_id_fields = ("club", "source_file")
+    date_hierarchy = "spent_on"
+
+
+@admin.register(BudgetAllocation)
+class BudgetAllocationAdmin(admin.ModelAdmin):
+    list_display = ("title", "club", "amount", "allocated_on", "is_active")
+    list_filter = ("is_active", "club")
+    search_fields = ("title", "club__name")
+    raw_id_fields = ("club",)
+
+
+@admin.register(SpendRollup)
+class SpendRollupAdmin(admin.ModelAdmin):
+    """증분 갱신되는 집계 — 수정은 reconcile_rollups 커맨드로만."""
+
+    list_display = ("club", "month", "category", "count", "amount", "tax_amount")
+    list_filter = ("club",)
+    readonly_fields = (
+        "club",
+        "category",
+        "month",
+        "count",
+        "amount",
+        "tax_amount",
+        "updated_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
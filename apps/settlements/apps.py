@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class SettlementsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.settlements"
+    verbose_name = "Settlements"
+
+    def ready(self):
+        from apps.settlements import signals  # noqa: F401
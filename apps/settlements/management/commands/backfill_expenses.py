@@ -0,0 +1,72 @@
+"""
+영수증 OCR 결과로 지출 내역(ExpenseLine)을 채우는 커맨드.
+
+정산 테이블 도입 전에 OCR이 끝난 파일이나 동기화가 누락된 파일을 반영한다.
+기본은 지출 내역이 없는 파일만 처리하므로 여러 번 실행해도 이어서 진행된다.
+
+사용법:
+    python manage.py backfill_expenses              # 누락분만 반영
+    python manage.py backfill_expenses --all        # 전체 다시 반영 (파싱 규칙 변경 시)
+    python manage.py backfill_expenses --dry-run    # 대상 건수만 출력
+"""
+from django.core.management.base import BaseCommand
+
+from apps.files.models import UploadedFile
+from apps.settlements.services import sync_expense_lines
+
+
+class Command(BaseCommand):
+    help = "OCR이 끝난 영수증 파일의 지출 내역을 채웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="이미 지출 내역이 있는 파일도 다시 반영합니다.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 처리할 파일 수 (기본 500)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="반영하지 않고 대상 건수만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        # 소프트 삭제된 파일도 비활성 내역으로 반영 (복구 시 그대로 집계에 포함)
+        pending = UploadedFile.all_objects.filter(
+            club__isnull=False, ocr_result__isnull=False
+        )
+        if not options["all"]:
+            pending = pending.filter(expense_line__isnull=True)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{pending.count()}개 파일 대상 (dry-run)"))
+            return
+
+        # pk 키셋으로 배치 처리 (파싱 불가 파일이 남아도 같은 행을 다시 읽지 않음)
+        last_pk, scanned, synced = 0, 0, 0
+        fields = ("pk", "club_id", "ocr_result", "is_active")
+        while True:
+            batch = list(
+                pending.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only(*fields)[: options["batch_size"]]
+            )
+            if not batch:
+                break
+            synced += sync_expense_lines(batch)
+            scanned += len(batch)
+            last_pk = batch[-1].pk
+            self.stdout.write(f"  {scanned}개 처리 (지출 내역 {synced}건)")
+
+        skipped = scanned - synced
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{synced}건 반영 완료" + (f" (파싱 불가 {skipped}건 제외)" if skipped else "")
+            )
+        )
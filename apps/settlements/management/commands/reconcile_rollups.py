@@ -0,0 +1,111 @@
+"""
+월별 지출 집계(SpendRollup) 보정 커맨드.
+
+활성 지출 내역(ExpenseLine)에서 (동아리, 분류, 월) 합계를 GROUP BY로 다시 계산해
+저장된 집계 행과 비교하고, 다른 행을 원본 기준으로 바로잡는다.
+(직접 SQL 수정, 증분 갱신 도중 실패 등으로 생긴 불일치 보정)
+
+사용법:
+    python manage.py reconcile_rollups            # 불일치 집계 보정
+    python manage.py reconcile_rollups --dry-run  # 불일치만 출력
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+from apps.settlements.models import ExpenseLine, SpendRollup
+
+EMPTY = (0, 0, 0)
+
+
+class Command(BaseCommand):
+    help = "월별 지출 집계를 지출 내역에서 다시 계산해 불일치를 보정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="수정하지 않고 불일치 목록만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            stored = {
+                (row.club_id, row.category, row.month): row
+                for row in SpendRollup.objects.select_for_update()
+            }
+            actual = self._actual_totals()
+
+            drifted = []
+            for key in sorted(stored.keys() | actual.keys()):
+                row = stored.get(key)
+                current = (row.count, row.amount, row.tax_amount) if row else EMPTY
+                expected = actual.get(key, EMPTY)
+                if current != expected:
+                    drifted.append((key, current, expected))
+
+            for (club_id, category, month), current, expected in drifted:
+                self.stdout.write(
+                    f"  [불일치] 동아리 {club_id} {month:%Y-%m} {category or '-'}: "
+                    f"{current[1]:,}원/{current[0]}건 → {expected[1]:,}원/{expected[0]}건"
+                )
+
+            # 건수 0인 행 (모두 삭제된 달/분류)은 불일치가 아니어도 정리 대상
+            empty = [row.pk for key, row in stored.items() if key not in actual]
+
+            if not drifted and not empty:
+                self.stdout.write(self.style.SUCCESS("불일치 없음"))
+                return
+
+            if options["dry_run"]:
+                self.stdout.write(
+                    self.style.WARNING(f"{len(drifted)}개 집계 행 불일치 (dry-run)")
+                )
+                return
+
+            self._rebuild(stored, actual, drifted, empty)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(drifted)}개 집계 행 보정 완료 (빈 행 {len(empty)}개 정리)")
+        )
+
+    def _actual_totals(self):
+        """활성 지출 내역의 (동아리, 분류, 월) 합계 — GROUP BY 한 번."""
+        rows = (
+            ExpenseLine.objects.annotate(month=TruncMonth("spent_on"))
+            .order_by()
+            .values("club_id", "category", "month")
+            .annotate(
+                count=Count("pk"),
+                total_amount=Sum("amount"),
+                total_tax=Sum("tax_amount"),
+            )
+        )
+        return {
+            (row["club_id"], row["category"], row["month"]): (
+                row["count"],
+                row["total_amount"],
+                row["total_tax"],
+            )
+            for row in rows
+        }
+
+    def _rebuild(self, stored, actual, drifted, empty):
+        updated = []
+        created = []
+        for key, _current, (count, amount, tax) in drifted:
+            if key not in actual:
+                continue  # empty 목록에서 삭제
+            row = stored.get(key)
+            if row is None:
+                club_id, category, month = key
+                row = SpendRollup(club_id=club_id, category=category, month=month)
+                created.append(row)
+            else:
+                updated.append(row)
+            row.count, row.amount, row.tax_amount = count, amount, tax
+
+        SpendRollup.objects.filter(pk__in=empty).delete()
+        SpendRollup.objects.bulk_update(updated, ["count", "amount", "tax_amount"])
+        SpendRollup.objects.bulk_create(created)
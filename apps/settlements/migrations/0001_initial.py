@@ -0,0 +1,96 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("clubs", "0004_add_club_member_count"),
+        ("files", "0008_add_ocr_result_cache"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExpenseLine",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        db_index=True, default=True, verbose_name="활성 여부"
+                    ),
+                ),
+                (
+                    "vendor",
+                    models.CharField(blank=True, max_length=100, verbose_name="거래처"),
+                ),
+                ("spent_on", models.DateField(verbose_name="사용일")),
+                (
+                    "amount",
+                    models.PositiveBigIntegerField(verbose_name="금액 (원, 부가세 포함)"),
+                ),
+                (
+                    "tax_amount",
+                    models.PositiveBigIntegerField(default=0, verbose_name="부가세 (원)"),
+                ),
+                (
+                    "category",
+                    models.CharField(blank=True, max_length=50, verbose_name="지출 분류"),
+                ),
+                (
+                    "club",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="expense_lines",
+                        to="clubs.club",
+                        verbose_name="동아리",
+                    ),
+                ),
+                (
+                    "source_file",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="expense_line",
+                        to="files.uploadedfile",
+                        verbose_name="원본 영수증",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "지출 내역",
+                "verbose_name_plural": "지출 내역",
+                "ordering": ["-spent_on", "-id"],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("is_active", True)),
+                        fields=["club", "spent_on"],
+                        name="expense_club_spent_idx",
+                    ),
+                    models.Index(
+                        condition=models.Q(("is_active", True)),
+                        fields=["club", "category", "spent_on"],
+                        name="expense_club_cat_spent_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,135 @@
+# Generated by Django 5.0.14 on 2026-10-17 08:07
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def populate_spend_rollups(apps, schema_editor):
+    ExpenseLine = apps.get_model("settlements", "ExpenseLine")
+    SpendRollup = apps.get_model("settlements", "SpendRollup")
+    rows = (
+        ExpenseLine.objects.filter(is_active=True)
+        .annotate(month=TruncMonth("spent_on"))
+        .order_by()
+        .values("club_id", "category", "month")
+        .annotate(count=Count("pk"), total=Sum("amount"), tax=Sum("tax_amount"))
+    )
+    SpendRollup.objects.bulk_create(
+        SpendRollup(
+            club_id=row["club_id"],
+            category=row["category"],
+            month=row["month"],
+            count=row["count"],
+            amount=row["total"],
+            tax_amount=row["tax"],
+        )
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clubs", "0004_add_club_member_count"),
+        ("settlements", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BudgetAllocation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        db_index=True, default=True, verbose_name="활성 여부"
+                    ),
+                ),
+                ("title", models.CharField(max_length=100, verbose_name="배정명")),
+                ("amount", models.PositiveBigIntegerField(verbose_name="배정액 (원)")),
+                (
+                    "allocated_on",
+                    models.DateField(
+                        default=django.utils.timezone.localdate, verbose_name="배정일"
+                    ),
+                ),
+                (
+                    "club",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="budget_allocations",
+                        to="clubs.club",
+                        verbose_name="동아리",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "예산 배정",
+                "verbose_name_plural": "예산 배정",
+                "ordering": ["-allocated_on", "-id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="SpendRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "category",
+                    models.CharField(blank=True, max_length=50, verbose_name="지출 분류"),
+                ),
+                ("month", models.DateField(verbose_name="월 (1일)")),
+                ("count", models.IntegerField(default=0, verbose_name="건수")),
+                ("amount", models.BigIntegerField(default=0, verbose_name="금액 합계 (원)")),
+                (
+                    "tax_amount",
+                    models.BigIntegerField(default=0, verbose_name="부가세 합계 (원)"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "club",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="spend_rollups",
+                        to="clubs.club",
+                        verbose_name="동아리",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "월별 지출 집계",
+                "verbose_name_plural": "월별 지출 집계",
+                "ordering": ["club", "-month", "category"],
+                "unique_together": {("club", "category", "month")},
+            },
+        ),
+        migrations.RunPython(populate_spend_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,111 @@
+from django.db import models
+from django.utils import timezone
+
+from apps.core.models import BaseModel
+
+
+class ExpenseLine(BaseModel):
+    """
+    사업비 정산용 지출 내역 — 영수증 OCR 결과(UploadedFile.ocr_result)를 정규화한 행.
+
+    영수증 파일 하나당 한 행. OCR이 완료되면 apps.settlements.services가 채우고,
+    기존 파일은 backfill_expenses 커맨드로 채운다.
+    is_active는 원본 파일의 활성 여부를 따라간다 (소프트 삭제 시 집계에서 제외).
+    """
+
+    club = models.ForeignKey(
+        "clubs.Club",
+        on_delete=models.CASCADE,
+        related_name="expense_lines",
+        verbose_name="동아리",
+    )
+    source_file = models.OneToOneField(
+        "files.UploadedFile",
+        on_delete=models.CASCADE,
+        related_name="expense_line",
+        verbose_name="원본 영수증",
+    )
+    vendor = models.CharField("거래처", max_length=100, blank=True)
+    spent_on = models.DateField("사용일")
+    amount = models.PositiveBigIntegerField("금액 (원, 부가세 포함)")
+    tax_amount = models.PositiveBigIntegerField("부가세 (원)", default=0)
+    category = models.CharField("지출 분류", max_length=50, blank=True)
+
+    class Meta:
+        verbose_name = "지출 내역"
+        verbose_name_plural = "지출 내역"
+        ordering = ["-spent_on", "-id"]
+        # 정산 집계 접근 경로: 동아리 + 기간(사용일) 범위, 분류별 합계
+        indexes = [
+            models.Index(
+                fields=["club", "spent_on"],
+                condition=models.Q(is_active=True),
+                name="expense_club_spent_idx",
+            ),
+            models.Index(
+                fields=["club", "category", "spent_on"],
+                condition=models.Q(is_active=True),
+                name="expense_club_cat_spent_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.vendor or '-'} {self.amount:,}원 ({self.spent_on})"
+
+
+class BudgetAllocation(BaseModel):
+    """
+    동아리 사업비 배정 내역 — 동아리 예산은 활성 배정액의 합계.
+
+    (1차/2차 지급, 추가 배정 등을 행으로 쌓고, 취소는 소프트 삭제)
+    """
+
+    club = models.ForeignKey(
+        "clubs.Club",
+        on_delete=models.CASCADE,
+        related_name="budget_allocations",
+        verbose_name="동아리",
+    )
+    title = models.CharField("배정명", max_length=100)
+    amount = models.PositiveBigIntegerField("배정액 (원)")
+    allocated_on = models.DateField("배정일", default=timezone.localdate)
+
+    class Meta:
+        verbose_name = "예산 배정"
+        verbose_name_plural = "예산 배정"
+        ordering = ["-allocated_on", "-id"]
+
+    def __str__(self):
+        return f"{self.title} {self.amount:,}원"
+
+
+class SpendRollup(models.Model):
+    """
+    (동아리, 지출 분류, 월) 단위 지출 합계 — 활성 ExpenseLine의 구체화된 집계.
+
+    읽을 때 다시 계산하지 않고, 지출 내역이 추가/갱신/소프트 삭제/삭제될 때
+    apps.settlements.rollups가 차이(delta)만큼 F() UPDATE로 증감한다.
+    불일치는 reconcile_rollups 커맨드로 원본 행에서 다시 계산해 보정.
+    """
+
+    club = models.ForeignKey(
+        "clubs.Club",
+        on_delete=models.CASCADE,
+        related_name="spend_rollups",
+        verbose_name="동아리",
+    )
+    category = models.CharField("지출 분류", max_length=50, blank=True)
+    month = models.DateField("월 (1일)")
+    count = models.IntegerField("건수", default=0)
+    amount = models.BigIntegerField("금액 합계 (원)", default=0)
+    tax_amount = models.BigIntegerField("부가세 합계 (원)", default=0)
+    updated_at = models.DateTimeField("수정일시", auto_now=True)
+
+    class Meta:
+        verbose_name = "월별 지출 집계"
+        verbose_name_plural = "월별 지출 집계"
+        unique_together = ("club", "category", "month")
+        ordering = ["club", "-month", "category"]
+
+    def __str__(self):
+        return f"{self.club_id} {self.month:%Y-%m} {self.category or '-'}: {self.amount:,}원"
@@ -0,0 +1,100 @@
+"""
+지출 집계(SpendRollup) 증분 갱신과 동아리 예산 조회.
+
+활성 ExpenseLine 하나는 (동아리, 분류, 월) 집계 행에 (건수 1, 금액, 부가세)만큼 기여한다.
+지출 내역이 바뀔 때마다 이전 기여를 빼고 새 기여를 더한 차이만 반영하므로
+읽기 쪽은 집계 행(또는 그 합)만 읽으면 된다.
+
+- 추가/재처리: services.sync_expense_lines
+- 소프트 삭제/복구: signals.file_active_changed
+- 실제 삭제 (CASCADE 포함): signals.expense_line_deleted
+"""
+from collections import defaultdict
+
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from apps.clubs.cache import bump_club_versions
+from apps.settlements.models import BudgetAllocation, ExpenseLine, SpendRollup
+
+
+def rollup_key(line):
+    """지출 내역이 기여하는 집계 행 키 (club_id, category, month)."""
+    return (line.club_id, line.category, line.spent_on.replace(day=1))
+
+
+def line_deltas(lines, sign=1):
+    """지출 내역들의 집계 기여분 {키: [건수, 금액, 부가세]} (sign=-1이면 차감)."""
+    deltas = defaultdict(lambda: [0, 0, 0])
+    add_deltas(deltas, lines, sign)
+    return deltas
+
+
+def add_deltas(deltas, lines, sign=1):
+    for line in lines:
+        delta = deltas[rollup_key(line)]
+        delta[0] += sign
+        delta[1] += sign * line.amount
+        delta[2] += sign * line.tax_amount
+
+
+def apply_deltas(deltas):
+    """
+    집계 행에 차이를 F() UPDATE로 반영 (동시 갱신 간 경합 없음).
+
+    늘어나는 키만 빈 행을 먼저 만든다 (ignore_conflicts). 줄어드는 키는 행이 이미
+    있어야 하므로 만들지 않는다 — 동아리 CASCADE 삭제 중에도 안전.
+    키 순서로 갱신해 워커 간 교착을 피한다.
+    지출 합계가 바뀌므로 해당 동아리의 상세 응답 캐시도 무효화한다.
+    """
+    changed = {key: delta for key, delta in deltas.items() if any(delta)}
+    if not changed:
+        return
+    SpendRollup.objects.bulk_create(
+        [
+            SpendRollup(club_id=club_id, category=category, month=month)
+            for (club_id, category, month), delta in changed.items()
+            if delta[0] > 0
+        ],
+        ignore_conflicts=True,
+    )
+    for (club_id, category, month), (count, amount, tax) in sorted(changed.items()):
+        SpendRollup.objects.filter(
+            club_id=club_id, category=category, month=month
+        ).update(
+            count=F("count") + count,
+            amount=F("amount") + amount,
+            tax_amount=F("tax_amount") + tax,
+        )
+    bump_club_versions(*{club_id for club_id, _category, _month in changed})
+
+
+def active_lines(**filters):
+    """집계 기여 계산에 필요한 필드만 읽은 활성 지출 내역."""
+    return ExpenseLine.objects.filter(**filters).only(
+        "club_id", "category", "spent_on", "amount", "tax_amount"
+    )
+
+
+def _club_total(queryset, field):
+    totals = (
+        queryset.filter(club=OuterRef("pk"))
+        .order_by()
+        .values("club")
+        .annotate(total=Sum(field))
+        .values("total")
+    )
+    return Subquery(totals)
+
+
+def with_budget(queryset):
+    """
+    Club 쿼리셋에 budget_total / spent_total 주석 추가 (상관 서브쿼리, 추가 쿼리 없음).
+
+    budget_total: 활성 배정액 합계 (배정이 없으면 None)
+    spent_total: 집계 행 합계 — 동아리당 (분류 × 월) 행만 읽음
+    """
+    return queryset.annotate(
+        budget_total=_club_total(BudgetAllocation.objects.all(), "amount"),
+        spent_total=Coalesce(_club_total(SpendRollup.objects.all(), "amount"), 0),
+    )
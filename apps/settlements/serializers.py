@@ -0,0 +1,83 @@
+from rest_framework import serializers
+
+from apps.settlements.models import BudgetAllocation, ExpenseLine
+
+
+# ──────────────────────────────────────────────
+# 지출 내역 (읽기 전용)
+# { id, fileId, vendor, spentOn, amount, taxAmount, category }
+# ──────────────────────────────────────────────
+class ExpenseLineSerializer(serializers.ModelSerializer):
+    fileId = serializers.IntegerField(source="source_file_id", read_only=True)
+    spentOn = serializers.DateField(source="spent_on", read_only=True)
+    taxAmount = serializers.IntegerField(source="tax_amount", read_only=True)
+
+    class Meta:
+        model = ExpenseLine
+        fields = [
+            "id",
+            "fileId",
+            "vendor",
+            "spentOn",
+            "amount",
+            "taxAmount",
+            "category",
+        ]
+
+
+# ──────────────────────────────────────────────
+# 예산 배정
+# { id, title, amount, allocatedOn, createdAt }
+# ──────────────────────────────────────────────
+class BudgetAllocationSerializer(serializers.ModelSerializer):
+    allocatedOn = serializers.DateField(source="allocated_on", required=False)
+    createdAt = serializers.DateTimeField(source="created_at", read_only=True)
+
+    class Meta:
+        model = BudgetAllocation
+        fields = ["id", "title", "amount", "allocatedOn", "createdAt"]
+
+
+# ──────────────────────────────────────────────
+# 조회 조건 (query params)
+# ──────────────────────────────────────────────
+class ExpenseQuerySerializer(serializers.Serializer):
+    """
+    지출 내역 / 집계 조회 조건.
+
+    - start / end: 사용일 범위 (YYYY-MM-DD, 양 끝 포함, 선택)
+    - category: 지출 분류 (선택)
+    """
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    category = serializers.CharField(required=False, max_length=50)
+
+    def validate(self, attrs):
+        start, end = attrs.get("start"), attrs.get("end")
+        if start and end and start > end:
+            raise serializers.ValidationError("start는 end보다 늦을 수 없습니다.")
+        return attrs
+
+
+class ExpenseSummaryQuerySerializer(ExpenseQuerySerializer):
+    """집계 조회 조건 — groupBy: month(기본) / category / vendor."""
+
+    groupBy = serializers.ChoiceField(
+        choices=["month", "category", "vendor"], default="month"
+    )
+
+
+class ExpenseGroupSerializer(serializers.Serializer):
+    key = serializers.CharField()
+    count = serializers.IntegerField()
+    totalAmount = serializers.IntegerField()
+    taxAmount = serializers.IntegerField()
+
+
+class ExpenseSummarySerializer(serializers.Serializer):
+    groupBy = serializers.CharField()
+    count = serializers.IntegerField()
+    totalAmount = serializers.IntegerField()
+    taxAmount = serializers.IntegerField()
+    groups = ExpenseGroupSerializer(many=True)
@@ -0,0 +1,96 @@
+"""
+영수증 OCR 결과 → 지출 내역(ExpenseLine) 변환.
+
+OCR 엔진 결과 JSON에서 정산에 필요한 필드만 꺼내 정규화 테이블에 저장한다.
+집계는 항상 이 테이블에서 GROUP BY 한 번으로 처리하고 JSON은 다시 읽지 않는다.
+"""
+from datetime import date
+
+from django.db import transaction
+
+from apps.settlements.models import ExpenseLine
+from apps.settlements.rollups import active_lines, add_deltas, apply_deltas, line_deltas
+
+# ExpenseLine에 반영하는 필드 (재처리 시 덮어씀)
+LINE_FIELDS = [
+    "club",
+    "vendor",
+    "spent_on",
+    "amount",
+    "tax_amount",
+    "category",
+    "is_active",
+    "updated_at",
+]
+
+
+def parse_expense(result):
+    """
+    OCR 결과에서 지출 필드 추출.
+
+    Returns:
+        ExpenseLine 필드 dict, 금액/날짜를 읽을 수 없으면 None
+    """
+    if not isinstance(result, dict):
+        return None
+    try:
+        amount = int(result["totalAmount"])
+        tax_amount = int(result.get("taxAmount") or 0)
+        spent_on = date.fromisoformat(str(result["date"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+    if amount < 0 or tax_amount < 0:
+        return None
+    return {
+        "vendor": str(result.get("vendor") or "")[:100],
+        "spent_on": spent_on,
+        "amount": amount,
+        "tax_amount": tax_amount,
+        "category": str(result.get("category") or "")[:50],
+    }
+
+
+def sync_expense_lines(files):
+    """
+    파일들의 ocr_result로 지출 내역을 만들거나 갱신 (upsert 한 번).
+
+    동아리가 없는 파일은 건너뛰고, 결과를 읽을 수 없게 된 파일의 기존 행은 삭제한다.
+    월별 지출 집계는 기존 행의 기여를 빼고 새 행의 기여를 더해 함께 갱신.
+
+    Returns:
+        저장한 행 수
+    """
+    lines, unparsed = [], []
+    for obj in files:
+        if obj.club_id is None:
+            continue
+        fields = parse_expense(obj.ocr_result)
+        if fields is None:
+            unparsed.append(obj.pk)
+            continue
+        lines.append(
+            ExpenseLine(
+                club_id=obj.club_id,
+                source_file_id=obj.pk,
+                is_active=obj.is_active,
+                **fields,
+            )
+        )
+
+    with transaction.atomic():
+        # 삭제되는 행의 집계 차감은 post_delete 시그널이 처리
+        if unparsed:
+            ExpenseLine.all_objects.filter(source_file_id__in=unparsed).delete()
+        deltas = line_deltas(
+            active_lines(source_file_id__in=[line.source_file_id for line in lines]),
+            sign=-1,
+        )
+        ExpenseLine.all_objects.bulk_create(
+            lines,
+            update_conflicts=True,
+            unique_fields=["source_file"],
+            update_fields=LINE_FIELDS,
+        )
+        add_deltas(deltas, [line for line in lines if line.is_active])
+        apply_deltas(deltas)
+    return len(lines)
@@ -0,0 +1,53 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.clubs.cache import bump_club_versions
+from apps.files.models import UploadedFile
+from apps.files.signals import ocr_completed
+from apps.settlements.models import BudgetAllocation, ExpenseLine
+from apps.settlements.rollups import apply_deltas, line_deltas
+from apps.settlements.services import sync_expense_lines
+
+
+@receiver(ocr_completed, sender=UploadedFile, dispatch_uid="settlements_ocr_completed")
+def ocr_completed_handler(sender, files, **kwargs):
+    """OCR이 끝난 영수증의 지출 내역 생성/갱신."""
+    sync_expense_lines(files)
+
+
+@receiver(post_save, sender=UploadedFile, dispatch_uid="settlements_file_saved")
+def file_active_changed(sender, instance, created, update_fields=None, **kwargs):
+    """파일 소프트 삭제/복구 시 지출 내역의 is_active와 월별 집계도 맞춤."""
+    if created:
+        return
+    if update_fields is not None and "is_active" not in update_fields:
+        return
+    with transaction.atomic():
+        changed = list(
+            ExpenseLine.all_objects.select_for_update()
+            .filter(source_file_id=instance.pk)
+            .exclude(is_active=instance.is_active)
+        )
+        if not changed:
+            return
+        ExpenseLine.all_objects.filter(pk__in=[line.pk for line in changed]).update(
+            is_active=instance.is_active
+        )
+        apply_deltas(line_deltas(changed, sign=1 if instance.is_active else -1))
+
+
+@receiver(post_delete, sender=ExpenseLine, dispatch_uid="settlements_expense_deleted")
+def expense_line_deleted(sender, instance, **kwargs):
+    """활성 지출 내역이 실제 삭제되면 (원본 파일 CASCADE 포함) 집계에서 차감."""
+    if instance.is_active:
+        apply_deltas(line_deltas([instance], sign=-1))
+
+
+@receiver(post_save, sender=BudgetAllocation, dispatch_uid="settlements_budget_saved")
+@receiver(
+    post_delete, sender=BudgetAllocation, dispatch_uid="settlements_budget_deleted"
+)
+def budget_changed(sender, instance, **kwargs):
+    """예산 배정이 바뀌면 동아리 상세(budget / remainingBudget) 응답 캐시 무효화."""
+    bump_club_versions(instance.club_id)
@@ -0,0 +1,26 @@
+from django.urls import path
+
+from apps.settlements.views import (
+    ClubBudgetListCreateView,
+    ClubExpenseListView,
+    ClubExpenseSummaryView,
+)
+
+# /api/clubs/ 아래에 동아리 단위 정산 엔드포인트를 연결
+urlpatterns = [
+    path(
+        "<int:pk>/budgets/",
+        ClubBudgetListCreateView.as_view(),
+        name="club-budget-list",
+    ),
+    path(
+        "<int:pk>/expenses/",
+        ClubExpenseListView.as_view(),
+        name="club-expense-list",
+    ),
+    path(
+        "<int:pk>/expenses/summary/",
+        ClubExpenseSummaryView.as_view(),
+        name="club-expense-summary",
+    ),
+]
@@ -0,0 +1,188 @@
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.clubs.models import Club
+from apps.core.pagination import CustomPageNumberPagination
+from apps.core.permissions import IsAdmin, IsClubMember
+from apps.settlements.models import ExpenseLine
+from apps.settlements.serializers import (
+    BudgetAllocationSerializer,
+    ExpenseLineSerializer,
+    ExpenseQuerySerializer,
+    ExpenseSummaryQuerySerializer,
+    ExpenseSummarySerializer,
+)
+
+QUERY_PARAMETERS = [
+    OpenApiParameter("start", str, description="사용일 시작 (YYYY-MM-DD, 포함)"),
+    OpenApiParameter("end", str, description="사용일 끝 (YYYY-MM-DD, 포함)"),
+    OpenApiParameter("category", str, description="지출 분류로 필터"),
+]
+
+
+def get_club(pk):
+    try:
+        return Club.objects.get(pk=pk)
+    except Club.DoesNotExist:
+        raise NotFound("존재하지 않는 동아리입니다.")
+
+
+def filter_expenses(club, params):
+    """동아리의 활성 지출 내역에 조회 조건 적용 (expense_club_*_idx 인덱스 경로)."""
+    queryset = ExpenseLine.objects.filter(club=club)
+    if "start" in params:
+        queryset = queryset.filter(spent_on__gte=params["start"])
+    if "end" in params:
+        queryset = queryset.filter(spent_on__lte=params["end"])
+    if "category" in params:
+        queryset = queryset.filter(category=params["category"])
+    return queryset
+
+
+# ──────────────────────────────────────────────
+# 예산 배정 목록 / 추가
+# ──────────────────────────────────────────────
+class ClubBudgetListCreateView(APIView):
+    """
+    GET  /api/clubs/{pk}/budgets/ → 예산 배정 내역
+    POST /api/clubs/{pk}/budgets/ → 예산 배정 추가 (Admin)
+
+    동아리 예산(budget)과 잔액(remainingBudget)은 동아리 상세 응답에 포함된다.
+    """
+
+    def get_permissions(self):
+        if self.request.method == "POST":
+            return [IsAdmin()]
+        return [IsClubMember()]
+
+    @extend_schema(
+        responses={200: BudgetAllocationSerializer(many=True)},
+        summary="동아리 예산 배정 내역",
+    )
+    def get(self, request, pk):
+        club = get_club(pk)
+        allocations = club.budget_allocations.all()
+        return Response(BudgetAllocationSerializer(allocations, many=True).data)
+
+    @extend_schema(
+        request=BudgetAllocationSerializer,
+        responses={201: BudgetAllocationSerializer},
+        summary="동아리 예산 배정 추가",
+    )
+    def post(self, request, pk):
+        club = get_club(pk)
+        serializer = BudgetAllocationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(club=club)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+# ──────────────────────────────────────────────
+# 지출 내역 목록
+# ──────────────────────────────────────────────
+class ClubExpenseListView(APIView):
+    """GET /api/clubs/{pk}/expenses/ — 동아리 지출 내역 (사용일 역순, 페이지네이션)."""
+
+    permission_classes = [IsClubMember]
+
+    @extend_schema(
+        parameters=QUERY_PARAMETERS
+        + [
+            OpenApiParameter("page", int, description="페이지 번호 (1-based)"),
+            OpenApiParameter("size", int, description="페이지당 항목 수"),
+        ],
+        responses={200: ExpenseLineSerializer(many=True)},
+        summary="동아리 지출 내역",
+    )
+    def get(self, request, pk):
+        club = get_club(pk)
+        params = ExpenseQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        queryset = filter_expenses(club, params.validated_data).order_by(
+            "-spent_on", "-id"
+        )
+        paginator = CustomPageNumberPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        return paginator.get_paginated_response(
+            ExpenseLineSerializer(page, many=True).data
+        )
+
+
+# ──────────────────────────────────────────────
+# 지출 집계 (정산)
+# ──────────────────────────────────────────────
+class ClubExpenseSummaryView(APIView):
+    """
+    GET /api/clubs/{pk}/expenses/summary/ — 월별 / 분류별 / 거래처별 지출 합계.
+
+    GROUP BY 쿼리 한 번으로 그룹별 합계를 구하고, 전체 합계는 그룹 합으로 계산한다.
+    """
+
+    permission_classes = [IsClubMember]
+
+    # groupBy → GROUP BY 식
+    GROUP_EXPRESSIONS = {
+        "month": TruncMonth("spent_on"),
+        "category": F("category"),
+        "vendor": F("vendor"),
+    }
+
+    @extend_schema(
+        parameters=QUERY_PARAMETERS
+        + [
+            OpenApiParameter(
+                "groupBy",
+                str,
+                enum=["month", "category", "vendor"],
+                description="집계 기준 (기본 month)",
+            ),
+        ],
+        responses={200: ExpenseSummarySerializer},
+        summary="동아리 지출 집계",
+    )
+    def get(self, request, pk):
+        club = get_club(pk)
+        params = ExpenseSummaryQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        group_by = params.validated_data["groupBy"]
+
+        rows = (
+            filter_expenses(club, params.validated_data)
+            .annotate(group_key=self.GROUP_EXPRESSIONS[group_by])
+            .order_by("group_key")
+            .values("group_key")
+            .annotate(
+                count=Count("pk"),
+                total_amount=Sum("amount"),
+                tax_amount=Sum("tax_amount"),
+            )
+        )
+        groups = [
+            {
+                "key": self._format_key(group_by, row["group_key"]),
+                "count": row["count"],
+                "totalAmount": row["total_amount"],
+                "taxAmount": row["tax_amount"],
+            }
+            for row in rows
+        ]
+        summary = {
+            "groupBy": group_by,
+            "count": sum(group["count"] for group in groups),
+            "totalAmount": sum(group["totalAmount"] for group in groups),
+            "taxAmount": sum(group["taxAmount"] for group in groups),
+            "groups": groups,
+        }
+        return Response(ExpenseSummarySerializer(summary).data)
+
+    @staticmethod
+    def _format_key(group_by, value):
+        if group_by == "month":
+            return value.strftime("%Y-%m")
+        return value
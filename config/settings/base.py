@@ -20,6 +20,19 @@ env = environ.Env(
     JWT_ACCESS_TOKEN_LIFETIME_MINUTES=(int, 30),
     JWT_REFRESH_TOKEN_LIFETIME_DAYS=(int, 7),
     MAX_UPLOAD_SIZE_MB=(int, 10),
+    MAX_UPLOAD_REQUEST_SIZE_MB=(int, 100),
+    MAX_UPLOAD_FILES=(int, 50),
+    FILES_PRESIGN_EXPIRES_SECONDS=(int, 900),
+    FILE_UPLOAD_WORKERS=(int, 8),
+    RESUMABLE_UPLOAD_MAX_SIZE_MB=(int, 500),
+    RESUMABLE_UPLOAD_CHUNK_SIZE_MB=(int, 8),
+    RESUMABLE_UPLOAD_EXPIRE_HOURS=(int, 24),
+    OCR_ENGINE=(str, "apps.files.ocr_engines.StubOcrEngine"),
+    OCR_BATCH_SIZE=(int, 10),
+    OCR_WORKERS=(int, 4),
+    OCR_MAX_ATTEMPTS=(int, 5),
+    PAGINATION_EXACT_COUNT_THRESHOLD=(int, 10000),
+    PAGINATION_COUNT_CACHE_TTL_SECONDS=(int, 60),
 )
 
 # .env 파일 로드
@@ -59,6 +72,7 @@ LOCAL_APPS = [
     "apps.accounts",
     "apps.clubs",
     "apps.files",
+    "apps.settlements",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -131,12 +145,22 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# ──────────────────────────────────────────────
+# 캐시 — 개발은 로컬 메모리 (docker.py에서 교체 가능)
+# ──────────────────────────────────────────────
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "club-backend",
+    }
+}
+
 # ──────────────────────────────────────────────
 # Django REST Framework
 # ──────────────────────────────────────────────
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.ClaimsJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -145,7 +169,7 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 20,
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.SearchFilter",
+        "apps.core.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
     "EXCEPTION_HANDLER": "apps.core.exceptions.custom_exception_handler",
@@ -172,6 +196,27 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": False,
 }
 
+# 권한 버전 / 사용자별 권한 정보 캐시 TTL (초) — apps.accounts.authz
+AUTHZ_VERSION_CACHE_TTL = 300
+AUTHZ_CACHE_TTL = 600
+
+# 동아리 상세 응답에 포함하는 멤버 수 (기본 / ?members= 최대값) — 전체 목록은 멤버 API
+CLUB_DETAIL_MEMBERS = 20
+CLUB_DETAIL_MEMBERS_MAX = 100
+
+# 동아리 목록/상세 응답 캐시 TTL / 재생성 잠금 만료 / 잠금을 못 잡은 요청의 대기 상한 (초)
+# — apps.clubs.cache. 대기 중에는 sync 워커가 묶이므로 대기 상한은 짧게 둔다.
+CLUB_CACHE_TTL = 300
+CLUB_CACHE_LOCK_TIMEOUT = 5
+CLUB_CACHE_WAIT_TIMEOUT = 0.3
+
+# 변경분 동기화(/api/sync/)에서 최근 N초 이내 변경은 다음 동기화로 미룸 — apps.core.sync
+SYNC_SETTLE_SECONDS = 2
+
+# 사용자 검색(멤버 추가 자동완성) 결과 캐시 TTL (초) / 최대 결과 수 — apps.accounts.search
+USER_SEARCH_CACHE_TTL = 30
+USER_SEARCH_MAX_LIMIT = 20
+
 # ──────────────────────────────────────────────
 # CORS
 # ──────────────────────────────────────────────
@@ -192,4 +237,37 @@ SPECTACULAR_SETTINGS = {
 # ──────────────────────────────────────────────
 # 파일 업로드 제한
 # ──────────────────────────────────────────────
-MAX_UPLOAD_SIZE = env("MAX_UPLOAD_SIZE_MB") * 1024 * 1024  # MB → bytes
+MAX_UPLOAD_SIZE = env("MAX_UPLOAD_SIZE_MB") * 1024 * 1024  # MB → bytes (파일 1개)
+# 요청 1건 전체 (nginx client_max_body_size와 맞출 것)
+MAX_UPLOAD_REQUEST_SIZE = env("MAX_UPLOAD_REQUEST_SIZE_MB") * 1024 * 1024
+# 요청 1건당 파일 수 (학기말 영수증 일괄 등록 — 30~50장 배치)
+MAX_UPLOAD_FILES = env("MAX_UPLOAD_FILES")
+# 다중 파일 업로드 시 스토리지 쓰기 병렬 스레드 수 (프로세스당)
+FILE_UPLOAD_WORKERS = env("FILE_UPLOAD_WORKERS")
+# presigned 직접 업로드 URL 유효 시간 (초)
+FILES_PRESIGN_EXPIRES = env("FILES_PRESIGN_EXPIRES_SECONDS")
+# 재개 가능한 청크 업로드 (/api/files/uploads/)
+RESUMABLE_UPLOAD_MAX_SIZE = env("RESUMABLE_UPLOAD_MAX_SIZE_MB") * 1024 * 1024
+# 청크 1개 최대 크기 (nginx client_max_body_size보다 작고, S3 파트 최소 크기 5MB 이상)
+RESUMABLE_UPLOAD_CHUNK_SIZE = env("RESUMABLE_UPLOAD_CHUNK_SIZE_MB") * 1024 * 1024
+# 마지막 청크 이후 이 시간이 지난 미완료 세션은 cleanup_upload_sessions가 삭제
+RESUMABLE_UPLOAD_EXPIRE_HOURS = env("RESUMABLE_UPLOAD_EXPIRE_HOURS")
+
+# ──────────────────────────────────────────────
+# 영수증 OCR (apps.files.ocr, process_ocr 워커)
+# ──────────────────────────────────────────────
+OCR_ENGINE = env("OCR_ENGINE")  # 엔진 클래스 경로 (기본: 오프라인 스텁)
+OCR_BATCH_SIZE = env("OCR_BATCH_SIZE")
+OCR_WORKERS = env("OCR_WORKERS")
+OCR_MAX_ATTEMPTS = env("OCR_MAX_ATTEMPTS")  # 이 횟수만큼 실패하면 FAILED
+OCR_RETRY_BACKOFF_SECONDS = 30  # 재시도 대기: 30s, 60s, 120s ... (상한까지)
+OCR_RETRY_BACKOFF_MAX_SECONDS = 30 * 60
+OCR_LEASE_SECONDS = 5 * 60  # RUNNING 작업이 이 시간 안에 끝나지 않으면 다시 가져감
+OCR_POLL_INTERVAL_SECONDS = 5
+
+# ──────────────────────────────────────────────
+# 페이지네이션 전체 건수 (apps.core.counting)
+# ──────────────────────────────────────────────
+# 이 건수 이하는 정확한 COUNT, 초과하면 근사값 (PostgreSQL 플래너 추정 / 캐시)
+PAGINATION_EXACT_COUNT_THRESHOLD = env("PAGINATION_EXACT_COUNT_THRESHOLD")
+PAGINATION_COUNT_CACHE_TTL = env("PAGINATION_COUNT_CACHE_TTL_SECONDS")
@@ -42,12 +42,25 @@ AWS_S3_FILE_OVERWRITE = False
 AWS_DEFAULT_ACL = None
 AWS_QUERYSTRING_AUTH = False
 AWS_S3_URL_PROTOCOL = "http:"
+# presigned 업로드 URL 서명용 외부 엔드포인트 (브라우저가 접근하는 MinIO 주소)
+AWS_S3_PRESIGN_ENDPOINT_URL = env(  # noqa: F405
+    "MINIO_PUBLIC_ENDPOINT_URL", default="http://localhost:9000"
+)
 
 # ──────────────────────────────────────────────
-# Redis (Phase 3 Celery 대비)
+# Redis — 캐시 (Phase 3 Celery 대비)
 # ──────────────────────────────────────────────
 REDIS_URL = env("REDIS_URL", default="redis://redis:6379/0")  # noqa: F405
 
+# 워커 프로세스 간 공유 캐시 (권한 캐시 무효화가 모든 워커에 반영되어야 함)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+        "KEY_PREFIX": "club",
+    }
+}
+
 # Phase 3: Celery 설정 활성화
 # CELERY_BROKER_URL = REDIS_URL
 # CELERY_RESULT_BACKEND = REDIS_URL
@@ -15,7 +15,12 @@ urlpatterns = [
     # API
     path("api/accounts/", include("apps.accounts.urls")),
     path("api/clubs/", include("apps.clubs.urls")),
+    path("api/clubs/", include("apps.settlements.urls")),
     path("api/files/", include("apps.files.urls")),
+    path("api/metrics/", include("apps.core.urls")),
+    # 변경분 동기화 (?since=)
+    path("api/sync/", include("apps.clubs.sync_urls")),
+    path("api/sync/", include("apps.files.sync_urls")),
     # Swagger / OpenAPI
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(